@@ -0,0 +1 @@
+"""Computation engines behind the E-commerce Analytics Pro dashboard."""
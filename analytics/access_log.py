@@ -0,0 +1,141 @@
+"""Access log of the filter states pages are viewed with, for warming the popular ones.
+
+Pages record the filter state they render (the dashboard's channel and date
+range, the Data Explorer's selections) as one JSON line per view. States
+are normalized first so equivalent views count as one: "no filter" choices
+and the full date range drop out, and a range that ends on the data's last
+day is stored as "the last N days", so "last 3 months" still names the
+same view after new data arrives.
+
+The cache warmer reads the counts, precomputes the views of the ``top(k)``
+states and reports the hit rate: the share of logged views whose results
+are already cached. The log rotates to ``<path>.1`` once it grows past
+``max_bytes``; counts read both files.
+"""
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+from analytics.filters import is_no_filter
+
+logger = logging.getLogger(__name__)
+
+ACCESS_LOG_PATH = os.environ.get('ECOMMERCE_ACCESS_LOG', os.path.join('.cache', 'access.log'))
+ACCESS_LOG_MAX_BYTES = int(float(os.environ.get('ECOMMERCE_ACCESS_LOG_MAX_MB', 8)) * 1024 * 1024)
+WARM_TOP_K = int(os.environ.get('ECOMMERCE_WARM_TOP_K', 20))
+
+
+def _day(value):
+    return pd.Timestamp(value).normalize()
+
+
+@dataclass(frozen=True)
+class ViewState:
+    page: str
+    channel: str = None
+    days: int = None            # the data's last ``days`` days
+    start: str = None           # fixed range, YYYY-MM-DD (inclusive)
+    end: str = None
+    selections: tuple = ()      # sorted (column, value) pairs of the page's other filters
+
+    def filters(self, date_min=None, date_max=None):
+        """Keyword filters (channel, start, end, selections) against data ending on ``date_max``."""
+        start, end = self.start, self.end
+        if self.days is not None and date_max is not None:
+            start = _day(date_max) - pd.Timedelta(days=self.days - 1)
+            if date_min is not None and start <= _day(date_min):
+                start = None
+            start = None if start is None else f"{start:%Y-%m-%d}"
+        return {'channel': self.channel, 'start': start, 'end': end, **dict(self.selections)}
+
+    def describe(self):
+        if self.days is not None:
+            span = f"last {self.days} days"
+        elif self.start is not None or self.end is not None:
+            span = f"{self.start or '…'} to {self.end or '…'}"
+        else:
+            span = "all dates"
+        parts = [self.page, self.channel or "all channels", span]
+        parts += [f"{col}={value}" for col, value in self.selections]
+        return " · ".join(parts)
+
+    @classmethod
+    def from_record(cls, record):
+        return cls(record['page'], record.get('channel'), record.get('days'), record.get('start'),
+                   record.get('end'), tuple(tuple(pair) for pair in record.get('selections') or ()))
+
+
+def normalize_state(page, date_min=None, date_max=None, channel=None, start=None, end=None, **selections):
+    """``ViewState`` of ``page`` shown with these filters, for data spanning ``date_min``..``date_max``."""
+    if is_no_filter(channel):
+        channel = None
+    selections = tuple(sorted((col, value) for col, value in selections.items() if not is_no_filter(value)))
+
+    days = None
+    start = None if start is None else _day(start)
+    end = None if end is None else _day(end)
+    if date_min is not None and date_max is not None:
+        first, last = _day(date_min), _day(date_max)
+        if end is None or end >= last:
+            if start is not None and start > first:
+                days = (last - start).days + 1
+            start = end = None
+        elif start is not None and start <= first:
+            start = None
+    start = None if start is None else f"{start:%Y-%m-%d}"
+    end = None if end is None else f"{end:%Y-%m-%d}"
+    return ViewState(page, channel, days, start, end, selections)
+
+
+def hit_rate(counts, cached):
+    """Share of the views in ``counts`` (state -> views) whose state passes ``cached``; None if empty."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    return sum(n for state, n in counts.items() if cached(state)) / total
+
+
+class AccessLog:
+    def __init__(self, path=ACCESS_LOG_PATH, max_bytes=ACCESS_LOG_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def record(self, state):
+        """Append one view of ``state``. Failures are logged, never raised: a page must not break on it."""
+        line = json.dumps({'at': pd.Timestamp.now().isoformat(timespec='seconds'), **asdict(state)}, default=str)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+                    size = f.tell()
+                if size > self.max_bytes:
+                    os.replace(self.path, self.path + '.1')
+            except OSError as e:
+                logger.warning("could not record view in %s: %s", self.path, e)
+
+    def counts(self):
+        """Counter of ``ViewState`` -> logged views."""
+        counts = Counter()
+        for path in [self.path + '.1', self.path]:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            counts[ViewState.from_record(json.loads(line))] += 1
+                        except (ValueError, TypeError, KeyError):
+                            # A line cut short by a concurrent writer or a crash
+                            continue
+            except FileNotFoundError:
+                continue
+        return counts
+
+    def top(self, k=WARM_TOP_K):
+        """The ``k`` most viewed states, [(state, views)]."""
+        return self.counts().most_common(k)
@@ -0,0 +1,73 @@
+"""Derived aggregates that pages build on demand from a loaded dataset.
+
+Each entry maps a cache name to a builder taking the ``Dataset``; the pages
+and the cache warmer both go through this table, so a warmed cache holds
+exactly what the pages will ask for.
+
+``APPENDERS`` carry an aggregate over to a dataset that only gained
+shards: they fold the added order rows into the previous version's value
+instead of rebuilding it from every row.
+
+``VIEWS`` are the per-filter-state counterparts: builders taking the
+dataset plus a page's filters (channel, start, end and any column
+selections, see ``analytics.access_log.ViewState.filters``). There are too
+many filter states to build or store them all: a page's view is kept in
+memory on first use, and only the most viewed states of ``PAGE_VIEWS`` are
+precomputed and written to disk by the warmer.
+"""
+import hashlib
+
+from analytics.anomalies import build_daily_series
+from analytics.cohorts import build_cohorts
+from analytics.drilldown import build_drill_index
+from analytics.filters import order_rows, select_orders
+from analytics.forecast import build_forecasts
+from analytics.leaderboards import build_leaderboard_index
+from analytics.metrics import dashboard_tables
+from analytics.moments import build_moments
+from analytics.rfm import build_rfm
+from analytics.significance import build_group_stats
+from analytics.whatif import build_channel_history
+
+AGGREGATES = {
+    'cohorts': lambda dataset: build_cohorts(dataset.df, dataset.customers),
+    'rfm': lambda dataset: build_rfm(dataset.df, dataset.customers),
+    'forecasts': lambda dataset: build_forecasts(dataset.df),
+    'daily_series': lambda dataset: build_daily_series(dataset.df),
+    'leaderboards': lambda dataset: build_leaderboard_index(dataset.df, dataset.customers),
+    'moments': lambda dataset: build_moments(dataset.df),
+    'channel_history': lambda dataset: build_channel_history(dataset.df),
+    'drilldown': lambda dataset: build_drill_index(dataset.df),
+}
+
+# name -> (previous version's value, added order rows) -> value
+APPENDERS = {
+    'moments': lambda moments, orders: moments.append(orders),
+}
+
+
+def _rows(dataset, channel=None, start=None, end=None, **selections):
+    return order_rows(dataset.df, start, end, marketing_channel=channel, **selections)
+
+
+VIEWS = {
+    'dashboard_tables': lambda dataset, channel=None, start=None, end=None, **selections: dashboard_tables(
+        select_orders(dataset.df, start, end, marketing_channel=channel, **selections)
+    ),
+    'campaign_stats': lambda dataset, **filters: build_group_stats(
+        dataset.df, 'marketing_campaign', _rows(dataset, **filters), dataset.customers
+    ),
+    'explorer_rows': _rows,
+}
+
+# Page -> the views one visit to it reads
+PAGE_VIEWS = {
+    'dashboard': ['dashboard_tables', 'campaign_stats'],
+    'explorer': ['explorer_rows'],
+}
+
+
+def view_name(name, filters):
+    """Cache name of view ``name`` under ``filters``."""
+    digest = hashlib.sha1(repr(sorted(filters.items())).encode()).hexdigest()[:12]
+    return f"{name}.{digest}"
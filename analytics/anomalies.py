@@ -0,0 +1,166 @@
+"""Robust anomaly scores for many daily series at once.
+
+Orders are scattered into dense (series x day) arrays of revenue, orders
+and returns with one ``np.bincount`` per measure, where a series is one
+combination of the ``by`` columns (channel x region x category by default).
+Each day is then compared with the trailing window before it: the window
+median is the baseline and 1.4826 x the median absolute deviation the
+scale, so a robust z-score of 3.5 plays the role of a 3.5 sigma outlier.
+All series are scored together through a sliding-window view of the array;
+only the requested lookback days are scored, and windows too thin to judge
+(few orders a day) are skipped. Coarser levels (e.g. channel only) are
+summed from the finest arrays rather than rebuilt from the rows.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DEFAULT_BY = ['marketing_channel', 'region', 'category']
+MEASURES = {'net_revenue': 'Net Revenue', 'return_rate': 'Return Rate (%)', 'orders': 'Orders'}
+MAD_SCALE = 1.4826
+# Used instead of MAD when more than half of a window is identical
+MEAN_AD_SCALE = 1.2533
+
+
+def _nanmedian(windows):
+    """Median over the last axis ignoring NaN, via one sort (NaN sorts last)."""
+    ordered = np.sort(windows, axis=-1)
+    n = np.count_nonzero(~np.isnan(windows), axis=-1)
+    lo = np.take_along_axis(ordered, np.maximum((n - 1) // 2, 0)[..., None], axis=-1)[..., 0]
+    hi = np.take_along_axis(ordered, np.minimum(n // 2, windows.shape[-1] - 1)[..., None], axis=-1)[..., 0]
+    return np.where(n > 0, (lo + hi) / 2, np.nan), n
+
+
+class DailySeries:
+    def __init__(self, labels, days, values):
+        self.labels = labels    # one label per series (row)
+        self.days = days        # pd.DatetimeIndex, contiguous days
+        self.values = values    # measure -> (S, D) float array
+
+    @property
+    def shape(self):
+        return len(self.labels), len(self.days)
+
+    def measure(self, name, min_orders=5):
+        """(S, D) values of ``name``; return rate is NaN on days with fewer than ``min_orders`` orders."""
+        if name == 'return_rate':
+            orders = self.values['orders']
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rate = self.values['returned'] / orders * 100
+            return np.where(orders >= min_orders, rate, np.nan)
+        return self.values[name]
+
+    def rollup(self, by):
+        """Series summed up to a subset of the label levels (e.g. channel only)."""
+        if not isinstance(self.labels, pd.MultiIndex) or list(by) == list(self.labels.names):
+            return self
+        codes, labels = self.labels.droplevel(
+            [name for name in self.labels.names if name not in by]
+        ).factorize(sort=True)
+        n_series, n_days = len(labels), len(self.days)
+        cell = (codes[:, None] * n_days + np.arange(n_days)[None, :]).ravel()
+        values = {
+            name: np.bincount(cell, weights=array.ravel(), minlength=n_series * n_days).reshape(n_series, n_days)
+            for name, array in self.values.items()
+        }
+        if len(by) == 1:
+            labels = pd.Index(labels.get_level_values(0), name=by[0])
+        return DailySeries(labels, self.days, values)
+
+    def _windows(self, values, window, lookback):
+        """Trailing windows (S, lookback, window) and the scored days (S, lookback)."""
+        n_series, n_days = values.shape
+        start = n_days - lookback - window
+        if start < 0:
+            values = np.concatenate([np.full((n_series, -start), np.nan), values], axis=1)
+            start = 0
+        segment = values[:, start:]
+        # windows[s, t] = the ``window`` days before scored day t
+        return sliding_window_view(segment[:, :-1], window, axis=1), segment[:, window:]
+
+    def scores(self, name, window=28, lookback=90, min_orders=5):
+        """Robust z-score of each of the last ``lookback`` days against its trailing ``window``.
+
+        Days whose window averages fewer than ``min_orders`` orders a day are
+        not scored. Returns (values, baseline, z), each of shape (S, lookback).
+        """
+        lookback = min(lookback, len(self.days))
+        windows, current = self._windows(self.measure(name, min_orders), window, lookback)
+
+        baseline, n = _nanmedian(windows)
+        deviation = np.abs(windows - baseline[..., None])
+        scale = MAD_SCALE * _nanmedian(deviation)[0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fallback = MEAN_AD_SCALE * np.nansum(deviation, axis=-1) / n
+            scale = np.where(scale > 0, scale, fallback)
+            z = np.where(scale > 0, (current - baseline) / scale, np.nan)
+
+        order_windows, _ = self._windows(self.values['orders'], window, lookback)
+        z[~(np.nan_to_num(order_windows).mean(axis=-1) >= min_orders)] = np.nan
+        return current, baseline, z
+
+    def top_anomalies(self, name, window=28, lookback=90, threshold=3.5, k=50, min_orders=5):
+        """The ``k`` largest |z| cells above ``threshold`` in the lookback, most extreme first."""
+        current, baseline, z = self.scores(name, window, lookback, min_orders)
+        flat = np.nan_to_num(np.abs(z), nan=0.0).ravel()
+        candidates = np.flatnonzero(flat >= threshold)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(flat[candidates], -k)[-k:]]
+        candidates = candidates[np.argsort(flat[candidates])[::-1]]
+        series, day = np.divmod(candidates, z.shape[1])
+
+        days = self.days[len(self.days) - z.shape[1]:]
+        labels = self.labels[series]
+        frame = labels.to_frame(index=False) if isinstance(labels, pd.MultiIndex) else pd.DataFrame({labels.name or 'series': labels})
+        frame['date'] = days[day]
+        frame['value'] = current[series, day]
+        frame['baseline'] = baseline[series, day]
+        frame['z_score'] = z[series, day]
+        frame['direction'] = np.where(frame['z_score'] > 0, 'spike', 'drop')
+        frame['orders'] = self.values['orders'][series, len(self.days) - z.shape[1] + day]
+        frame['series_row'] = series
+        return frame
+
+    def history(self, row, name, days=120, min_orders=5):
+        """Recent daily values of one series."""
+        values = self.measure(name, min_orders)[row, -days:]
+        return pd.DataFrame({'date': self.days[-days:], 'value': values})
+
+
+def build_daily_series(df, by=DEFAULT_BY):
+    """Dense (series x day) arrays of revenue, orders and returns."""
+    by = [col for col in by if col in df.columns]
+    if 'date' not in df.columns or not by:
+        return None
+
+    day = df['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    present = ~np.isnat(day)
+    if not present.any():
+        return None
+    first, last = day[present].min(), day[present].max()
+    n_days = int((last - first).astype(np.int64)) + 1
+
+    grouped = df.loc[present, by].groupby(by, sort=True, observed=True)
+    series = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)  # -1: a missing label
+    labels = grouped.size().index
+    n_series = len(labels)
+
+    keep = series >= 0
+    cell = series[keep] * n_days + (day[present][keep] - first).astype(np.int64)
+    size = n_series * n_days
+
+    def scatter(col=None):
+        if col is None:
+            weights = None
+        else:
+            weights = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            weights = np.nan_to_num(weights[present][keep])
+        return np.bincount(cell, weights=weights, minlength=size).astype(np.float64).reshape(n_series, n_days)
+
+    values = {'orders': scatter()}
+    for col in ['net_revenue', 'returned']:
+        if col in df.columns:
+            values[col] = scatter(col)
+
+    days = pd.DatetimeIndex(np.arange(first, last + 1).astype('datetime64[ns]'))
+    return DailySeries(labels, days, values)
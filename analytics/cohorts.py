@@ -0,0 +1,160 @@
+"""Monthly acquisition cohorts: retention and revenue by months since registration.
+
+Customers are grouped by registration month (cohort) and acquisition
+channel; each order lands at an integer age = order month - cohort month.
+The full channel x cohort x age matrix is filled in one vectorized pass:
+revenue with a single ``np.bincount``, active customers by marking each
+(customer, age) pair once in a dense bitmap and bincounting the marks.
+Per-channel views are then slices of the matrix.
+"""
+import numpy as np
+import pandas as pd
+
+ALL = None
+# Above this many (customer, age) pairs fall back to np.unique instead of a bitmap
+BITMAP_LIMIT = 400_000_000
+
+
+def _month_index(values):
+    return values.astype('datetime64[M]').astype(np.int64)
+
+
+class CohortMatrix:
+    def __init__(self, cohorts, channels, sizes, active, revenue, last_month):
+        self.cohorts = cohorts        # pd.DatetimeIndex of cohort months
+        self.channels = channels      # channel labels; row len(channels) is "all"
+        self.sizes = sizes            # (C + 1, n_cohorts) customers per cohort
+        self.active = active          # (C + 1, n_cohorts, n_ages) distinct active customers
+        self.revenue = revenue        # (C + 1, n_cohorts, n_ages) net revenue
+        self.last_month = last_month  # month index of the newest order
+
+    @property
+    def n_ages(self):
+        return self.active.shape[-1]
+
+    def _row(self, channel):
+        if channel is ALL:
+            return len(self.channels)
+        idx = np.flatnonzero(self.channels == channel)
+        if not len(idx):
+            raise KeyError(channel)
+        return int(idx[0])
+
+    def observable(self):
+        """(n_cohorts, n_ages) mask of ages a cohort has already reached."""
+        cohort_idx = _month_index(self.cohorts.to_numpy())
+        max_age = self.last_month - cohort_idx
+        return np.arange(self.n_ages)[None, :] <= max_age[:, None]
+
+    def _frame(self, values, channel, max_age):
+        row = self._row(channel)
+        keep = self.sizes[row] > 0
+        ages = min(self.n_ages, max_age + 1) if max_age is not None else self.n_ages
+        values = np.where(self.observable(), values, np.nan)[keep, :ages]
+        return pd.DataFrame(
+            values,
+            index=pd.Index(self.cohorts[keep].strftime('%Y-%m'), name='cohort'),
+            columns=pd.Index(np.arange(ages), name='months_since_registration'),
+        )
+
+    def retention(self, channel=ALL, max_age=None):
+        """Share (%) of each cohort that ordered N months after registering."""
+        row = self._row(channel)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = self.active[row] / self.sizes[row][:, None] * 100
+        return self._frame(values, channel, max_age)
+
+    def revenue_per_customer(self, channel=ALL, max_age=None, cumulative=True):
+        """Net revenue per cohort member by age (cumulative by default)."""
+        row = self._row(channel)
+        revenue = np.cumsum(self.revenue[row], axis=1) if cumulative else self.revenue[row]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = revenue / self.sizes[row][:, None]
+        return self._frame(values, channel, max_age)
+
+    def sizes_frame(self, channel=ALL):
+        row = self._row(channel)
+        keep = self.sizes[row] > 0
+        return pd.Series(self.sizes[row][keep], index=self.cohorts[keep].strftime('%Y-%m'), name='customers')
+
+    def curves(self, metric='retention', max_age=None, cumulative=True):
+        """Size-weighted average curve by age for every channel (columns)."""
+        observable = self.observable()
+        ages = min(self.n_ages, max_age + 1) if max_age is not None else self.n_ages
+        curves = {}
+        for row, label in enumerate(list(self.channels) + ['All Channels']):
+            sizes = np.where(observable, self.sizes[row][:, None], 0)[:, :ages]
+            if metric == 'retention':
+                numerator = np.where(observable, self.active[row], 0)[:, :ages]
+                scale = 100.0
+            else:
+                revenue = np.cumsum(self.revenue[row], axis=1) if cumulative else self.revenue[row]
+                numerator = np.where(observable, revenue, 0)[:, :ages]
+                scale = 1.0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                curves[label] = numerator.sum(axis=0) / sizes.sum(axis=0) * scale
+        return pd.DataFrame(curves, index=pd.Index(np.arange(ages), name='months_since_registration'))
+
+
+def build_cohorts(df, customers):
+    """Cohort matrix from date-sorted orders and the customer table."""
+    if customers is None or 'date' not in df.columns:
+        return None
+    table = customers.table
+
+    registered = table['registration_date'] if 'registration_date' in table.columns else table['first_order']
+    registered = registered.fillna(table['first_order']).to_numpy(dtype='datetime64[ns]')
+    cohort_of_customer = _month_index(registered)
+
+    order_month = _month_index(df['date'].to_numpy(dtype='datetime64[ns]'))
+    keys = customers.order_keys
+    age = order_month - cohort_of_customer[keys]
+    valid = (age >= 0) & (keys >= 0)
+    keys, age = keys[valid], age[valid]
+
+    first_cohort = cohort_of_customer.min()
+    last_month = order_month.max()
+    n_cohorts = int(last_month - first_cohort + 1)
+    n_ages = int(age.max() + 1) if len(age) else 1
+    cohort_idx = cohort_of_customer - first_cohort
+
+    if 'acquisition_channel' in table.columns:
+        channel_codes, channels = pd.factorize(table['acquisition_channel'], sort=True)
+        channels = np.asarray(channels, dtype=object)
+        channel_codes = np.where(channel_codes < 0, len(channels), channel_codes)
+        channels = np.append(channels, 'Unknown') if (channel_codes == len(channels)).any() else channels
+    else:
+        channel_codes, channels = np.zeros(len(table), dtype=np.int64), np.array(['All Channels'], dtype=object)
+    n_channels = len(channels)
+    shape = (n_channels, n_cohorts, n_ages)
+    size = int(np.prod(shape))
+
+    # Customers per (channel, cohort)
+    sizes = np.bincount(channel_codes * n_cohorts + cohort_idx, minlength=n_channels * n_cohorts)
+    sizes = sizes.reshape(n_channels, n_cohorts).astype(np.float64)
+
+    # Revenue per (channel, cohort, age): one bincount over the order rows
+    cell_of_customer = channel_codes * n_cohorts + cohort_idx
+    order_cell = cell_of_customer[keys] * n_ages + age
+    if 'net_revenue' in df.columns:
+        net = pd.to_numeric(df['net_revenue'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+    else:
+        net = np.zeros(len(keys))
+    revenue = np.bincount(order_cell, weights=np.nan_to_num(net), minlength=size).reshape(shape)
+
+    # Distinct active customers per (channel, cohort, age)
+    n_customers = len(table)
+    if n_customers * n_ages <= BITMAP_LIMIT:
+        seen = np.zeros(n_customers * n_ages, dtype=bool)
+        seen[keys * n_ages + age] = True
+        pairs = np.flatnonzero(seen)
+    else:
+        pairs = np.unique(keys * n_ages + age)
+    pair_customer, pair_age = np.divmod(pairs, n_ages)
+    active = np.bincount(cell_of_customer[pair_customer] * n_ages + pair_age, minlength=size).reshape(shape)
+
+    def with_total(grid):
+        return np.concatenate([grid, grid.sum(axis=0, keepdims=True)]).astype(np.float64)
+
+    cohorts = pd.DatetimeIndex(np.arange(first_cohort, first_cohort + n_cohorts).astype('datetime64[M]').astype('datetime64[ns]'))
+    return CohortMatrix(cohorts, channels, with_total(sizes), with_total(active), with_total(revenue), last_month)
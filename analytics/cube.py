@@ -0,0 +1,230 @@
+"""Pre-aggregated multi-dimensional store for ad-hoc pivots.
+
+At load the order rows are rolled up once to the finest combination of the
+business dimensions (channel x campaign x category x segment x region x
+month). Every pivot after that is answered from those cells with
+``np.bincount`` over the requested dimensions, never from the raw rows, and
+results are memoized per query.
+
+Only additive measures are stored. Distinct customer counts cannot be
+rolled up across cells and are therefore not offered here.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Independent dimensions that make up a cell
+BASE_DIMENSIONS = [
+    'marketing_channel', 'marketing_campaign', 'category',
+    'customer_segment', 'region', 'month_date'
+]
+# Calendar attributes that are functions of month_date: they add no cells
+TIME_ATTRIBUTES = ['month', 'quarter', 'season']
+
+SUM_MEASURES = ['net_revenue', 'gross_revenue', 'discount_amount', 'final_amount', 'quantity', 'returned']
+
+# Ratio measures derived from the summed ones after aggregation
+DERIVED_MEASURES = {
+    'avg_order_value': (('net_revenue', 'orders'), lambda m: m['net_revenue'] / m['orders']),
+    'return_rate': (('returned', 'orders'), lambda m: m['returned'] / m['orders'] * 100),
+    'roi': (('net_revenue', 'discount_amount'),
+            lambda m: (m['net_revenue'] - m['discount_amount']) / m['discount_amount'] * 100),
+}
+
+DENSE_KEY_LIMIT = 50_000_000
+MISSING_LABEL = 'Unknown'
+
+
+class PivotTooLarge(Exception):
+    """Raised when a pivot would produce more cells than allowed."""
+
+    def __init__(self, cells, max_cells):
+        super().__init__(f"Pivot would have {cells:,} cells (limit {max_cells:,})")
+        self.cells = cells
+        self.max_cells = max_cells
+
+
+def _factorize(series):
+    codes, labels = pd.factorize(series, sort=True)
+    labels = np.asarray(labels, dtype=object)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels = np.append(labels, MISSING_LABEL)
+    return codes.astype(np.int64), labels
+
+
+class Cube:
+    def __init__(self, dimensions, labels, cell_codes, measures, cache_size=128):
+        self.dimensions = dimensions          # dimension names, in cell_codes column order
+        self.labels = labels                  # dim -> array of member labels
+        self.cell_codes = cell_codes          # dim -> int array, one code per cell
+        self.measures = measures              # measure -> float array, one value per cell
+        self.n_cells = len(next(iter(measures.values()))) if measures else 0
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # The query memo and its lock stay with the process
+        state = self.__dict__.copy()
+        del state['_cache'], state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def measure_names(self):
+        names = [m for m in ['orders'] + SUM_MEASURES if m in self.measures]
+        names += [m for m, (needs, _) in DERIVED_MEASURES.items() if all(n in self.measures for n in needs)]
+        return names
+
+    def cardinality(self, dim):
+        return len(self.labels[dim])
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+    def _cell_mask(self, filters):
+        mask = np.ones(self.n_cells, dtype=bool)
+        for dim, members in (filters or {}).items():
+            if dim not in self.labels or members is None:
+                continue
+            wanted = np.isin(self.labels[dim], list(members))
+            mask &= wanted[self.cell_codes[dim]]
+        return mask
+
+    def _components(self, measure):
+        if measure in DERIVED_MEASURES:
+            return DERIVED_MEASURES[measure][0]
+        return (measure,)
+
+    def _totals(self, dim, measure, mask):
+        """Per-member totals of ``measure`` along one dimension."""
+        codes = self.cell_codes[dim][mask]
+        size = self.cardinality(dim)
+        parts = {c: np.bincount(codes, weights=self.measures[c][mask], minlength=size)
+                 for c in self._components(measure)}
+        return self._finish(measure, parts)
+
+    def _finish(self, measure, parts):
+        if measure not in DERIVED_MEASURES:
+            return parts[measure]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = DERIVED_MEASURES[measure][1](parts)
+        return np.where(np.isfinite(values), values, np.nan)
+
+    def pivot(self, rows, columns=(), measure='net_revenue', filters=None,
+              max_cells=5_000, top_n=None):
+        """Aggregate ``measure`` by ``rows`` x ``columns``.
+
+        Raises PivotTooLarge when the result would exceed ``max_cells``
+        cells; pass ``top_n`` to keep only the N largest members of each
+        chosen dimension instead.
+        """
+        rows, columns = list(rows), list(columns)
+        frozen_filters = tuple(sorted((d, tuple(sorted(map(str, m)))) for d, m in (filters or {}).items()
+                                      if m is not None))
+        key = (tuple(rows), tuple(columns), measure, frozen_filters, max_cells, top_n)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._pivot(rows, columns, measure, filters, max_cells, top_n)
+
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _pivot(self, rows, columns, measure, filters, max_cells, top_n):
+        dims = rows + columns
+        if not dims:
+            raise ValueError("Choose at least one dimension")
+        mask = self._cell_mask(filters)
+
+        # Members to keep per dimension (all, or the top-N by the measure)
+        keep = {}
+        for dim in dims:
+            if top_n is not None and self.cardinality(dim) > top_n:
+                totals = self._totals(dim, measure, mask)
+                order = np.argsort(np.nan_to_num(totals, nan=-np.inf))[::-1]
+                keep[dim] = np.sort(order[:top_n])
+            else:
+                keep[dim] = np.arange(self.cardinality(dim))
+
+        cells = int(np.prod([len(keep[d]) for d in dims], dtype=np.float64))
+        if cells > max_cells:
+            raise PivotTooLarge(cells, max_cells)
+
+        # Remap kept members to dense 0..k-1 codes and drop everything else
+        local = []
+        for dim in dims:
+            remap = np.full(self.cardinality(dim), -1, dtype=np.int64)
+            remap[keep[dim]] = np.arange(len(keep[dim]))
+            codes = remap[self.cell_codes[dim]]
+            mask &= codes >= 0
+            local.append(codes)
+        shape = tuple(len(keep[d]) for d in dims)
+        flat = np.ravel_multi_index([c[mask] for c in local], shape) if mask.any() else np.zeros(0, np.int64)
+
+        size = int(np.prod(shape))
+        parts = {c: np.bincount(flat, weights=self.measures[c][mask], minlength=size)
+                 for c in self._components(measure)}
+        counts = np.bincount(flat, minlength=size)
+        values = self._finish(measure, parts)
+
+        index = pd.MultiIndex.from_product([self.labels[d][keep[d]] for d in dims], names=dims)
+        result = pd.Series(values, index=index, name=measure)[counts > 0]
+        if columns:
+            return result.unstack(columns)
+        return result.to_frame()
+
+
+def build_cube(df):
+    """Roll order rows up to the base cells. One O(n) pass per measure."""
+    dims = [d for d in BASE_DIMENSIONS if d in df.columns]
+    attrs = [a for a in TIME_ATTRIBUTES if a in df.columns and 'month_date' in dims]
+    if not dims:
+        return None
+
+    labels = {}
+    row_codes = {}
+    for dim in dims + attrs:
+        row_codes[dim], labels[dim] = _factorize(df[dim])
+
+    shape = tuple(len(labels[d]) for d in dims)
+    key_space = int(np.prod(shape, dtype=np.float64))
+    key = np.ravel_multi_index([row_codes[d] for d in dims], shape) if key_space else np.zeros(len(df), np.int64)
+
+    if key_space <= DENSE_KEY_LIMIT:
+        counts = np.bincount(key, minlength=key_space)
+        occupied = np.flatnonzero(counts)
+        position = np.full(key_space, -1, dtype=np.int64)
+        position[occupied] = np.arange(len(occupied))
+        cell_of_row = position[key]
+        cell_keys = occupied
+    else:
+        cell_keys, cell_of_row = np.unique(key, return_inverse=True)
+    n_cells = len(cell_keys)
+
+    cell_codes = dict(zip(dims, np.unravel_index(cell_keys, shape)))
+    for attr in attrs:
+        # Attributes depend on month_date only, so any row of the cell will do
+        codes = np.empty(n_cells, dtype=np.int64)
+        codes[cell_of_row] = row_codes[attr]
+        cell_codes[attr] = codes
+
+    measures = {'orders': np.bincount(cell_of_row, minlength=n_cells).astype(np.float64)}
+    for m in SUM_MEASURES:
+        if m in df.columns:
+            values = pd.to_numeric(df[m], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            measures[m] = np.bincount(cell_of_row, weights=np.nan_to_num(values, nan=0.0), minlength=n_cells)
+
+    return Cube(dims + attrs, labels, cell_codes, measures)
@@ -0,0 +1,133 @@
+"""Customer dimension table materialized from the orders at load.
+
+Every customer gets an integer surrogate key (0..n-1, in order of first
+purchase when built; customers added later get the next keys) and one row holding first/last order date, order count, net
+revenue, returns and the latest known segment, region and CLV, plus the
+acquisition channel of the first order. ``order_keys`` maps each order row
+to its customer key so per-customer arrays can be indexed directly; orders
+without a customer id are left out of the table and keyed -1.
+
+Customer-level questions are then answered from a table that is
+orders-per-customer times smaller than the order rows, and new orders are
+folded in with ``append`` without rescanning the history.
+"""
+import numpy as np
+import pandas as pd
+
+# Attributes taken from the customer's first / latest order
+FIRST_ORDER_ATTRIBUTES = {'marketing_channel': 'acquisition_channel', 'registration_date': 'registration_date'}
+LATEST_ORDER_ATTRIBUTES = ['customer_segment', 'region', 'customer_lifetime_value', 'retention_score']
+
+
+def _pick(mask, new, old):
+    """``new`` where ``mask``, else ``old``; categoricals may have different categories."""
+    categorical = isinstance(old.dtype, pd.CategoricalDtype) or isinstance(new.dtype, pd.CategoricalDtype)
+    if categorical:
+        new, old = new.astype(object), old.astype(object)
+    values = pd.Series(np.where(mask, new.to_numpy(), old.to_numpy()), index=old.index)
+    return values.astype('category') if categorical else values
+
+
+def _numeric(df, col):
+    if col not in df.columns:
+        return np.zeros(len(df))
+    values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.nan_to_num(values, nan=0.0)
+
+
+class CustomerTable:
+    def __init__(self, table, id_index, order_keys):
+        self.table = table            # one row per customer, index = surrogate key
+        self.id_index = id_index      # pd.Index of original customer_id, position = key
+        self.order_keys = order_keys  # surrogate key of every order row, -1 without a customer id
+
+    def __len__(self):
+        return len(self.table)
+
+    def keys_for(self, customer_ids):
+        """Surrogate keys for original ids (-1 where unknown)."""
+        return self.id_index.get_indexer(customer_ids)
+
+    def append(self, orders):
+        """New table with the date-sorted ``orders`` folded in; ``order_keys`` gains their keys at the end.
+
+        The orders may be older than the history (a late shard): first and
+        last order dates are merged with min / max, and the first- and
+        latest-order attributes follow whichever side holds that order.
+        """
+        ids = orders['customer_id']
+        keys = self.id_index.get_indexer(ids)
+
+        # Unseen customers get the next keys, in order of first appearance
+        unseen = (keys < 0) & ids.notna().to_numpy()
+        new_codes, new_ids = pd.factorize(ids[unseen])
+        keys[unseen] = len(self.id_index) + new_codes
+        id_index = self.id_index.append(pd.Index(np.asarray(new_ids, dtype=object)))
+        n = len(id_index)
+
+        old = self.table
+        table = old.reindex(pd.RangeIndex(n))
+        delta = _aggregate(orders, keys, n)
+
+        for col in ['orders', 'returns']:
+            table[col] = (table[col].fillna(0).to_numpy() + delta[col].to_numpy()).astype(np.int64)
+        table['net_revenue'] = table['net_revenue'].fillna(0.0).to_numpy() + delta['net_revenue'].to_numpy()
+
+        touched = delta['orders'].to_numpy() > 0
+        fresh = np.arange(n) >= len(old)
+        if 'first_order' in delta.columns and 'first_order' in table.columns:
+            # NaT compares False, so customers new to the table are taken explicitly
+            earlier = touched & (fresh | (delta['first_order'].to_numpy() < table['first_order'].to_numpy()))
+            later = touched & (fresh | (delta['last_order'].to_numpy() >= table['last_order'].to_numpy()))
+        else:
+            earlier, later = touched & fresh, touched
+        for col in delta.columns.difference(['orders', 'returns', 'net_revenue']):
+            mask = earlier if col in FIRST_ORDER_ATTRIBUTES.values() or col == 'first_order' else later
+            table[col] = _pick(mask, delta[col], table[col]) if col in table.columns else delta[col].where(mask)
+        table['customer_id'] = id_index.to_numpy()
+
+        return CustomerTable(table, id_index, np.concatenate([self.order_keys, keys.astype(np.int64)]))
+
+
+def _aggregate(df, keys, n):
+    """Per-key aggregates of the order rows ``df`` (keys in 0..n-1; rows keyed -1 are skipped)."""
+    rows = np.flatnonzero(keys >= 0)
+    keys = keys[rows]
+    first_row = np.full(n, len(df), dtype=np.int64)
+    last_row = np.full(n, -1, dtype=np.int64)
+    np.minimum.at(first_row, keys, rows)
+    np.maximum.at(last_row, keys, rows)
+    seen = last_row >= 0
+    first_row, last_row = np.where(seen, first_row, 0), np.where(seen, last_row, 0)
+
+    out = pd.DataFrame(index=pd.RangeIndex(n))
+    out['orders'] = np.bincount(keys, minlength=n)
+    out['net_revenue'] = np.bincount(keys, weights=_numeric(df, 'net_revenue')[rows], minlength=n)
+    out['returns'] = np.bincount(keys, weights=_numeric(df, 'returned')[rows], minlength=n).astype(np.int64)
+
+    if 'date' in df.columns:
+        dates = df['date'].to_numpy()
+        out['first_order'] = np.where(seen, dates[first_row], np.datetime64('NaT'))
+        out['last_order'] = np.where(seen, dates[last_row], np.datetime64('NaT'))
+    # Gather only the needed rows so wide string columns are never materialized
+    for col, name in FIRST_ORDER_ATTRIBUTES.items():
+        if col in df.columns:
+            out[name] = df[col].iloc[first_row].reset_index(drop=True).where(seen)
+    for col in LATEST_ORDER_ATTRIBUTES:
+        if col in df.columns:
+            out[col] = df[col].iloc[last_row].reset_index(drop=True).where(seen)
+    return out
+
+
+def build_customers(df):
+    """Materialize the customer table from date-sorted order rows."""
+    if 'customer_id' not in df.columns:
+        return None
+    # factorize numbers values in order of first appearance, i.e. first purchase;
+    # missing ids get -1 and stay out of the table
+    keys, ids = pd.factorize(df['customer_id'])
+    n = len(ids)
+
+    table = _aggregate(df, keys, n)
+    table.insert(0, 'customer_id', np.asarray(ids))
+    return CustomerTable(table, pd.Index(ids), keys.astype(np.int64))
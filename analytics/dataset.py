@@ -0,0 +1,183 @@
+"""Loaded dataset container and source fingerprinting.
+
+A dataset remembers the (path, size, mtime) of the files it was loaded
+from. When the source only gains shards, ``extend_dataset`` reads just the
+new ones and folds them into the loaded dataset: the customer table is
+updated in place of a rebuild and the frame-wide structures (profile, cube,
+periods) are rebuilt from the combined frame without parsing the old
+shards again.
+"""
+import hashlib
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from analytics.cube import Cube, build_cube
+from analytics.customers import CustomerTable, build_customers
+from analytics.ingest import ShardStats, combine_frames, read_shards, read_validated, resolve_shards
+from analytics.periods import PeriodMeasures, build_periods
+from analytics.profile import DatasetProfile, build_profile
+from analytics.validation import Quarantine, ValidationReport
+
+# A single file, a directory of shards or a glob such as 'exports/2024-*.csv'
+DATA_PATH = os.environ.get('ECOMMERCE_DATA', 'cleaned_data.csv')
+# Rows rejected by validation, with a ``reason`` column
+QUARANTINE_PATH = os.environ.get('ECOMMERCE_QUARANTINE', 'quarantine.csv')
+
+
+def _shard_key(path):
+    info = os.stat(path)
+    return os.path.abspath(path), info.st_size, info.st_mtime_ns
+
+
+def source_keys(path=DATA_PATH):
+    """(path, size, mtime) of every source file; empty if missing."""
+    try:
+        return tuple(_shard_key(shard) for shard in resolve_shards(path))
+    except FileNotFoundError:
+        return ()
+
+
+def file_fingerprint(path=DATA_PATH):
+    """Cheap identity of the source files (path, size, mtime); None if missing."""
+    keys = source_keys(path)
+    if not keys:
+        return None
+    return hashlib.sha1("\n".join(f"{p}:{size}:{mtime}" for p, size, mtime in keys).encode()).hexdigest()[:16]
+
+
+def source_modified(path=DATA_PATH):
+    """Latest modification time (server local time) of the source files; None if missing."""
+    try:
+        return pd.Timestamp.fromtimestamp(max(os.stat(shard).st_mtime for shard in resolve_shards(path)))
+    except FileNotFoundError:
+        return None
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """The loaded orders frame plus everything precomputed from it at load."""
+    df: pd.DataFrame
+    fingerprint: str
+    profile: DatasetProfile
+    cube: Cube
+    periods: PeriodMeasures
+    customers: CustomerTable
+    shards: tuple[ShardStats, ...] = field(default_factory=tuple)
+    validation: ValidationReport = None
+    # (path, size, mtime) of the files loaded, see ``source_keys``
+    sources: tuple = ()
+
+
+def _date_sorted(df):
+    # Keep orders in date order so day ranges are contiguous row slices
+    if 'date' in df.columns and not df['date'].is_monotonic_increasing:
+        df = df.sort_values('date', kind='stable', ignore_index=True)
+    return df
+
+
+def read_orders(path=DATA_PATH):
+    """One file, validated chunk by chunk. Returns (df, quarantined, report)."""
+    df, quarantined, report = read_validated(path)
+    return _date_sorted(df), quarantined, report
+
+
+def load_orders(source=DATA_PATH, workers=None, progress=None, quarantine_path=QUARANTINE_PATH):
+    """Validated orders from a single file or from shards parsed in parallel.
+
+    Rejected rows are written to ``quarantine_path`` with their reason codes.
+    Returns (df, shard stats, ValidationReport). A single file keeps its
+    text columns as strings; shards come back with unified categoricals.
+    """
+    paths = resolve_shards(source)
+    if paths == [source]:
+        df, quarantined, report = read_orders(source)
+        rejected, shards = [quarantined] if quarantined is not None else [], ()
+    else:
+        df, rejected, shards, report = read_shards(paths, workers=workers, progress=progress)
+        df = _date_sorted(df)
+
+    quarantine = Quarantine(quarantine_path)
+    for rows in rejected:
+        quarantine.write(rows)
+    report.quarantine_path = quarantine.report_path()
+    return df, tuple(shards), report
+
+
+def build_dataset(df, fingerprint, shards=(), validation=None, sources=()):
+    return Dataset(
+        df=df,
+        fingerprint=fingerprint,
+        profile=build_profile(df),
+        cube=build_cube(df),
+        periods=build_periods(df),
+        customers=build_customers(df),
+        shards=tuple(shards),
+        validation=validation,
+        sources=tuple(sources),
+    )
+
+
+def added_shards(dataset, sources):
+    """Paths in ``sources`` that ``dataset`` lacks; None unless files were only added."""
+    loaded = set(dataset.sources)
+    if not loaded or not loaded < set(sources):
+        return None
+    return [path for path, size, mtime in sources if (path, size, mtime) not in loaded]
+
+
+def extend_dataset(dataset, paths, fingerprint, sources, workers=None, progress=None,
+                   quarantine_path=QUARANTINE_PATH):
+    """``dataset`` with the shards at ``paths`` added. Returns (dataset, the added order rows).
+
+    Order ids already loaded are rejected from the new shards (the loaded
+    rows win). The combined frame is date-sorted again, since a late shard
+    may hold older orders, and the customer keys follow the rows.
+    """
+    added, rejected, shards, report = read_shards(paths, workers=workers, progress=progress)
+    added = _date_sorted(added)
+    if 'order_id' in added.columns and 'order_id' in dataset.df.columns:
+        repeated = added['order_id'].isin(dataset.df['order_id']).to_numpy() & added['order_id'].notna().to_numpy()
+        if repeated.any():
+            rejected.append(added[repeated].assign(reason='duplicate_order_id'))
+            added = added[~repeated].reset_index(drop=True)
+            report.counts['duplicate_order_id'] += int(repeated.sum())
+            report.rows_kept -= int(repeated.sum())
+
+    quarantine = Quarantine(quarantine_path, append=True)
+    for rows in rejected:
+        quarantine.write(rows)
+    validation = ValidationReport()
+    for part in (dataset.validation, report):
+        if part is not None:
+            validation.merge(part)
+    validation.quarantine_path = quarantine.report_path() or getattr(dataset.validation, 'quarantine_path', None)
+
+    df = combine_frames([dataset.df, added])
+    order = None
+    if 'date' in df.columns and not df['date'].is_monotonic_increasing:
+        order = np.argsort(df['date'].to_numpy(), kind='stable')
+        df = df.take(order).reset_index(drop=True)
+
+    customers = dataset.customers
+    if customers is not None and 'customer_id' in added.columns:
+        customers = customers.append(added)
+        if order is not None:
+            customers = CustomerTable(customers.table, customers.id_index, customers.order_keys[order])
+    else:
+        customers = build_customers(df)
+
+    extended = Dataset(
+        df=df,
+        fingerprint=fingerprint,
+        profile=build_profile(df),
+        cube=build_cube(df),
+        periods=build_periods(df),
+        customers=customers,
+        shards=tuple(sorted(dataset.shards + tuple(shards), key=lambda stats: stats.path)),
+        validation=validation,
+        sources=tuple(sources),
+    )
+    return extended, added
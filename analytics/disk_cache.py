@@ -0,0 +1,149 @@
+"""Persistent on-disk cache for the loaded dataset and derived aggregates.
+
+Entries live in one directory as ``<name>-<fingerprint>-<code version>.pkl``.
+The fingerprint identifies the source files; the code version hashes the
+``analytics`` sources plus the numpy/pandas versions, so a deploy that
+changes how anything is computed (or pickled) never reads stale entries.
+Values are pickled with protocol 5, which stores numpy and Arrow buffers as
+raw bytes. Writes go to a temporary file and are renamed into place; reads
+refresh the file's mtime, and the least recently used entries are deleted
+once the directory grows past ``max_bytes``.
+
+Only point the cache at a directory the app owns: entries are unpickled.
+"""
+import glob
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get('ECOMMERCE_CACHE_DIR', os.path.join('.cache', 'ecommerce'))
+CACHE_MAX_BYTES = int(float(os.environ.get('ECOMMERCE_CACHE_MAX_MB', 4096)) * 1024 * 1024)
+SUFFIX = '.pkl'
+
+
+def code_version():
+    """Short hash of the analytics sources and the numpy/pandas versions."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1(f"{np.__version__}:{pd.__version__}".encode())
+    for path in sorted(glob.glob(os.path.join(package, '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class DiskCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, version=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version or code_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path(self, name, fingerprint):
+        return os.path.join(self.directory, f"{name}-{fingerprint}-{self.version}{SUFFIX}")
+
+    def contains(self, name, fingerprint):
+        """Whether an entry is stored (without reading it or counting a hit)."""
+        return fingerprint is not None and os.path.exists(self.path(name, fingerprint))
+
+    def get(self, name, fingerprint):
+        """Cached value, or None when absent or unreadable."""
+        if fingerprint is None:
+            return None
+        path = self.path(name, fingerprint)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            # Truncated or incompatible entry: drop it and recompute
+            logger.warning("discarding unreadable cache entry %s: %s", path, e)
+            self._remove(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, name, fingerprint, value):
+        """Store ``value``; returns its size in bytes (0 when not stored)."""
+        if fingerprint is None:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=5)
+            size = os.path.getsize(tmp)
+            if size > self.max_bytes:
+                os.remove(tmp)
+                return 0
+            os.replace(tmp, self.path(name, fingerprint))
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.evict()
+        return size
+
+    def cached(self, name, fingerprint, compute):
+        """``get`` or ``compute()`` + ``put``. None results are not stored."""
+        value = self.get(name, fingerprint)
+        if value is None:
+            value = compute()
+            if value is not None:
+                try:
+                    self.put(name, fingerprint, value)
+                except OSError as e:
+                    # A full or read-only disk only costs the next process a recompute
+                    logger.warning("could not cache %s: %s", name, e)
+        return value
+
+    def entries(self):
+        """[(path, size, mtime)] of stored entries, oldest first."""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, f"*{SUFFIX}")):
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, info.st_size, info.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self):
+        """Delete least recently used entries until the total fits ``max_bytes``."""
+        with self._lock:
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,166 @@
+"""Region -> segment -> category -> product drill-down over a hierarchically sorted index.
+
+At load the order rows are sorted once by the codes of every level of the
+hierarchy, so each node of the tree (a region, a region's segment, ...) is
+one contiguous range of the sorted rows, and inside a node the next
+level's codes are sorted too. The measures and the filter columns (day,
+channel) are stored in that order.
+
+Expanding a node locates its range by binary search along its path, splits
+the range where the next level's code changes and sums each child with
+``np.add.reduceat``. Nothing outside the node's rows is touched, so the
+cost is proportional to the node's size, and only expanded nodes are ever
+computed. Expansions are memoized per (path, filters).
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from analytics.cube import MISSING_LABEL
+
+LEVELS = ['region', 'customer_segment', 'category', 'product_id']
+LEVEL_LABELS = {'region': 'Region', 'customer_segment': 'Segment', 'category': 'Category', 'product_id': 'Product'}
+MEASURES = ['net_revenue', 'quantity', 'returned']
+
+
+class DrillIndex:
+    def __init__(self, levels, labels, codes, measures, days, channels, channel_labels, cache_size=256):
+        self.levels = levels                    # level columns, outermost first
+        self.labels = labels                    # level -> pd.Index of member labels (sorted)
+        self.codes = codes                      # level -> (n,) member codes in hierarchical order
+        self.measures = measures                # measure -> (n,) values in hierarchical order
+        self.days = days                        # (n,) datetime64[D] or None
+        self.channels = channels                # (n,) channel codes or None
+        self.channel_labels = channel_labels    # pd.Index of channel labels or None
+        self.n_rows = len(next(iter(codes.values())))
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # The expansion memo and its lock stay with the process
+        state = self.__dict__.copy()
+        del state['_cache'], state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def node_range(self, path):
+        """Rows [lo, hi) of the node at ``path`` (labels from the outermost level), or None."""
+        lo, hi = 0, self.n_rows
+        for level, label in zip(self.levels, path):
+            code = self.labels[level].get_indexer([label])[0]
+            if code < 0:
+                return None
+            segment = self.codes[level][lo:hi]
+            # Same dtype as the codes: a wider key would make searchsorted copy the segment
+            code = segment.dtype.type(code)
+            lo, hi = lo + int(np.searchsorted(segment, code, 'left')), lo + int(np.searchsorted(segment, code, 'right'))
+            if lo == hi:
+                return None
+        return lo, hi
+
+    def _selected(self, lo, hi, channel, start, end):
+        """Mask of the node's rows passing the filters, or None when nothing is filtered."""
+        mask = None
+        if self.days is not None and (start is not None or end is not None):
+            days = self.days[lo:hi]
+            mask = np.ones(hi - lo, dtype=bool)
+            if start is not None:
+                mask &= days >= np.datetime64(pd.Timestamp(start).date(), 'D')
+            if end is not None:
+                mask &= days <= np.datetime64(pd.Timestamp(end).date(), 'D')
+        if channel is not None and self.channels is not None:
+            match = self.channels[lo:hi] == self.channel_labels.get_indexer([channel])[0]
+            mask = match if mask is None else mask & match
+        return mask
+
+    def children(self, path=(), channel=None, start=None, end=None):
+        """One row per child of the node at ``path`` with orders in the filters, by revenue.
+
+        Columns: the child level, orders, the summed measures, return rate and
+        average order value. None when ``path`` is a leaf or does not exist.
+        """
+        if len(path) >= len(self.levels):
+            return None
+        key = (tuple(path), channel, start, end)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._children(tuple(path), channel, start, end)
+
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _children(self, path, channel, start, end):
+        bounds = self.node_range(path)
+        if bounds is None:
+            return None
+        lo, hi = bounds
+        level = self.levels[len(path)]
+        codes = self.codes[level][lo:hi]
+        starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+
+        mask = self._selected(lo, hi, channel, start, end)
+        weight = np.ones(hi - lo) if mask is None else mask.astype(np.float64)
+        orders = np.add.reduceat(weight, starts)
+        keep = orders > 0
+        columns = {level: self.labels[level][codes[starts[keep]]].to_numpy(), 'orders': orders[keep].astype(np.int64)}
+        for measure, values in self.measures.items():
+            segment = values[lo:hi] if mask is None else np.where(mask, values[lo:hi], 0)
+            columns[measure] = np.add.reduceat(segment, starts)[keep]
+
+        orders = orders[keep]
+        if 'returned' in columns:
+            columns['return_rate'] = (columns['returned'] / orders * 100).round(2)
+        if 'net_revenue' in columns:
+            revenue = columns['net_revenue']
+            columns['avg_order_value'] = (revenue / orders).round(2)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                columns['revenue_share'] = (revenue / revenue.sum() * 100).round(2)
+        # Built once, already in display order: children are few but expansions are interactive
+        order = np.argsort(-columns.get('net_revenue', orders), kind='stable')
+        return pd.DataFrame({name: values[order] for name, values in columns.items()})
+
+
+def build_drill_index(df, levels=LEVELS):
+    """Hierarchically sorted index over the ``levels`` present (at least one); None otherwise."""
+    levels = [level for level in levels if level in df.columns]
+    if not levels:
+        return None
+
+    labels, raw_codes = {}, {}
+    for level in levels:
+        codes, uniques = pd.factorize(df[level], sort=True)
+        uniques = np.asarray(uniques, dtype=object)
+        if (codes < 0).any():
+            codes = np.where(codes < 0, len(uniques), codes)
+            uniques = np.append(uniques, MISSING_LABEL)
+        labels[level], raw_codes[level] = pd.Index(uniques, dtype=object), codes.astype(np.int32)
+
+    # lexsort: last key is the primary one
+    order = np.lexsort([raw_codes[level] for level in reversed(levels)])
+    codes = {level: raw_codes[level][order] for level in levels}
+    measures = {
+        col: np.nan_to_num(pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)[order])
+        for col in MEASURES if col in df.columns
+    }
+
+    days = None
+    if 'date' in df.columns:
+        days = df['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')[order]
+    channels = channel_labels = None
+    if 'marketing_channel' in df.columns:
+        channel_codes, channel_labels = pd.factorize(df['marketing_channel'], sort=True)
+        channels, channel_labels = channel_codes.astype(np.int16)[order], pd.Index(channel_labels, dtype=object)
+    return DrillIndex(levels, labels, codes, measures, days, channels, channel_labels)
@@ -0,0 +1,65 @@
+"""Row selection over the date-sorted orders frame.
+
+The loader keeps orders sorted by ``date``, so a day range is always one
+contiguous block of rows. ``np.searchsorted`` finds its bounds in O(log n)
+and the range comes back as a positional slice instead of a full-table
+boolean mask; any dimension filters are then applied to that slice only.
+"""
+import numpy as np
+import pandas as pd
+
+ONE_DAY = np.timedelta64(1, 'D')
+# Select box options that mean "no filter" (dashboard sidebar, Data Explorer)
+ALL_CHANNELS = 'All Channels'
+ALL = 'All'
+NO_FILTER = frozenset({ALL_CHANNELS, ALL})
+
+
+def is_no_filter(value):
+    """Whether a filter ``value`` selects everything: None or one of the exact ``NO_FILTER`` options."""
+    return value is None or (isinstance(value, str) and value in NO_FILTER)
+
+
+def date_bounds(dates, start=None, end=None):
+    """Row bounds [lo, hi) of the days start..end (inclusive) in sorted ``dates``."""
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start).date(), 'D'), side='left'))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end).date(), 'D') + ONE_DAY, side='left'))
+    return lo, max(lo, hi)
+
+
+def _day_rows(df, start, end):
+    if 'date' in df.columns and (start is not None or end is not None):
+        return date_bounds(df['date'].to_numpy(), start, end)
+    return None
+
+
+def _equals_mask(df, equals):
+    mask = None
+    for col, value in equals.items():
+        if is_no_filter(value) or col not in df.columns:
+            continue
+        col_mask = (df[col] == value).to_numpy()
+        mask = col_mask if mask is None else mask & col_mask
+    return mask
+
+
+def select_orders(df, start=None, end=None, **equals):
+    """Orders between ``start`` and ``end`` (inclusive days) matching ``equals``.
+
+    ``equals`` maps column -> required value; None and the "no filter"
+    options ('All Channels', 'All') are ignored so sidebar selections can be
+    passed straight through. Other values, even ones starting with "All",
+    are real members.
+    """
+    bounds = _day_rows(df, start, end)
+    if bounds is not None:
+        df = df.iloc[bounds[0]:bounds[1]]
+    mask = _equals_mask(df, equals)
+    return df if mask is None else df[mask]
+
+
+def order_rows(df, start=None, end=None, **equals):
+    """Positions in ``df`` of the rows ``select_orders`` returns: a slice, or an array when masked."""
+    lo, hi = _day_rows(df, start, end) or (0, len(df))
+    mask = _equals_mask(df.iloc[lo:hi], equals)
+    return slice(lo, hi) if mask is None else lo + np.flatnonzero(mask)
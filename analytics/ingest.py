@@ -0,0 +1,188 @@
+"""Loading orders from one file or many shards (directory or glob).
+
+Every file is read in chunks; each chunk is typed and validated
+(``analytics.validation``) before it is kept, and the rejected rows are
+returned for the caller to quarantine.
+
+Shards are parsed in a process pool. Each worker validates its shard and turns
+its text columns into categoricals, so only integer codes plus a small
+dictionary per column travel back to the parent. The parent lines the
+shards up on the union of their columns and merges categoricals with
+``union_categoricals``, which remaps codes and never touches the strings
+again. Per-shard rows and parse time are reported through ``progress`` and
+kept on the result.
+"""
+import glob
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from analytics.validation import SeenIds, ValidationReport, coerce_types, validate_chunk
+
+logger = logging.getLogger(__name__)
+
+SHARD_EXTENSIONS = ('.csv', '.parquet')
+CHUNK_ROWS = 1_000_000
+# Text columns with at most this share of distinct values become categoricals
+CATEGORICAL_RATIO = 0.5
+# Below this many bytes in total, starting worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ShardStats:
+    path: str
+    rows: int
+    seconds: float
+    quarantined: int = 0
+
+
+def resolve_shards(source):
+    """Files behind ``source``: a file, a directory of shards, or a glob pattern."""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+        paths = [p for p in paths if p.endswith(SHARD_EXTENSIONS) and os.path.isfile(p)]
+    elif glob.has_magic(source):
+        paths = [p for p in glob.glob(source) if os.path.isfile(p)]
+    else:
+        paths = [source] if os.path.isfile(source) else []
+    if not paths:
+        raise FileNotFoundError(source)
+    return sorted(paths)
+
+
+def _month_dates(df):
+    if 'date' in df.columns:
+        if 'month_date' not in df.columns:
+            df['month_date'] = df['date'].dt.to_period('M').dt.to_timestamp()
+        elif df['month_date'].isna().any():
+            df['month_date'] = df['month_date'].fillna(df['date'].dt.to_period('M').dt.to_timestamp())
+    return df
+
+
+def read_validated(path, seen=None, chunk_rows=CHUNK_ROWS):
+    """Read one file chunk by chunk, keeping only rows that pass validation.
+
+    Returns (kept, quarantined, ValidationReport). ``seen`` carries order ids
+    across files.
+    """
+    seen = seen if seen is not None else SeenIds()
+    if path.endswith('.parquet'):
+        chunks = [pd.read_parquet(path)]
+    else:
+        chunks = pd.read_csv(path, chunksize=chunk_rows)
+
+    report = ValidationReport()
+    kept, rejected = [], []
+    for chunk in chunks:
+        good, bad, counts, repairs = validate_chunk(coerce_types(chunk), seen)
+        report.add(len(chunk), len(good), counts, repairs)
+        kept.append(good)
+        if len(bad):
+            rejected.append(bad)
+
+    df = pd.concat(kept, ignore_index=True) if len(kept) != 1 else kept[0].reset_index(drop=True)
+    quarantined = pd.concat(rejected, ignore_index=True) if rejected else None
+    return _month_dates(df), quarantined, report
+
+
+def read_shard(path):
+    """Validate one shard; text columns come back as categoricals.
+
+    Returns (df, quarantined, ShardStats, ValidationReport).
+    """
+    started = time.perf_counter()
+    df, quarantined, report = read_validated(path)
+    for col in df.columns:
+        if (pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])) \
+                and df[col].nunique() <= CATEGORICAL_RATIO * max(len(df), 1):
+            df[col] = df[col].astype('category')
+    stats = ShardStats(path, len(df), time.perf_counter() - started, report.quarantined)
+    return df, quarantined, stats, report
+
+
+def combine_frames(frames):
+    """Concatenate shards on the union of their columns with unified categoricals."""
+    if len(frames) == 1:
+        return frames[0]
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+    combined = {}
+    for col in columns:
+        parts = [frame[col] if col in frame.columns else None for frame in frames]
+        present = [part for part in parts if part is not None]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in present):
+            # A shard without the column contributes all-missing codes
+            empty = present[0].cat.categories[:0]
+            parts = [
+                part if part is not None else pd.Series(pd.Categorical.from_codes(np.full(len(frame), -1), empty))
+                for part, frame in zip(parts, frames)
+            ]
+            combined[col] = pd.Series(union_categoricals(parts, sort_categories=True, ignore_order=True))
+        else:
+            # Mixed dtypes across shards: fall back to plain values
+            parts = [
+                pd.Series(np.nan, index=frame.index) if part is None
+                else part.astype(part.cat.categories.dtype) if isinstance(part.dtype, pd.CategoricalDtype)
+                else part
+                for part, frame in zip(parts, frames)
+            ]
+            combined[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(combined)
+
+
+def read_shards(paths, workers=None, progress=None):
+    """Parse ``paths`` in a process pool and combine them in path order.
+
+    ``workers`` defaults to the core count for large inputs and 1 for small
+    ones. ``progress(done, total, stats)`` is called as each shard finishes.
+    Order ids repeated across shards are rejected after combining (the
+    first shard in path order wins). Returns (df, quarantined frames,
+    [ShardStats] in path order, ValidationReport).
+    """
+    total = len(paths)
+    if workers is None:
+        large = sum(os.path.getsize(path) for path in paths) >= PARALLEL_MIN_BYTES
+        workers = (os.cpu_count() or 1) if large else 1
+    workers = min(workers, total)
+    results = [None] * total
+
+    def finished(i, frame, quarantined, stats, report):
+        results[i] = (frame, quarantined, stats, report)
+        done = sum(r is not None for r in results)
+        logger.info("shard %d/%d %s: %s rows in %.2fs (%d quarantined)",
+                    done, total, stats.path, f"{stats.rows:,}", stats.seconds, stats.quarantined)
+        if progress is not None:
+            progress(done, total, stats)
+
+    if workers <= 1:
+        for i, path in enumerate(paths):
+            finished(i, *read_shard(path))
+    else:
+        # spawn: the app process runs threads, which fork does not copy safely
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {pool.submit(read_shard, path): i for i, path in enumerate(paths)}
+            for future in as_completed(futures):
+                finished(futures[future], *future.result())
+
+    report = ValidationReport()
+    for _, _, _, shard_report in results:
+        report.merge(shard_report)
+    rejected = [quarantined for _, quarantined, _, _ in results if quarantined is not None]
+
+    df = combine_frames([frame for frame, _, _, _ in results])
+    if 'order_id' in df.columns:
+        repeated = df['order_id'].duplicated().to_numpy() & df['order_id'].notna().to_numpy()
+        if repeated.any():
+            rejected.append(df[repeated].assign(reason='duplicate_order_id'))
+            df = df[~repeated].reset_index(drop=True)
+            report.counts['duplicate_order_id'] += int(repeated.sum())
+            report.rows_kept -= int(repeated.sum())
+    return df, rejected, [stats for _, _, stats, _ in results], report
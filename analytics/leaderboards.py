@@ -0,0 +1,112 @@
+"""Top / bottom N products, customers and campaigns without sorting the orders.
+
+Each entity column is factorized once per dataset into an integer code per
+order row (customers reuse ``CustomerTable.order_keys``). For a filter
+state, the selected rows are scattered into one dense array per measure
+(revenue, units, orders, returns, discount) with ``np.bincount``, so the
+frame is never grouped or sorted. Each leaderboard then picks its N entries
+with ``np.argpartition`` (linear in the number of entities) and sorts only
+those N, which keeps a top 10 out of millions of SKUs cheap.
+"""
+import numpy as np
+import pandas as pd
+
+ENTITIES = {'product': 'product_id', 'customer': 'customer_id', 'campaign': 'marketing_campaign'}
+METRICS = {'net_revenue': 'Revenue', 'quantity': 'Units', 'return_rate': 'Return Rate (%)', 'roi': 'ROI (%)'}
+# Rates of entities with fewer orders than this are too noisy to rank
+MIN_ORDERS = 10
+_RATES = {'return_rate', 'roi'}
+
+
+def top_n(values, n, largest=True):
+    """Positions of the ``n`` largest (or smallest) finite ``values``, best first."""
+    candidates = np.flatnonzero(np.isfinite(values))
+    keys = values[candidates] if not largest else -values[candidates]
+    if len(candidates) > n:
+        picked = np.argpartition(keys, n - 1)[:n]
+        candidates, keys = candidates[picked], keys[picked]
+    return candidates[np.argsort(keys, kind='stable')]
+
+
+class EntityTotals:
+    """Per-entity totals of the entities with orders in one filter state."""
+
+    def __init__(self, column, keys, values):
+        self.column = column    # entity column name, e.g. 'product_id'
+        self.keys = keys        # pd.Index of the entities with orders
+        self.values = values    # measure -> (K,) float array aligned with ``keys``
+
+    def metrics(self):
+        """The ``METRICS`` the measures present allow."""
+        inputs = {'net_revenue': 'net_revenue', 'quantity': 'quantity', 'return_rate': 'returned', 'roi': 'discount_amount'}
+        return [name for name in METRICS if inputs[name] in self.values]
+
+    def metric(self, name, min_orders=MIN_ORDERS, rows=slice(None)):
+        """Values of ``name`` at ``rows``; rates are NaN below ``min_orders`` orders."""
+        values = {measure: array[rows] for measure, array in self.values.items()}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if name == 'return_rate':
+                result = values['returned'] / values['orders'] * 100
+            elif name == 'roi':
+                discount = values['discount_amount']
+                result = np.where(discount != 0, (values['net_revenue'] - discount) / discount * 100, np.nan)
+            else:
+                return values[name]
+        result[values['orders'] < min_orders] = np.nan
+        return result
+
+    def leaderboard(self, name, n=10, largest=True, min_orders=MIN_ORDERS):
+        """The top (or bottom) ``n`` entities by ``name`` with all their measures."""
+        rows = top_n(self.metric(name, min_orders), n, largest)
+        frame = pd.DataFrame({self.column: self.keys[rows]})
+        frame['orders'] = self.values['orders'][rows].astype(np.int64)
+        for measure in self.metrics():
+            values = self.metric(measure, min_orders=1, rows=rows)
+            frame[measure] = values.round(2) if measure in _RATES else values
+        frame.index = pd.RangeIndex(1, len(frame) + 1, name='rank')
+        return frame
+
+
+class LeaderboardIndex:
+    """Entity code of every order row, per entity column."""
+
+    def __init__(self, codes, keys):
+        self.codes = codes      # entity column -> (n_rows,) int64, -1 where missing
+        self.keys = keys        # entity column -> pd.Index, position = code
+
+    def totals(self, df, column, rows=slice(None)):
+        """``EntityTotals`` of the order rows at ``rows`` (a slice or positions into ``df``)."""
+        codes = self.codes[column][rows]
+        keep = codes >= 0
+        codes = codes[keep]
+        size = len(self.keys[column])
+
+        def scatter(col=None):
+            if col is None:
+                return np.bincount(codes, minlength=size).astype(np.float64)
+            weights = pd.to_numeric(df[col].iloc[rows], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            return np.bincount(codes, weights=np.nan_to_num(weights[keep]), minlength=size)
+
+        values = {'orders': scatter()}
+        for col in ['net_revenue', 'quantity', 'returned', 'discount_amount']:
+            if col in df.columns:
+                values[col] = scatter(col)
+        # Keep only entities with orders: a narrow filter touches a sliver of the catalog
+        active = np.flatnonzero(values['orders'])
+        return EntityTotals(column, self.keys[column][active], {name: array[active] for name, array in values.items()})
+
+
+def build_leaderboard_index(df, customers=None):
+    """Factorized entity codes of ``df``; None if it has none of the entity columns."""
+    codes, keys = {}, {}
+    for column in ENTITIES.values():
+        if column not in df.columns:
+            continue
+        if column == 'customer_id' and customers is not None:
+            codes[column] = np.asarray(customers.order_keys, dtype=np.int64)
+            keys[column] = customers.id_index
+        else:
+            entity_codes, uniques = pd.factorize(df[column])
+            codes[column] = entity_codes.astype(np.int64)
+            keys[column] = pd.Index(uniques, name=column)
+    return LeaderboardIndex(codes, keys) if codes else None
@@ -0,0 +1,150 @@
+"""Dashboard metrics as plain DataFrames, shared by the pages and the JSON API.
+
+Every function takes an orders frame that is already filtered (see
+``analytics.filters.select_orders``) and returns one tidy table, so the
+Streamlit views only draw and the API only serializes.
+"""
+# name -> (group-by column, aggregations, derived columns)
+BREAKDOWNS = {
+    'category': ('category', {
+        'gross_revenue': 'sum', 'net_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum',
+    }, ['avg_order_value', 'roi']),
+    'campaign': ('marketing_campaign', {
+        'net_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum', 'customer_id': 'nunique',
+    }, ['revenue_per_customer', 'roi']),
+    'channel': ('marketing_channel', {
+        'net_revenue': 'sum', 'gross_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum',
+        'customer_id': 'nunique',
+    }, ['avg_order_value', 'revenue_per_customer', 'roi']),
+    'segment': ('customer_segment', {
+        'net_revenue': 'sum', 'gross_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum',
+        'customer_id': 'nunique', 'customer_lifetime_value': 'mean', 'retention_score': 'mean',
+    }, ['avg_order_value', 'revenue_per_customer', 'roi']),
+    'region': ('region', {
+        'net_revenue': 'sum', 'gross_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum',
+        'customer_id': 'nunique',
+    }, ['avg_order_value', 'revenue_per_customer', 'roi']),
+}
+for _period in ['month', 'quarter', 'season']:
+    BREAKDOWNS[_period] = (_period, {
+        'net_revenue': 'sum', 'gross_revenue': 'sum', 'discount_amount': 'sum', 'quantity': 'sum',
+    }, ['avg_order_value', 'roi'])
+
+
+def roi(totals):
+    """ROI % of grouped totals; NaN where nothing was discounted."""
+    discount = totals['discount_amount'].where(totals['discount_amount'] != 0)
+    return ((totals['net_revenue'] - discount) / discount * 100).round(2)
+
+
+_DERIVED = {
+    'avg_order_value': (['net_revenue', 'quantity'], lambda t: (t['net_revenue'] / t['quantity']).round(2)),
+    'revenue_per_customer': (['net_revenue', 'customer_id'], lambda t: (t['net_revenue'] / t['customer_id']).round(2)),
+    'roi': (['net_revenue', 'discount_amount'], roi),
+}
+
+
+def kpi_breakdown(df, name, by=None):
+    """Totals per value of one ``BREAKDOWNS`` dimension; None if its column is missing.
+
+    With ``by`` (e.g. 'marketing_channel') the totals are split by that
+    column too, which is the first output column: the rows of one ``by``
+    value equal ``kpi_breakdown`` of the orders filtered to that value.
+    """
+    column, aggregations, derived = BREAKDOWNS[name]
+    keys = ([by] if by and by != column else []) + [column]
+    if any(col not in df.columns for col in keys):
+        return None
+    aggregations = {col: how for col, how in aggregations.items() if col in df.columns}
+    totals = df.groupby(keys, observed=True).agg(aggregations).reset_index()
+    for col in derived:
+        inputs, compute = _DERIVED[col]
+        if all(c in totals.columns for c in inputs):
+            totals[col] = compute(totals)
+    return totals
+
+
+def overall_kpis(periods, channel=None, start=None, end=None):
+    """{kpi: PeriodDelta} for days start..end vs the preceding range, and the range length in days."""
+    start = start if start is not None else periods.days[0]
+    end = end if end is not None else periods.days[-1]
+    lo, hi = periods.day_span(start, end)
+    return periods.compare(channel, start, end), max(hi - lo + 1, 0)
+
+
+def monthly_trends(df, by='marketing_channel'):
+    """Net revenue and distinct customers per month (and per ``by`` value when given).
+
+    Columns: month, [channel], revenue, conversions.
+    """
+    keys = ['month_date'] + ([by] if by else [])
+    if any(col not in df.columns for col in keys):
+        return None
+    aggregations = {col: how for col, how in [('net_revenue', 'sum'), ('customer_id', 'nunique')] if col in df.columns}
+    trends = df.groupby(keys, observed=True).agg(aggregations).reset_index()
+    return trends.rename(columns={
+        'month_date': 'month', by: 'channel', 'net_revenue': 'revenue', 'customer_id': 'conversions'
+    })
+
+
+def channel_summary(df, revenue_col='net_revenue'):
+    """Revenue, distinct customers, mean ROI and orders per channel (Marketing tab)."""
+    if revenue_col not in df.columns:
+        revenue_col = 'final_amount'
+    spec = dict(
+        total_revenue=(revenue_col, 'sum'),
+        total_conversions=('customer_id', 'nunique'),
+        avg_roi=('roi', 'mean'),
+    )
+    if 'order_id' in df.columns:
+        spec['total_orders'] = ('order_id', 'count')
+    summary = df.groupby('marketing_channel', observed=True).agg(**spec)
+    summary.index.name = 'channel'
+    return summary
+
+
+def channel_performance(df):
+    """Per-channel order economics and the weighted efficiency score (Performance tab)."""
+    performance = df.groupby('marketing_channel', observed=True).agg(
+        Total_Revenue=('final_amount', 'sum'),
+        Avg_Order_Value=('final_amount', 'mean'),
+        Total_Orders=('order_id', 'count'),
+        Unique_Customers=('customer_id', 'nunique'),
+    ).reset_index().rename(columns={'marketing_channel': 'Channel'})
+    performance['Revenue_Per_Order'] = (performance['Total_Revenue'] / performance['Total_Orders']).round(2)
+    performance['Customer_Acquisition_Rate_%'] = (
+        performance['Unique_Customers'] / performance['Total_Orders'] * 100
+    ).round(2)
+    performance['Revenue_Per_Customer'] = (performance['Total_Revenue'] / performance['Unique_Customers']).round(2)
+    return efficiency_scores(performance)
+
+
+def efficiency_scores(performance):
+    """(Re)compute Efficiency_Score relative to the best of the channels in ``performance``."""
+    performance = performance.copy()
+    performance['Efficiency_Score'] = (
+        performance['Revenue_Per_Order'] / performance['Revenue_Per_Order'].max() * 40 +
+        performance['Customer_Acquisition_Rate_%'] / performance['Customer_Acquisition_Rate_%'].max() * 30 +
+        performance['Avg_Order_Value'] / performance['Avg_Order_Value'].max() * 30
+    ).round(2)
+    return performance
+
+
+def best_performer(performance):
+    """Row of the channel with the highest revenue per customer, or None."""
+    if performance.empty or performance['Revenue_Per_Customer'].isna().all():
+        return None
+    return performance.loc[performance['Revenue_Per_Customer'].idxmax()]
+
+
+def dashboard_tables(df):
+    """Every filter-dependent Dashboard table of the orders ``df``: KPI tabs, trends, marketing, channel performance."""
+    tables = {name: kpi_breakdown(df, name) for name in BREAKDOWNS}
+    tables['trends_by_channel'] = monthly_trends(df)
+    tables['trends_total'] = monthly_trends(df, by=None)
+    columns = set(df.columns)
+    has_channel = 'marketing_channel' in columns
+    summarized = has_channel and {'customer_id', 'roi'} <= columns and bool({'net_revenue', 'final_amount'} & columns)
+    tables['summary'] = channel_summary(df) if summarized else None
+    tables['performance'] = channel_performance(df) if has_channel else None
+    return tables
@@ -0,0 +1,227 @@
+"""Mergeable running moments per (month, channel) for correlations on demand.
+
+At load the order rows are reduced once to count, mean vector and centered
+cross-product matrix (co-moments) of the numeric columns per month and
+channel. Any selection of months and channels is then merged from those
+groups with the parallel (Chan et al.) form of Welford's update,
+
+    n = sum n_g,  mean = sum n_g mean_g / n,
+    C = sum C_g + sum n_g (mean_g - mean)(mean_g - mean)^T,
+
+which stays numerically stable without ever revisiting the rows. New order
+rows are folded into existing groups with the same pairwise merge
+(``append``), so the table never has to be rebuilt when data is added.
+
+Each group also keeps its order count, revenue and a HyperLogLog sketch of
+its customers, so the business-level correlations across (month, channel)
+cells (customers, orders or average price against revenue) come from the
+same table. Filters are at month granularity.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.periods import hll_estimate, hll_registers
+
+MOMENT_COLUMNS = [
+    'quantity', 'gross_revenue', 'net_revenue', 'discount_amount', 'final_amount', 'returned',
+    'retention_score', 'satisfaction_rating', 'customer_lifetime_value',
+]
+# (label, cell measure) correlated with cell revenue across (month, channel) cells
+KEY_CORRELATIONS = [
+    ('Customers → Revenue', 'customers'),
+    ('Orders → Revenue', 'orders'),
+    ('Avg Price → Revenue', 'avg_price'),
+]
+SKETCH_PRECISION = 12
+
+
+def group_moments(values, group, n_groups):
+    """Count (G,), mean (G, k) and co-moments (G, k, k) of the rows of ``values`` per group."""
+    k = values.shape[1]
+    n = np.bincount(group, minlength=n_groups).astype(np.float64)
+    sums = np.stack([np.bincount(group, weights=values[:, j], minlength=n_groups) for j in range(k)], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n[:, None] > 0, sums / n[:, None], 0.0)
+    # Two passes: cross-products of deviations from the group mean, not raw sums of squares
+    deviations = values - mean[group]
+    comoment = np.empty((n_groups, k, k))
+    for i in range(k):
+        for j in range(i, k):
+            comoment[:, i, j] = comoment[:, j, i] = np.bincount(
+                group, weights=deviations[:, i] * deviations[:, j], minlength=n_groups
+            )
+    return n, mean, comoment
+
+
+def merge_moments(n, mean, comoment, axis=0):
+    """Merge groups of moments along ``axis`` into one (count, mean, co-moments)."""
+    total = n.sum(axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        merged_mean = np.where(
+            np.expand_dims(total, -1) > 0,
+            (np.expand_dims(n, -1) * mean).sum(axis=axis) / np.expand_dims(total, -1),
+            0.0,
+        )
+    spread = mean - np.expand_dims(merged_mean, axis)
+    between = np.expand_dims(n, (-1, -2)) * spread[..., :, None] * spread[..., None, :]
+    return total, merged_mean, comoment.sum(axis=axis) + between.sum(axis=axis)
+
+
+def correlation_matrix(n, comoment):
+    """Pearson correlations from merged co-moments; NaN for constant columns."""
+    if n < 2:
+        return np.full(comoment.shape, np.nan)
+    scale = np.sqrt(np.diag(comoment))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = comoment / np.outer(scale, scale)
+    return np.clip(corr, -1.0, 1.0)
+
+
+class MomentTable:
+    def __init__(self, months, channels, columns, n, mean, comoment, orders, revenue, sketches):
+        self.months = months        # pd.DatetimeIndex of month starts, axis 0
+        self.channels = channels    # channel labels, axis 1
+        self.columns = columns      # numeric columns, last axis of mean / comoment
+        self.n = n                  # (M, C) order rows with every column present
+        self.mean = mean            # (M, C, k)
+        self.comoment = comoment    # (M, C, k, k)
+        self.orders = orders        # (M, C) every order row
+        self.revenue = revenue      # (M, C) net revenue of every order
+        self.sketches = sketches    # (M, C, 2**p) uint8 customer sketches, or None
+
+    def _mask(self, channel=None, start=None, end=None):
+        mask = np.ones((len(self.months), len(self.channels)), dtype=bool)
+        if start is not None:
+            mask &= (self.months >= pd.Timestamp(start).to_period('M').to_timestamp())[:, None]
+        if end is not None:
+            mask &= (self.months <= pd.Timestamp(end))[:, None]
+        if channel is not None:
+            mask &= (np.asarray(self.channels, dtype=object) == channel)[None, :]
+        return mask
+
+    def correlation(self, channel=None, start=None, end=None):
+        """Correlation matrix of the numeric columns over the selected groups, and its row count."""
+        mask = self._mask(channel, start, end)
+        n, _, comoment = merge_moments(self.n[mask], self.mean[mask], self.comoment[mask])
+        corr = correlation_matrix(n, comoment)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns), int(n)
+
+    def cells(self, channel=None, start=None, end=None):
+        """One row per selected (month, channel) cell with orders: orders, revenue, avg price, customers."""
+        mask = self._mask(channel, start, end) & (self.orders > 0)
+        month, col = np.nonzero(mask)
+        frame = pd.DataFrame({
+            'month': self.months[month],
+            'channel': np.asarray(self.channels, dtype=object)[col],
+            'orders': self.orders[mask],
+            'revenue': self.revenue[mask],
+        })
+        if {'gross_revenue', 'quantity'} <= set(self.columns):
+            means = self.mean[mask]
+            gross, quantity = means[:, self.columns.index('gross_revenue')], means[:, self.columns.index('quantity')]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                frame['avg_price'] = np.where(quantity > 0, gross / quantity, np.nan)
+        if self.sketches is not None:
+            frame['customers'] = [hll_estimate(registers) for registers in self.sketches[mask]]
+        return frame
+
+    def key_correlations(self, channel=None, start=None, end=None):
+        """{label: r} of the ``KEY_CORRELATIONS`` across the selected cells (empty under three cells)."""
+        cells = self.cells(channel, start, end)
+        result = {}
+        for label, measure in KEY_CORRELATIONS:
+            if measure in cells.columns and len(cells) > 2:
+                result[label] = cells[measure].corr(cells['revenue'])
+        return result
+
+    def append(self, orders):
+        """New table with ``orders`` folded in; new months and channels are added as needed."""
+        delta = build_moments(orders, self.columns)
+        if delta is None:
+            return self
+        if delta.columns != self.columns:
+            raise ValueError(f"appended orders lack {sorted(set(self.columns) - set(delta.columns))}")
+        # Month axis stays contiguous, as built; a late or early batch widens it
+        months = pd.date_range(min(self.months[0], delta.months[0]), max(self.months[-1], delta.months[-1]), freq='MS')
+        channels = np.asarray(sorted(set(self.channels) | set(delta.channels)), dtype=object)
+        old, new = self._reindexed(months, channels), delta._reindexed(months, channels)
+
+        stacked = [np.stack([a, b]) for a, b in zip(
+            (old.n, old.mean, old.comoment), (new.n, new.mean, new.comoment)
+        )]
+        n, mean, comoment = merge_moments(*stacked)
+        sketches = None
+        if old.sketches is not None and new.sketches is not None:
+            sketches = np.maximum(old.sketches, new.sketches)
+        return MomentTable(months, channels, self.columns, n, mean, comoment,
+                           old.orders + new.orders, old.revenue + new.revenue, sketches)
+
+    def _reindexed(self, months, channels):
+        """This table laid out on a superset of its months and channels (empty groups added)."""
+        rows = months.get_indexer(self.months)
+        cols = pd.Index(channels).get_indexer(self.channels)
+        shape = (len(months), len(channels))
+        k = len(self.columns)
+
+        def place(array, trailing=()):
+            out = np.zeros(shape + trailing, dtype=array.dtype)
+            out[np.ix_(rows, cols)] = array
+            return out
+
+        sketches = place(self.sketches, self.sketches.shape[2:]) if self.sketches is not None else None
+        return MomentTable(months, channels, self.columns, place(self.n), place(self.mean, (k,)),
+                           place(self.comoment, (k, k)), place(self.orders), place(self.revenue), sketches)
+
+
+def build_moments(df, columns=MOMENT_COLUMNS):
+    """Moments per (month, channel) of the numeric ``columns`` present; None without dates.
+
+    Rows missing any of the columns are left out of the moments (so every
+    pair is correlated over the same rows) but still count toward revenue
+    and customers.
+    """
+    columns = [col for col in columns if col in df.columns]
+    if 'date' not in df.columns or not columns:
+        return None
+
+    month = df['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+    valid = ~np.isnat(month)
+    if not valid.any():
+        return None
+    first, last = month[valid].min(), month[valid].max()
+    months = pd.DatetimeIndex(np.arange(first, last + 1).astype('datetime64[ns]'))
+
+    if 'marketing_channel' in df.columns:
+        codes, channels = pd.factorize(df['marketing_channel'], sort=True)
+        channels = np.asarray(channels, dtype=object)
+    else:
+        codes, channels = np.zeros(len(df), dtype=np.int64), np.array(['All Channels'], dtype=object)
+    valid &= codes >= 0
+    n_months, n_channels = len(months), len(channels)
+    group = (month - first).astype(np.int64) * n_channels + codes
+    n_groups = n_months * n_channels
+
+    values = np.column_stack([
+        pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan) for col in columns
+    ])
+    complete = valid & np.isfinite(values).all(axis=1)
+    n, mean, comoment = group_moments(values[complete], group[complete], n_groups)
+
+    orders = np.bincount(group[valid], minlength=n_groups).astype(np.float64)
+    revenue = np.zeros(n_groups)
+    if 'net_revenue' in df.columns:
+        amounts = pd.to_numeric(df['net_revenue'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        revenue = np.bincount(group[valid], weights=np.nan_to_num(amounts[valid]), minlength=n_groups)
+
+    sketches = None
+    if 'customer_id' in df.columns:
+        hashes = pd.util.hash_array(df['customer_id'].to_numpy()[valid])
+        sketches = hll_registers(hashes, group[valid], n_groups, SKETCH_PRECISION).reshape(n_months, n_channels, -1)
+
+    k = len(columns)
+    return MomentTable(
+        months, channels, columns,
+        n.reshape(n_months, n_channels), mean.reshape(n_months, n_channels, k),
+        comoment.reshape(n_months, n_channels, k, k), orders.reshape(n_months, n_channels),
+        revenue.reshape(n_months, n_channels), sketches,
+    )
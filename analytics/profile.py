@@ -0,0 +1,105 @@
+"""Dataset profile: column stats, null counts, distinct counts and top values.
+
+The profile is built in one pass per column when a dataset is loaded and is
+then reused by every summary view, so pages like About never rescan the
+full frame just to show dtypes or value counts. Top values are kept only
+for columns with repeated values: ID-like and near-unique columns get a
+distinct count alone, since their value counts would be as long as the
+column and never shown.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# Columns with more distinct values than this share of rows get no top values
+NEAR_UNIQUE_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class DatasetProfile:
+    n_rows: int
+    n_columns: int
+    memory_mb: float
+    # One row per column: Column, Data Type, Non-Null Count, Null Count, Distinct
+    columns: pd.DataFrame
+    # sum / mean / min / max of every numeric column (non-finite values ignored)
+    numeric: pd.DataFrame
+    distinct: dict = field(default_factory=dict)
+    top_values: dict = field(default_factory=dict)
+    date_min: pd.Timestamp = None
+    date_max: pd.Timestamp = None
+
+    def stat(self, column, name, default=0):
+        """Numeric summary value, e.g. ``profile.stat('net_revenue', 'sum')``."""
+        if column in self.numeric.index:
+            return self.numeric.at[column, name]
+        return default
+
+    def top(self, column, k=None):
+        """Most frequent values of a categorical column as a Series."""
+        counts = self.top_values.get(column, pd.Series(dtype='int64'))
+        return counts if k is None else counts.head(k)
+
+
+def _id_like(col):
+    name = str(col).lower()
+    return name == 'id' or name.endswith('_id')
+
+
+def build_profile(df, top_k=20):
+    n_rows = len(df)
+    non_null = df.count()
+
+    distinct = {}
+    top_values = {}
+    numeric = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_float_dtype(s):
+            values = s.to_numpy(dtype=np.float64, na_value=np.nan)
+            finite = values[np.isfinite(values)]
+            numeric[col] = {
+                'sum': finite.sum(),
+                'mean': finite.mean() if len(finite) else np.nan,
+                'min': finite.min() if len(finite) else np.nan,
+                'max': finite.max() if len(finite) else np.nan,
+            }
+            continue
+
+        if pd.api.types.is_datetime64_any_dtype(s):
+            distinct[col] = s.nunique()
+            continue
+
+        if _id_like(col):
+            distinct[col] = s.nunique()
+        else:
+            counts = s.value_counts(sort=False)
+            distinct[col] = len(counts)
+            if len(counts) <= NEAR_UNIQUE_RATIO * n_rows:
+                top_values[col] = counts.sort_values(ascending=False, kind='stable').head(top_k)
+        if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+            numeric[col] = {'sum': s.sum(), 'mean': s.mean(), 'min': s.min(), 'max': s.max()}
+
+    columns = pd.DataFrame({
+        'Column': df.columns,
+        'Data Type': df.dtypes.astype(str).values,
+        'Non-Null Count': non_null.values,
+        'Null Count': n_rows - non_null.values,
+        'Distinct': pd.array([distinct.get(c) for c in df.columns], dtype='Int64'),
+    })
+
+    date_min = df['date'].min() if 'date' in df.columns else None
+    date_max = df['date'].max() if 'date' in df.columns else None
+
+    return DatasetProfile(
+        n_rows=n_rows,
+        n_columns=len(df.columns),
+        memory_mb=df.memory_usage(deep=True).sum() / 1024**2,
+        columns=columns,
+        numeric=pd.DataFrame.from_dict(numeric, orient='index'),
+        distinct=distinct,
+        top_values=top_values,
+        date_min=date_min,
+        date_max=date_max,
+    )
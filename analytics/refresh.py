@@ -0,0 +1,147 @@
+"""Stale-while-revalidate holder for the loaded dataset.
+
+``current()`` returns the latest ready snapshot without touching the
+source, so serving a request never includes ingestion. A background thread
+polls the source fingerprint (paths, sizes, mtimes) and, when it changes,
+builds the new dataset (handing the loader the served one, which it may
+extend instead of starting over) and swaps the snapshot reference in one
+assignment.
+Readers that already hold the previous snapshot finish with it; the next
+read sees the new one.
+
+Anything ``warm`` precomputes from the dataset runs after the snapshot is
+published and outside the load lock: on the refresher thread, or on a
+separate warmer thread when the load ran on a caller's thread. Pages that
+need an aggregate before it is warm compute it themselves, and the shared
+single-flight layer makes them wait on the warmer's computation instead of
+starting a second one.
+
+Only the very first load (nothing to serve yet) runs on the caller's
+thread. A failed reload keeps the previous snapshot, records the error and
+is not retried until the source changes again.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+
+import pandas as pd
+
+from analytics.dataset import file_fingerprint, source_modified
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    dataset: object
+    fingerprint: str
+    source_modified: pd.Timestamp
+    loaded_at: pd.Timestamp
+    load_seconds: float
+
+
+class DatasetRefresher:
+    def __init__(self, source, load, warm=None, interval=REFRESH_SECONDS):
+        self.source = source
+        self.interval = interval
+        self._load = load           # (fingerprint, served dataset or None) -> dataset
+        self._warm = warm           # dataset -> None, precomputes aggregates
+        self._snapshot = None
+        self._lock = threading.Lock()         # one load at a time
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.loading = None         # fingerprint being built right now
+        self.warming = None         # fingerprint whose aggregates are being precomputed
+        self.failed = None          # (fingerprint, exception) of the last failed load
+
+    @property
+    def snapshot(self):
+        """Latest ready snapshot, or None before the first load."""
+        return self._snapshot
+
+    def current(self):
+        """Latest ready snapshot; loads on this thread only when there is none yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh(raise_errors=True)
+        return snapshot
+
+    def refresh(self, raise_errors=False):
+        """Load the source if its fingerprint changed; returns the current snapshot.
+
+        A newly loaded snapshot is returned as soon as it is published; its
+        warm-up runs afterwards (inline on the refresher thread, otherwise
+        on a background thread).
+        """
+        snapshot, published = self._reload(raise_errors)
+        if published and self._warm is not None:
+            if threading.current_thread() is self._thread:
+                self._run_warm(snapshot)
+            else:
+                threading.Thread(target=self._run_warm, args=(snapshot,), name="dataset-warmer", daemon=True).start()
+        return snapshot
+
+    def _run_warm(self, snapshot):
+        self.warming = snapshot.fingerprint
+        try:
+            self._warm(snapshot.dataset)
+        except Exception:
+            logger.exception("precomputing aggregates of version %s failed", snapshot.fingerprint)
+        finally:
+            self.warming = None
+
+    def _reload(self, raise_errors):
+        """(current snapshot, whether this call published it)."""
+        with self._lock:
+            fingerprint = file_fingerprint(self.source)
+            snapshot = self._snapshot
+            if fingerprint is None or (snapshot is not None and snapshot.fingerprint == fingerprint):
+                return snapshot, False
+            if not raise_errors and self.failed is not None and self.failed[0] == fingerprint:
+                return snapshot, False
+
+            self.loading = fingerprint
+            started = pd.Timestamp.now()
+            try:
+                modified = source_modified(self.source)
+                dataset = self._load(fingerprint, snapshot.dataset if snapshot is not None else None)
+            except Exception as e:
+                self.failed = (fingerprint, e)
+                if raise_errors:
+                    raise
+                logger.exception("reloading %s failed; still serving the previous version", self.source)
+                return snapshot, False
+            finally:
+                self.loading = None
+
+            if dataset is None:
+                return snapshot, False
+            self.failed = None
+            loaded_at = pd.Timestamp.now()
+            self._snapshot = Snapshot(
+                dataset, fingerprint, modified, loaded_at, (loaded_at - started).total_seconds()
+            )
+            logger.info("loaded %s version %s in %.1fs", self.source, fingerprint, self._snapshot.load_seconds)
+            return self._snapshot, True
+
+    def start(self):
+        """Start the polling thread (idempotent). Its first pass is the initial load."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="dataset-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("dataset refresh check failed")
+            self._stop.wait(self.interval)
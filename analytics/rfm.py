@@ -0,0 +1,158 @@
+"""Recency / frequency / monetary scoring as of any date.
+
+The order rows are sorted once by (customer key, day) and each order gets
+a composite key ``customer * n_days + day``, together with a running sum
+of net revenue in that order. For an as-of day every customer's history is
+then the run of rows from its first row up to
+``searchsorted(composite, customer * n_days + as_of, 'right')``, so
+frequency and monetary value are a difference of offsets and running sums,
+and the last order day is the row just before that position. Scoring a new
+as-of date costs one vectorized ``searchsorted`` over the customers and
+never rescans the orders.
+
+Scores are quintiles (1-5) cut at ``np.quantile`` edges of the customers
+active at the as-of date; segments come from the R x F score grid.
+"""
+import numpy as np
+import pandas as pd
+
+QUANTILES = [0.2, 0.4, 0.6, 0.8]
+
+# (recency scores, frequency scores) -> segment, painted onto a 5 x 5 grid
+SEGMENT_RULES = [
+    ('Hibernating', (1, 2), (1, 2)),
+    ('At Risk', (1, 2), (3, 4)),
+    ("Can't Lose Them", (1, 2), (5, 5)),
+    ('About to Sleep', (3, 3), (1, 2)),
+    ('Need Attention', (3, 3), (3, 3)),
+    ('Loyal Customers', (3, 4), (4, 5)),
+    ('Promising', (4, 4), (1, 1)),
+    ('New Customers', (5, 5), (1, 1)),
+    ('Potential Loyalists', (4, 5), (2, 3)),
+    ('Champions', (5, 5), (4, 5)),
+]
+SEGMENTS = [name for name, _, _ in SEGMENT_RULES]
+
+
+def _segment_grid():
+    grid = np.full((5, 5), -1, dtype=np.int64)
+    for code, (_, (r_lo, r_hi), (f_lo, f_hi)) in enumerate(SEGMENT_RULES):
+        grid[r_lo - 1:r_hi, f_lo - 1:f_hi] = code
+    return grid
+
+
+SEGMENT_GRID = _segment_grid()
+
+
+def quantile_scores(values, higher_is_better=True):
+    """1-5 quintile score of every value (edges from ``np.quantile``)."""
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    edges = np.quantile(values, QUANTILES)
+    below = np.searchsorted(edges, values, side='left')  # edges strictly below each value
+    return below + 1 if higher_is_better else 5 - below
+
+
+class RFMIndex:
+    def __init__(self, first_day, composite, days, cum_net, offsets, n_days):
+        self.first_day = first_day    # np.datetime64[D] of day 0
+        self.composite = composite    # customer * n_days + day, sorted
+        self.days = days              # day of each sorted row
+        self.cum_net = cum_net        # running net revenue, len(rows) + 1
+        self.offsets = offsets        # first sorted row of each customer, len(customers) + 1
+        self.n_days = n_days
+
+    @property
+    def n_customers(self):
+        return len(self.offsets) - 1
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(self.first_day + np.timedelta64(self.n_days - 1, 'D'))
+
+    def measures(self, as_of):
+        """Recency (days), frequency and monetary value of every customer key."""
+        day = int((np.datetime64(pd.Timestamp(as_of).date(), 'D') - self.first_day).astype(np.int64))
+        search_day = min(day, self.n_days - 1)
+        customers = np.arange(self.n_customers, dtype=np.int64)
+        if search_day < 0:
+            end = self.offsets[:-1]
+        else:
+            end = np.searchsorted(self.composite, customers * self.n_days + search_day, side='right')
+        start = self.offsets[:-1]
+
+        frequency = end - start
+        monetary = self.cum_net[end] - self.cum_net[start]
+        active = frequency > 0
+        last_day = np.where(active, self.days[np.maximum(end - 1, 0)], -1)
+        recency = np.where(active, day - last_day, -1)
+        return recency, frequency, monetary, active
+
+    def score(self, as_of):
+        """Per-customer RFM frame (index = customer key) for customers active by ``as_of``."""
+        recency, frequency, monetary, active = self.measures(as_of)
+        keys = np.flatnonzero(active)
+        recency, frequency, monetary = recency[keys], frequency[keys], monetary[keys]
+
+        r_score = quantile_scores(recency, higher_is_better=False)
+        f_score = quantile_scores(frequency)
+        m_score = quantile_scores(monetary)
+        segment = SEGMENT_GRID[r_score - 1, f_score - 1] if len(keys) else np.zeros(0, dtype=np.int64)
+
+        return pd.DataFrame({
+            'recency_days': recency,
+            'frequency': frequency,
+            'monetary': monetary,
+            'r_score': r_score,
+            'f_score': f_score,
+            'm_score': m_score,
+            'segment': pd.Categorical.from_codes(segment, categories=SEGMENTS),
+        }, index=pd.Index(keys, name='customer_key'))
+
+
+def segment_summary(scores):
+    """Customers, revenue and average R/F/M per segment."""
+    summary = scores.groupby('segment', observed=False).agg(
+        customers=('frequency', 'size'),
+        orders=('frequency', 'sum'),
+        monetary=('monetary', 'sum'),
+        recency_days=('recency_days', 'mean'),
+        avg_monetary=('monetary', 'mean'),
+    )
+    total_customers = max(summary['customers'].sum(), 1)
+    total_revenue = summary['monetary'].sum()
+    summary['customer_share'] = summary['customers'] / total_customers * 100
+    summary['revenue_share'] = summary['monetary'] / total_revenue * 100 if total_revenue else 0.0
+    return summary.reset_index()
+
+
+def build_rfm(df, customers):
+    """Sort the order rows by (customer, day) once. ``df`` must be date-sorted."""
+    if customers is None or 'date' not in df.columns:
+        return None
+
+    day = df['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    keys = customers.order_keys
+    valid = ~np.isnat(day) & (keys >= 0) & (keys < len(customers))
+    if not valid.any():
+        return None
+    first_day = day[valid].min()
+    n_days = int((day[valid].max() - first_day).astype(np.int64)) + 1
+
+    if 'net_revenue' in df.columns:
+        net = pd.to_numeric(df['net_revenue'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        net = np.nan_to_num(net[valid])
+    else:
+        net = np.zeros(int(valid.sum()))
+    keys = keys[valid]
+    rel_day = (day[valid] - first_day).astype(np.int64)
+
+    # Rows are date-sorted, so a stable sort by customer keeps each run in date order
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    days = rel_day[order]
+    composite = sorted_keys * n_days + days
+    cum_net = np.concatenate([[0.0], np.cumsum(net[order])])
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(sorted_keys, minlength=len(customers)))])
+
+    return RFMIndex(first_day, composite, days, cum_net, offsets, n_days)
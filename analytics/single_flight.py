@@ -0,0 +1,93 @@
+"""Single-flight execution: one computation per key, however many callers.
+
+When several threads ask for the same key at once, the first one runs the
+computation and the rest block until it finishes and share its result (or
+its exception). Nothing is kept once the flight lands, so the next call
+computes again; put a cache in front for reuse. Counters record how many
+calls ran, how many were coalesced onto another caller's flight and how
+long those callers waited.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class FlightStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    in_flight: int = 0
+
+    @property
+    def mean_wait_seconds(self):
+        return self.wait_seconds / self.coalesced if self.coalesced else 0.0
+
+
+class _Flight:
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._stats = FlightStats()
+
+    def do(self, key, compute):
+        """``compute()`` once for all concurrent callers of ``key``."""
+        with self._lock:
+            self._stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.executions += 1
+                self._stats.in_flight += 1
+            else:
+                flight.waiters += 1
+                self._stats.coalesced += 1
+
+        if not leader:
+            started = time.perf_counter()
+            flight.done.wait()
+            waited = time.perf_counter() - started
+            with self._lock:
+                self._stats.wait_seconds += waited
+                self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, waited)
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                self._stats.in_flight -= 1
+            flight.done.set()
+        return flight.value
+
+    def stats(self):
+        """Snapshot of the counters."""
+        with self._lock:
+            return FlightStats(**vars(self._stats))
+
+    def in_flight(self):
+        """{key: number of waiting callers} for computations running now."""
+        with self._lock:
+            return {key: flight.waiters for key, flight in self._flights.items()}
@@ -0,0 +1,218 @@
+"""Process-wide dataset and aggregate store shared by the UI and the JSON API.
+
+The served dataset comes from a ``DatasetRefresher``: when the source
+changes, the new dataset is built on the refresher thread and swapped in
+once ready, so requests never wait on ingestion (only the very first load
+of a process does). When the source only gained shards, just those are
+read and folded into the served dataset (``analytics.dataset.extend_dataset``).
+Its aggregates are precomputed right after the swap; a page that asks for
+one first joins that computation.
+
+Two cache tiers sit behind it: an in-process memo keeps the aggregates of
+the current and previous version, and the on-disk cache
+(``analytics.disk_cache``) lets a restarted process skip the CSV parse and
+the heavy aggregates. Cold computations go through a single-flight layer,
+so callers arriving together wait for one computation instead of each
+starting their own. Nothing here imports Streamlit.
+
+Per-filter-state views (``analytics.aggregates.VIEWS``) are keyed by their
+filters. Pages record the states they show in the access log. Views built
+on the request path stay in the in-process memo, because there are far too
+many filter states to write each one to disk. Every reload precomputes the
+most viewed states and persists only those, so the common dashboard and
+explorer views are cache hits, in this process and after a restart.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from analytics.access_log import WARM_TOP_K, AccessLog, hit_rate
+from analytics.aggregates import AGGREGATES, APPENDERS, PAGE_VIEWS, VIEWS, view_name
+from analytics.dataset import DATA_PATH, added_shards, build_dataset, extend_dataset, load_orders, source_keys
+from analytics.disk_cache import DiskCache
+from analytics.refresh import REFRESH_SECONDS, DatasetRefresher
+from analytics.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DISK_CACHE = DiskCache()
+FLIGHTS = SingleFlight()
+ACCESS_LOG = AccessLog()
+
+
+def _build_dataset(fingerprint, previous=None):
+    # Keys read before the files, so a shard rewritten mid-load forces a full reload next time
+    sources = source_keys(DATA_PATH)
+    paths = added_shards(previous, sources) if previous is not None else None
+    if paths:
+        logger.info("appending %d new shard(s) to version %s", len(paths), previous.fingerprint)
+        dataset, added = extend_dataset(previous, paths, fingerprint, sources)
+        _append_aggregates(previous, dataset, added)
+        return dataset
+    df, shards, validation = load_orders(DATA_PATH)
+    return build_dataset(df, fingerprint, shards, validation, sources)
+
+
+def load_dataset(fingerprint, previous=None):
+    """Dataset of source version ``fingerprint``, extending ``previous`` when only shards were added."""
+    return FLIGHTS.do(
+        ('dataset', fingerprint),
+        lambda: DISK_CACHE.cached('dataset', fingerprint, lambda: _build_dataset(fingerprint, previous))
+    )
+
+
+_aggregates = OrderedDict()     # (name, fingerprint) -> value, least recently used first
+_aggregates_lock = threading.Lock()
+# Two generations: callers still holding the previous snapshot keep their aggregates
+_AGGREGATES_KEPT = 2 * len(AGGREGATES)
+
+
+def has_aggregate(name, dataset):
+    return (name, dataset.fingerprint) in _aggregates
+
+
+def aggregate(name, dataset):
+    """Derived aggregate ``name`` (see ``analytics.aggregates``) of ``dataset``."""
+    key = (name, dataset.fingerprint)
+    with _aggregates_lock:
+        if key in _aggregates:
+            _aggregates.move_to_end(key)
+            return _aggregates[key]
+    value = FLIGHTS.do(
+        key, lambda: DISK_CACHE.cached(name, dataset.fingerprint, lambda: AGGREGATES[name](dataset))
+    )
+    _remember(key, value)
+    return value
+
+
+def _remember(key, value):
+    with _aggregates_lock:
+        _aggregates[key] = value
+        while len(_aggregates) > _AGGREGATES_KEPT:
+            _aggregates.popitem(last=False)
+
+
+def _append_aggregates(previous, dataset, added):
+    """Carry the ``APPENDERS`` aggregates of ``previous`` over to ``dataset`` with the ``added`` rows folded in.
+
+    Only values already built for ``previous`` (in memory or on disk) are
+    carried over; anything else is built from ``dataset`` when first asked for.
+    """
+    for name, append in APPENDERS.items():
+        with _aggregates_lock:
+            value = _aggregates.get((name, previous.fingerprint))
+        if value is None:
+            value = DISK_CACHE.get(name, previous.fingerprint)
+        if value is None:
+            continue
+        key = (name, dataset.fingerprint)
+        try:
+            _remember(key, FLIGHTS.do(
+                key, lambda: DISK_CACHE.cached(name, dataset.fingerprint, lambda: append(value, added))
+            ))
+        except Exception:
+            logger.exception("appending to %s failed; it is rebuilt on first use", name)
+
+
+_views = OrderedDict()          # (name, fingerprint, filters) -> value, least recently used first
+_VIEWS_KEPT = 64
+last_warm = None                # (hit rate before, after) of the latest warm_views with logged views
+
+
+def _view_key(name, dataset, filters):
+    return name, dataset.fingerprint, tuple(sorted(filters.items()))
+
+
+def has_view(name, dataset, filters):
+    return _view_key(name, dataset, filters) in _views
+
+
+def _build_view(name, dataset, filters):
+    value = DISK_CACHE.get(view_name(name, filters), dataset.fingerprint)
+    return VIEWS[name](dataset, **filters) if value is None else value
+
+
+def _persist_view(name, dataset, filters, value):
+    cache_name = view_name(name, filters)
+    if value is None or DISK_CACHE.contains(cache_name, dataset.fingerprint):
+        return
+    try:
+        DISK_CACHE.put(cache_name, dataset.fingerprint, value)
+    except OSError as e:
+        logger.warning("could not cache %s: %s", cache_name, e)
+
+
+def view(name, dataset, filters, persist=False):
+    """Per-filter-state view ``name`` (see ``analytics.aggregates.VIEWS``) of ``dataset``.
+
+    A warmed state is read from disk; anything else is computed and kept
+    in memory only, unless ``persist`` (the warmer) asks to store it.
+    """
+    key = _view_key(name, dataset, filters)
+    with _aggregates_lock:
+        memoized = key in _views
+        if memoized:
+            _views.move_to_end(key)
+            value = _views[key]
+    if not memoized:
+        value = FLIGHTS.do(key, lambda: _build_view(name, dataset, filters))
+        with _aggregates_lock:
+            _views[key] = value
+            while len(_views) > _VIEWS_KEPT:
+                _views.popitem(last=False)
+    # After the flight: a warmer that joined a page's computation still stores it
+    if persist:
+        _persist_view(name, dataset, filters, value)
+    return value
+
+
+def state_filters(state, dataset):
+    """Filters of the ``ViewState`` ``state`` against ``dataset``'s date span."""
+    return state.filters(dataset.profile.date_min, dataset.profile.date_max)
+
+
+def is_cached(state, dataset, cache=DISK_CACHE):
+    """Whether every view of ``state``'s page is on disk for ``dataset``."""
+    filters = state_filters(state, dataset)
+    return all(cache.contains(view_name(name, filters), dataset.fingerprint)
+               for name in PAGE_VIEWS.get(state.page, ()))
+
+
+def warm_views(dataset, k=WARM_TOP_K):
+    """Precompute the views of the ``k`` most viewed states; returns the hit rate (before, after)."""
+    global last_warm
+    counts = ACCESS_LOG.counts()
+    before = hit_rate(counts, lambda state: is_cached(state, dataset))
+    for state, _ in counts.most_common(k):
+        filters = state_filters(state, dataset)
+        for name in PAGE_VIEWS.get(state.page, ()):
+            try:
+                view(name, dataset, filters, persist=True)
+            except Exception:
+                logger.exception("precomputing %s for %s failed", name, state.describe())
+    after = hit_rate(counts, lambda state: is_cached(state, dataset))
+    if before is not None:
+        last_warm = (before, after)
+        logger.info("warmed the %d most viewed of %d states: hit rate %.1f%% -> %.1f%% of %d logged views",
+                    min(k, len(counts)), len(counts), before * 100, after * 100, sum(counts.values()))
+    return before, after
+
+
+def warm_aggregates(dataset):
+    # A failing aggregate only breaks what uses it, not the whole reload
+    for name in AGGREGATES:
+        try:
+            aggregate(name, dataset)
+        except Exception:
+            logger.exception("precomputing %s failed", name)
+    try:
+        warm_views(dataset)
+    except Exception:
+        logger.exception("warming the most viewed states failed")
+
+
+REFRESHER = DatasetRefresher(
+    DATA_PATH, load_dataset, warm=warm_aggregates,
+    interval=float(os.environ.get('ECOMMERCE_REFRESH_SECONDS', REFRESH_SECONDS))
+)
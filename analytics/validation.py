@@ -0,0 +1,220 @@
+"""Row validation applied to every chunk of orders as it is loaded.
+
+Each rule is a vectorized check that returns a boolean mask over the chunk.
+Rows failing any rule are moved to a quarantine CSV with a ``reason``
+column listing every failed rule code; the rest are kept. Per-rule counts
+are accumulated in a ``ValidationReport``. Downstream code can therefore
+rely on parsed dates, finite non-negative amounts and unique order ids.
+
+``roi`` is derived from the amounts and undefined when there was no
+discount; such values are set to NaN (counted as a repair, not quarantined).
+"""
+import os
+import warnings
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# Rule code -> description, in the order the codes appear in ``reason``
+RULES = {
+    'bad_date': "date missing or unparseable",
+    'non_finite': "amount missing, NaN or infinite",
+    'negative_amount': "amount below zero",
+    'net_exceeds_gross': "net_revenue greater than gross_revenue",
+    'duplicate_order_id': "order_id seen earlier in the load",
+}
+REPAIRS = {
+    'roi_undefined': "roi set to NaN (no discount, or not finite)",
+}
+
+AMOUNT_COLUMNS = ['quantity', 'gross_revenue', 'net_revenue', 'discount_amount', 'final_amount']
+NUMERIC_COLUMNS = AMOUNT_COLUMNS + [
+    'returned', 'roi', 'retention_score', 'satisfaction_rating', 'customer_lifetime_value'
+]
+DATE_COLUMNS = ['date', 'registration_date', 'month_date']
+# Rounding slack for net_revenue vs gross_revenue
+AMOUNT_TOLERANCE = 0.005
+# Largest order id tracked with a dense bitmap (bytes); larger ids use a sorted array
+BITMAP_LIMIT = 400_000_000
+
+
+@dataclass
+class ValidationReport:
+    rows_read: int = 0
+    rows_kept: int = 0
+    counts: dict = field(default_factory=lambda: dict.fromkeys(RULES, 0))
+    repairs: dict = field(default_factory=lambda: dict.fromkeys(REPAIRS, 0))
+    quarantine_path: str = None
+
+    @property
+    def quarantined(self):
+        return self.rows_read - self.rows_kept
+
+    def add(self, rows_read, rows_kept, counts, repairs):
+        self.rows_read += rows_read
+        self.rows_kept += rows_kept
+        for code, n in counts.items():
+            self.counts[code] += int(n)
+        for code, n in repairs.items():
+            self.repairs[code] += int(n)
+
+    def merge(self, other):
+        self.add(other.rows_read, other.rows_kept, other.counts, other.repairs)
+
+    def frame(self):
+        """One row per rule and repair with its row count."""
+        rows = [(code, 'quarantined', RULES[code], n) for code, n in self.counts.items()]
+        rows += [(code, 'repaired', REPAIRS[code], n) for code, n in self.repairs.items()]
+        return pd.DataFrame(rows, columns=['rule', 'action', 'description', 'rows'])
+
+
+class SeenIds:
+    """Order ids loaded so far: a growing bitmap for small non-negative
+    integers, a sorted array for other integers and an array of unique
+    values with hashed lookups for anything else (e.g. "ORD-001")."""
+
+    def __init__(self):
+        self._bits = np.zeros(0, dtype=bool)
+        self._sorted = None
+        self._values = None
+
+    def _to_sorted(self):
+        if self._sorted is None:
+            self._sorted = np.flatnonzero(self._bits)
+            self._bits = None
+
+    def _to_values(self):
+        if self._values is None:
+            self._to_sorted()
+            self._values = self._sorted.astype(object)
+            self._sorted = None
+
+    def seen(self, ids):
+        """Mask of ``ids`` already loaded or repeated earlier in ``ids``; records them."""
+        ids = np.asarray(ids)
+        repeated = pd.Series(ids).duplicated().to_numpy()
+        present = ~pd.isna(ids)
+        integer = np.issubdtype(ids.dtype, np.integer) and self._values is None
+        fits = (
+            integer
+            and self._sorted is None
+            and (not len(ids) or (ids.min() >= 0 and ids.max() < BITMAP_LIMIT))
+        )
+        if fits:
+            if len(ids) and ids.max() >= len(self._bits):
+                grown = np.zeros(max(int(ids.max()) + 1, 2 * len(self._bits)), dtype=bool)
+                grown[:len(self._bits)] = self._bits
+                self._bits = grown
+            before = self._bits[ids]
+            self._bits[ids] = True
+        elif integer:
+            self._to_sorted()
+            before = np.isin(ids, self._sorted)
+            merged = np.sort(np.concatenate([self._sorted, ids]))
+            self._sorted = merged[np.concatenate([[True], merged[1:] != merged[:-1]])] if len(merged) else merged
+        else:
+            # Strings, floats or mixed ids cannot be ordered against each other: hash them
+            self._to_values()
+            before = pd.Series(ids, dtype=object).isin(self._values).to_numpy()
+            self._values = pd.unique(np.concatenate([self._values, ids[present].astype(object)]))
+        return present & (before | repeated)
+
+
+def _to_datetime(values):
+    # ISO dates parse fast and do not depend on which value happens to come first;
+    # anything else falls back to per-column format inference
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    if (parsed.isna() & values.notna()).mean() > 0.5:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            parsed = pd.to_datetime(values, errors='coerce')
+    return parsed
+
+
+def coerce_types(chunk):
+    """Parse dates and numbers in place; unparseable values become NaT/NaN."""
+    for col in DATE_COLUMNS:
+        if col in chunk.columns and not pd.api.types.is_datetime64_any_dtype(chunk[col]):
+            chunk[col] = _to_datetime(chunk[col])
+    for col in NUMERIC_COLUMNS:
+        if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col]):
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+    return chunk
+
+
+def _amount(chunk, col):
+    return chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def validate_chunk(chunk, seen=None):
+    """Split a typed chunk into (kept, quarantined, counts, repairs).
+
+    ``seen`` carries order ids across chunks; without it duplicates are
+    only detected within the chunk. Quarantined rows get a ``reason``
+    column such as ``'non_finite;negative_amount'``.
+    """
+    n = len(chunk)
+    masks = {}
+    if 'date' in chunk.columns:
+        masks['bad_date'] = chunk['date'].isna().to_numpy()
+
+    amounts = [col for col in AMOUNT_COLUMNS if col in chunk.columns]
+    if amounts:
+        values = np.column_stack([_amount(chunk, col) for col in amounts])
+        masks['non_finite'] = ~np.isfinite(values).all(axis=1)
+        with np.errstate(invalid='ignore'):
+            masks['negative_amount'] = (values < 0).any(axis=1)
+    if 'net_revenue' in chunk.columns and 'gross_revenue' in chunk.columns:
+        with np.errstate(invalid='ignore'):
+            masks['net_exceeds_gross'] = _amount(chunk, 'net_revenue') > _amount(chunk, 'gross_revenue') + AMOUNT_TOLERANCE
+    if 'order_id' in chunk.columns:
+        ids = chunk['order_id'].to_numpy()
+        masks['duplicate_order_id'] = (seen if seen is not None else SeenIds()).seen(ids)
+
+    # One bit per rule, so each distinct combination is spelled out once
+    codes = [code for code in RULES if code in masks]
+    flags = np.zeros(n, dtype=np.int64)
+    for bit, code in enumerate(codes):
+        flags |= masks[code].astype(np.int64) << bit
+    bad = flags != 0
+
+    quarantined = chunk[bad].copy()
+    if len(quarantined):
+        combos, inverse = np.unique(flags[bad], return_inverse=True)
+        labels = np.array([';'.join(c for bit, c in enumerate(codes) if combo >> bit & 1) for combo in combos])
+        quarantined['reason'] = labels[inverse]
+    kept = chunk[~bad]
+
+    repairs = {}
+    if 'roi' in kept.columns:
+        roi = _amount(kept, 'roi')
+        undefined = ~np.isfinite(roi)
+        if 'discount_amount' in kept.columns:
+            undefined |= _amount(kept, 'discount_amount') == 0
+        repairs['roi_undefined'] = int((undefined & ~np.isnan(roi)).sum())
+        if repairs['roi_undefined']:
+            kept = kept.copy()
+            kept['roi'] = np.where(undefined, np.nan, roi)
+
+    counts = {code: int(mask.sum()) for code, mask in masks.items()}
+    return kept, quarantined, counts, repairs
+
+
+class Quarantine:
+    """Appends quarantined rows to one CSV per load (truncated on first write unless ``append``)."""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.rows = 0
+
+    def write(self, rows):
+        if self.path is None or not len(rows):
+            return
+        fresh = not self.rows and not (self.append and os.path.exists(self.path))
+        rows.to_csv(self.path, mode='w' if fresh else 'a', header=fresh, index=False)
+        self.rows += len(rows)
+
+    def report_path(self):
+        return os.path.abspath(self.path) if self.rows else None
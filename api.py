@@ -0,0 +1,317 @@
+"""Headless JSON API over the dashboard metrics.
+
+Serves the same numbers as the Analytics Dashboard from the same engine
+(``analytics.metrics``) and the same dataset store (``analytics.store``):
+the dataset is reloaded in the background when the source changes, and
+aggregates come from the shared in-process and on-disk caches. The
+breakdown, trend and channel tables are the Dashboard's own per-filter-state
+view (``dashboard_tables``), so a filter state either side has computed, or
+the cache warmer has precomputed, is served without touching the rows.
+
+Every endpoint accepts the sidebar filters as query parameters:
+``channel`` (default 'All Channels'), ``start`` and ``end`` (YYYY-MM-DD,
+inclusive). Responses carry an ETag derived from the data fingerprint, the
+code version, the path and the normalized parameters (the filters plus the
+endpoint's own parameters with their defaults filled in; anything else is
+ignored), so it is known before anything is computed: a matching
+``If-None-Match`` gets a 304 straight away, equivalent requests share one
+cached response, and identical concurrent requests share one computation.
+
+Endpoints:
+    GET /api/health
+    GET /api/kpis/overall
+    GET /api/kpis/{category|campaign|channel|segment|region|month|quarter|season}
+    GET /api/trends/monthly?by=channel|total
+    GET /api/channels/summary
+    GET /api/channels/performance
+    GET /api/forecast?measure=net_revenue|conversions&horizon=6&level=80
+
+Usage:
+    python api.py                      # http://127.0.0.1:8600
+    python api.py --host 0.0.0.0 --port 9000
+"""
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+import pandas as pd
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from analytics import store
+from analytics.access_log import normalize_state
+from analytics.filters import is_no_filter
+from analytics.forecast import Z_SCORES
+from analytics.metrics import BREAKDOWNS, overall_kpis
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_SIZE = 512
+
+
+class BadRequest(ValueError):
+    pass
+
+
+# =============================================================================
+# PARAMETERS
+# =============================================================================
+def _date(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return pd.Timestamp(value).normalize()
+    except ValueError:
+        raise BadRequest(f"{name} must be a date (YYYY-MM-DD), got {value!r}")
+
+
+def _int(params, name, default, allowed):
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+    if value not in allowed:
+        raise BadRequest(f"{name} must be one of {min(allowed)}..{max(allowed)}" if isinstance(allowed, range)
+                         else f"{name} must be one of {sorted(allowed)}")
+    return value
+
+
+def filters(params):
+    """Normalized sidebar filters: (channel or None, start, end)."""
+    channel = params.get('channel') or None
+    if is_no_filter(channel):
+        channel = None
+    return channel, _date(params, 'start'), _date(params, 'end')
+
+
+def normalize(path, params):
+    """Canonical query of ``path``: the filters plus the endpoint's own ``PARAMS``, defaults filled in."""
+    channel, start, end = filters(params)
+    query = {'channel': channel,
+             'start': None if start is None else f"{start:%Y-%m-%d}",
+             'end': None if end is None else f"{end:%Y-%m-%d}"}
+    for name, default in PARAMS.get(path, {}).items():
+        value = params.get(name) or default
+        if isinstance(default, int):
+            try:
+                value = int(value)
+            except ValueError:
+                pass    # rejected by the endpoint
+        query[name] = value
+    return query
+
+
+def _tables(dataset, params):
+    """The Dashboard's tables for the filters in ``params``, from the shared view cache."""
+    channel, start, end = filters(params)
+    profile = dataset.profile
+    state = normalize_state('dashboard', profile.date_min, profile.date_max, channel=channel, start=start, end=end)
+    return store.view('dashboard_tables', dataset, store.state_filters(state, dataset))
+
+
+# =============================================================================
+# ENDPOINTS: (dataset, query params) -> (meta, DataFrame) or meta
+# =============================================================================
+def overall(dataset, params):
+    if dataset.periods is None:
+        raise BadRequest("overall KPIs need a date column")
+    channel, start, end = filters(params)
+    kpis, n_days = overall_kpis(dataset.periods, channel, start, end)
+    frame = pd.DataFrame([
+        {'kpi': name, 'current': delta.current, 'previous': delta.previous,
+         'change': delta.change, 'pct_change': delta.pct_change}
+        for name, delta in kpis.items()
+    ])
+    return {'days': n_days}, frame
+
+
+def breakdown(dataset, params, name):
+    frame = _tables(dataset, params)[name]
+    if frame is None:
+        raise BadRequest(f"column for {name!r} not in the data")
+    return {'dimension': name}, frame
+
+
+def trends(dataset, params):
+    by = params.get('by', 'channel')
+    if by not in ('channel', 'total'):
+        raise BadRequest("by must be 'channel' or 'total'")
+    frame = _tables(dataset, params)['trends_by_channel' if by == 'channel' else 'trends_total']
+    if frame is None:
+        raise BadRequest("monthly trends need month_date and marketing_channel columns")
+    return {'by': by}, frame
+
+
+def summary(dataset, params):
+    frame = _tables(dataset, params)['summary']
+    if frame is None:
+        raise BadRequest("the channel summary needs marketing_channel, customer_id and roi columns")
+    return {}, frame.reset_index()
+
+
+def performance(dataset, params):
+    frame = _tables(dataset, params)['performance']
+    if frame is None:
+        raise BadRequest("channel performance needs a marketing_channel column")
+    return {}, frame
+
+
+def forecast(dataset, params):
+    models = store.aggregate('forecasts', dataset)
+    measure = params.get('measure', 'net_revenue')
+    if not models or measure not in models:
+        raise BadRequest(f"no forecast for measure {measure!r}")
+    horizon = _int(params, 'horizon', 6, range(1, 25))
+    level = _int(params, 'level', 80, Z_SCORES)
+    channel, _, _ = filters(params)
+    model = models[measure]
+    series = channel if channel in model.labels else 'All Channels'
+    return {'measure': measure, 'series': series, 'horizon': horizon, 'level': level}, \
+        model.frame(model.labels.get_loc(series), horizon, level)
+
+
+ENDPOINTS = {
+    '/api/kpis/overall': overall,
+    '/api/trends/monthly': trends,
+    '/api/channels/summary': summary,
+    '/api/channels/performance': performance,
+    '/api/forecast': forecast,
+}
+for _name in BREAKDOWNS:
+    ENDPOINTS[f'/api/kpis/{_name}'] = lambda dataset, params, name=_name: breakdown(dataset, params, name)
+
+# Parameters an endpoint reads besides the filters, with their defaults
+PARAMS = {
+    '/api/trends/monthly': {'by': 'channel'},
+    '/api/forecast': {'measure': 'net_revenue', 'horizon': 6, 'level': 80},
+}
+
+
+# =============================================================================
+# RESPONSES
+# =============================================================================
+_responses = OrderedDict()      # etag -> body bytes, least recently used first
+_responses_lock = threading.Lock()
+
+
+def etag(snapshot, path, params):
+    key = json.dumps([snapshot.fingerprint, store.DISK_CACHE.version, path, sorted(params.items())])
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+def _body(snapshot, path, params):
+    result = ENDPOINTS[path](snapshot.dataset, params)
+    meta, frame = result if isinstance(result, tuple) else (result, None)
+    meta = {
+        'fingerprint': snapshot.fingerprint,
+        'data_as_of': snapshot.source_modified.isoformat() if snapshot.source_modified is not None else None,
+        'filters': dict(params),
+        **meta,
+    }
+    rows = frame.to_json(orient='records', date_format='iso') if frame is not None else 'null'
+    return f'{{"meta": {json.dumps(meta, default=str)}, "rows": {rows}}}'.encode()
+
+
+def _lookup(tag):
+    with _responses_lock:
+        if tag in _responses:
+            _responses.move_to_end(tag)
+            return _responses[tag]
+    return None
+
+
+def _cached_body(tag, snapshot, path, params):
+    body = _lookup(tag)
+    if body is not None:
+        return body
+    body = store.FLIGHTS.do(('api', tag), lambda: _body(snapshot, path, params))
+    with _responses_lock:
+        _responses[tag] = body
+        while len(_responses) > RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
+    return body
+
+
+def _not_modified(request, tag):
+    header = request.headers.get('if-none-match', '')
+    return header.strip() == '*' or tag in [part.strip() for part in header.split(',')]
+
+
+async def _snapshot():
+    snapshot = store.REFRESHER.snapshot
+    if snapshot is None:
+        snapshot = await run_in_threadpool(store.REFRESHER.current)
+    return snapshot
+
+
+async def metrics(request):
+    snapshot = await _snapshot()
+    if snapshot is None:
+        return JSONResponse({'error': 'no data loaded'}, status_code=503)
+    path = request.url.path
+    try:
+        params = normalize(path, request.query_params)
+    except BadRequest as e:
+        return JSONResponse({'error': str(e)}, status_code=400)
+    tag = etag(snapshot, path, params)
+    headers = {'ETag': tag, 'Cache-Control': 'no-cache'}
+    if _not_modified(request, tag):
+        return Response(status_code=304, headers=headers)
+    # Hits are answered on the event loop; only computations go to a worker thread
+    body = _lookup(tag)
+    try:
+        if body is None:
+            body = await run_in_threadpool(_cached_body, tag, snapshot, path, params)
+    except BadRequest as e:
+        return JSONResponse({'error': str(e)}, status_code=400)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+async def health(request):
+    snapshot = store.REFRESHER.snapshot
+    flights = store.FLIGHTS.stats()
+    return JSONResponse({
+        'ready': snapshot is not None,
+        'fingerprint': snapshot.fingerprint if snapshot else None,
+        'data_as_of': snapshot.source_modified.isoformat() if snapshot and snapshot.source_modified is not None else None,
+        'rows': snapshot.dataset.profile.n_rows if snapshot else None,
+        'reloading': store.REFRESHER.loading is not None,
+        'cached_responses': len(_responses),
+        'coalesced_calls': flights.coalesced,
+    })
+
+
+@asynccontextmanager
+async def lifespan(app):
+    store.REFRESHER.start()
+    yield
+    store.REFRESHER.stop()
+
+
+app = Starlette(
+    routes=[Route('/api/health', health)] + [Route(path, metrics) for path in ENDPOINTS],
+    lifespan=lifespan,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard metrics as JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--log-level', default='warning')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    print(f"📡 Serving metrics on http://{args.host}:{args.port}/api/health")
+    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+
+
+if __name__ == '__main__':
+    main()
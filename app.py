@@ -1,9 +1,9 @@
+import importlib
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
+
+from views.data import load_data, render_freshness, start_refresher
+from views.theme import apply_theme
 
 # =============================================================================
 # E-COMMERCE THEME (Professional Blue/Green)
@@ -15,195 +15,34 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown(
-    """
-    <style>
-    :root {
-      --primary-blue: #1f77b4;
-      --secondary-green: #2ecc71;
-      --bg-dark: #0f1419;
-      --panel-dark: #1a1f2e;
-      --text-light: #f5f5f5;
-      --accent-cyan: #00d9ff;
-      --warning-orange: #ff9800;
-    }
-
-    html, body, .stApp {
-      background: linear-gradient(135deg, #0f1419 0%, #1a1f2e 100%) !important;
-      color: var(--text-light) !important;
-    }
-
-    h1, h2, h3, h4, h5, h6,
-    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
-      color: var(--accent-cyan) !important;
-      text-shadow: 0 0 10px rgba(0, 217, 255, 0.3);
-      font-weight: 700 !important;
-    }
-
-    section[data-testid="stSidebar"] {
-      background: linear-gradient(180deg, #1a1f2e 0%, #0f1419 100%) !important;
-      border-right: 2px solid var(--primary-blue);
-    }
-
-    section[data-testid="stSidebar"] * {
-      color: var(--text-light) !important;
-    }
-
-    section[data-testid="stSidebar"] .stSelectbox label,
-    section[data-testid="stSidebar"] .stDateInput label {
-      color: var(--accent-cyan) !important;
-      font-weight: 600 !important;
-    }
-
-    div.stButton > button {
-      background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-green) 100%) !important;
-      color: white !important;
-      border: none !important;
-      font-weight: 700 !important;
-      padding: 0.6rem 2rem !important;
-      border-radius: 8px !important;
-      box-shadow: 0 4px 15px rgba(31, 119, 180, 0.4) !important;
-      transition: all 0.3s ease !important;
-    }
-
-    div.stButton > button:hover {
-      transform: translateY(-2px) !important;
-      box-shadow: 0 6px 20px rgba(31, 119, 180, 0.6) !important;
-    }
-
-    [data-testid="stMetricValue"] {
-      color: var(--secondary-green) !important;
-      font-size: 2rem !important;
-      font-weight: 700 !important;
-    }
-
-    [data-testid="stMetricLabel"] {
-      color: var(--accent-cyan) !important;
-      font-weight: 600 !important;
-    }
-
-    div[data-testid="stExpander"] {
-      background-color: var(--panel-dark) !important;
-      border: 1px solid var(--primary-blue) !important;
-      border-radius: 10px !important;
-    }
-
-    .stDataFrame {
-      background-color: var(--panel-dark) !important;
-    }
-
-    .stTabs [data-baseweb="tab-list"] {
-      gap: 8px;
-      background-color: transparent;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-      background-color: var(--panel-dark);
-      border-radius: 8px 8px 0 0;
-      color: var(--text-light);
-      border: 1px solid var(--primary-blue);
-      padding: 10px 20px;
-    }
-
-    .stTabs [aria-selected="true"] {
-      background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-green) 100%);
-      color: white;
-    }
-
-    .stAlert {
-      background-color: var(--panel-dark) !important;
-      border-left: 4px solid var(--accent-cyan) !important;
-    }
-
-    a {
-      color: var(--accent-cyan) !important;
-      text-decoration: none !important;
-    }
-
-    a:hover {
-      color: var(--secondary-green) !important;
-    }
-
-    hr {
-      border-color: var(--primary-blue) !important;
-      opacity: 0.3 !important;
-    }
-
-    .stDownloadButton > button {
-      background-color: var(--secondary-green) !important;
-      color: white !important;
-    }
-
-    .metric-card {
-      background: linear-gradient(135deg, var(--panel-dark) 0%, rgba(31, 119, 180, 0.1) 100%);
-      padding: 1.5rem;
-      border-radius: 12px;
-      border: 1px solid var(--primary-blue);
-      box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
-      text-align: center;
-      margin-bottom: 1rem;
-    }
-
-    .metric-value {
-      font-size: 2.5rem;
-      font-weight: 700;
-      color: var(--secondary-green);
-      margin: 0.5rem 0;
-    }
-
-    .metric-label {
-      font-size: 1rem;
-      color: var(--accent-cyan);
-      font-weight: 600;
-    }
-
-    .footer {
-      text-align: center;
-      padding: 2rem;
-      color: var(--text-light);
-      opacity: 0.7;
-      border-top: 1px solid var(--primary-blue);
-      margin-top: 3rem;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# =============================================================================
-# DATA LOADING
-# =============================================================================
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv('cleaned_data.csv')
-
-        # Date conversions
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            if 'month_date' not in df.columns:
-                df['month_date'] = df['date'].dt.to_period('M').dt.to_timestamp()
+apply_theme()
 
-        if 'registration_date' in df.columns:
-            df['registration_date'] = pd.to_datetime(df['registration_date'], errors='coerce')
-
-        return df
-    except FileNotFoundError:
-        st.error("⚠️ File 'cleaned_data.csv' not found!")
-        return None
-    except Exception as e:
-        st.error(f"❌ Error loading data: {str(e)}")
-        return None
+# Kick off the dataset load in the background on the first run of this server
+# process, so the Home page paints while caches fill. The same thread later
+# reloads the data when the source changes, without blocking page loads.
+start_refresher()
 
 # =============================================================================
 # SIDEBAR NAVIGATION
 # =============================================================================
+# Page modules are imported on demand: Plotly is only loaded when a chart page
+# is rendered.
+PAGES = {
+    "🏠 Home": "views.home",
+    "📊 Analytics Dashboard": "views.dashboard",
+    "👥 Customers": "views.customers",
+    "🧮 Pivot Builder": "views.pivot",
+    "🧪 Budget What-If": "views.whatif",
+    "🔍 Data Explorer": "views.explorer",
+    "ℹ️ About": "views.about",
+}
+
 st.sidebar.title("🧭 Navigation")
 st.sidebar.markdown("---")
 
 page = st.sidebar.radio(
     "Select Page",
-    ["🏠 Home", "📊 Analytics Dashboard", "🔍 Data Explorer", "ℹ️ About"],
+    list(PAGES),
     index=0
 )
 
@@ -211,1771 +50,7 @@ st.sidebar.markdown("---")
 st.sidebar.info("💡 **Tip**: Use filters in Analytics Dashboard for detailed insights")
 
 # Load data
-df = load_data()
-
-# =============================================================================
-# HOME PAGE
-# =============================================================================
-if page == "🏠 Home":
-    st.markdown("""
-        <div style='text-align: center; padding: 2rem 0;'>
-            <h1 style='font-size: 3.5rem; margin-bottom: 0;'>🛒 E-commerce Analytics Pro</h1>
-            <p style='font-size: 1.3rem; color: #00d9ff; margin-top: 0.5rem;'>
-                Advanced Business Intelligence Dashboard
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    if df is not None:
-        # Quick Stats
-        st.header("📈 Quick Overview")
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        total_revenue = df['net_revenue'].sum() if 'net_revenue' in df.columns else 0
-        total_orders = len(df)
-        total_customers = df['customer_id'].nunique() if 'customer_id' in df.columns else 0
-        avg_order = df['final_amount'].mean() if 'final_amount' in df.columns else 0
-
-        with col1:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>💰 Total Revenue</div>
-                    <div class='metric-value'>${total_revenue:,.0f}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>📦 Total Orders</div>
-                    <div class='metric-value'>{total_orders:,}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>👥 Customers</div>
-                    <div class='metric-value'>{total_customers:,}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>🛍️ Avg Order</div>
-                    <div class='metric-value'>${avg_order:,.2f}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Features Section
-        st.header("🚀 Key Features")
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-                ### 📊 Analytics Dashboard
-                - 15+ Interactive charts
-                - 8 Key Performance Indicators
-                - Real-time filtering
-                - Multi-dimensional analysis
-            """)
-
-        with col2:
-            st.markdown("""
-                ### 🔍 Data Explorer
-                - Advanced filtering
-                - Sortable data table
-                - Export to CSV
-                - Search capabilities
-            """)
-
-        with col3:
-            st.markdown("""
-                ### 📈 Insights
-                - Revenue trends
-                - Customer segmentation
-                - Marketing ROI
-                - Channel performance
-            """)
-
-        st.markdown("---")
-
-        # Dataset Info
-        st.header("📋 Dataset Information")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown(f"""
-                **Records**: {len(df):,}  
-                **Columns**: {len(df.columns)}  
-                **Date Range**: {df['date'].min().strftime('%Y-%m-%d') if 'date' in df.columns else 'N/A'} 
-                to {df['date'].max().strftime('%Y-%m-%d') if 'date' in df.columns else 'N/A'}
-            """)
-
-        with col2:
-            if st.button("📋 View Column Names"):
-                st.write(df.columns.tolist())
-
-        with st.expander("👁️ Preview Data (First 10 Rows)"):
-            st.dataframe(df.head(10), use_container_width=True)
-
-        st.markdown("---")
-
-        # ========== INSIGHTS SECTION ==========
-        st.header("💡 Key Business Insights")
-
-        # Row 1: Channel Performance Overview
-        st.subheader("📌 Channel Performance Highlights")
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>🏆 Highest Revenue</div>
-                    <div class='metric-value' style='font-size: 1.5rem;'>Email</div>
-                    <p style='color: #2ecc71; margin: 0;'>$2,664,421</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>⚡ Best ROI</div>
-                    <div class='metric-value' style='font-size: 1.5rem;'>Email</div>
-                    <p style='color: #2ecc71; margin: 0;'>140.65%</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>👥 Most Conversions</div>
-                    <div class='metric-value' style='font-size: 1.5rem;'>Direct</div>
-                    <p style='color: #2ecc71; margin: 0;'>1,066 customers</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>📈 Revenue Growth</div>
-                    <div class='metric-value' style='font-size: 1.5rem;'>+8,414%</div>
-                    <p style='color: #2ecc71; margin: 0;'>Jan 2021 - 2024</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Row 2: Customer Value & Efficiency
-        st.subheader("💰 Customer Value Analysis")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-                ### 💵 Revenue per Customer
-                - **Highest:** Email ($2,501.80)
-                - **Lowest:** Search Engine ($2,126.74)
-                - **Average:** ~$2,300
-            """)
-
-        with col2:
-            st.markdown("""
-                ### ⚡ Efficiency Ranking
-                1. **Email** - Score: 99.19 🥇
-                2. **Radio** - Score: 95.46 🥈
-                3. **Direct** - Score: 95.39 🥉
-            """)
-
-        with col3:
-            st.markdown("""
-                ### 🎯 Best Acquisition
-                - **Radio:** 84.98% rate
-                - **Email:** 82.7% rate
-                - **Social Media:** High engagement
-            """)
-
-        st.markdown("---")
-
-        # Row 3: Detailed Channel Analysis
-        st.subheader("🔍 Channel Performance Breakdown")
-
-        with st.expander("📊 View All Channels Performance"):
-            channels_data = {
-                'Channel': ['Email', 'Direct', 'Social Media', 'Outdoor', 'Print', 'Affiliate', 'Influencer', 'Mobile App', 'Referral', 'Radio', 'TV', 'Search Engine'],
-                'Spend': [18810, 19704, 20029, 20320, 18910, 18454, 19064, 18494, 18739, 18661, 18980, 19280],
-                'Revenue': [2664421.06, 2558265.78, 2542261.76, 2464162.33, 2424964.46, 2269248.63, 2355706.59, 2314844.33, 2346574.16, 2331049.15, 2381122.24, 2192672.20],
-                'Conversions': [1065, 1066, 1066, 1019, 1031, 1005, 1030, 1008, 1015, 1024, 998, 1031],
-                'ROI (%)': [140.65, 128.83, 125.93, 120.27, 127.24, 121.97, 122.57, 124.17, 124.22, 123.92, 124.45, 112.73],
-                'Performance': ['🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent']
-            }
-
-            channels_df = pd.DataFrame(channels_data)
-            channels_df = channels_df.sort_values('ROI (%)', ascending=False)
+dataset = load_data()
+render_freshness()
 
-            st.dataframe(
-                channels_df.style.format({
-                    'Spend': '${:,.0f}',
-                    'Revenue': '${:,.2f}',
-                    'Conversions': '{:,}',
-                    'ROI (%)': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-
-        st.markdown("---")
-
-        # Row 4: Growth Metrics & Trends
-        st.subheader("📈 Growth Metrics & Trends")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-                ### 📊 Monthly Revenue Trend
-                - **Starting Point:** $16,734 (Jan 2021)
-                - **Peak Performance:** $1,563,867 (July 2023)
-                - **Current Level:** $1M+ per month
-                - **Growth Rate:** +8,414% 🚀
-
-                **Pattern:**
-                - Rapid growth phase: Mid 2021 - 2022
-                - Stabilization: 2023-2024 at high levels
-                - All channels show upward trends
-            """)
-
-        with col2:
-            st.markdown("""
-                ### 👥 Monthly Conversions Trend
-                - **Starting Point:** 13 customers (Jan 2021)
-                - **Peak Performance:** 696 customers (July 2023)
-                - **Current Level:** 500+ customers/month
-                - **Growth Rate:** +5,046% 🚀
-
-                **Key Observation:**
-                - Customer acquisition mirrors revenue growth
-                - Strong seasonality across all channels
-                - Direct channel leads in total conversions
-            """)
-
-        st.markdown("---")
-
-        # Row 5: Key Correlations
-        st.subheader("🔗 Key Business Correlations")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>Customers → Revenue</div>
-                    <div class='metric-value' style='font-size: 2rem; color: #2ecc71;'>0.740</div>
-                    <p style='color: #00d9ff; margin: 0;'>✅ Strong Correlation</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>Orders → Revenue</div>
-                    <div class='metric-value' style='font-size: 2rem; color: #2ecc71;'>0.784</div>
-                    <p style='color: #00d9ff; margin: 0;'>✅ Strong Correlation</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown("""
-                <div class='metric-card'>
-                    <div class='metric-label'>Avg Price → Revenue</div>
-                    <div class='metric-value' style='font-size: 2rem; color: #ff9800;'>0.543</div>
-                    <p style='color: #ff9800; margin: 0;'>⚠️ Moderate Correlation</p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Row 6: Strategic Recommendations
-        st.subheader("💡 Strategic Recommendations")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.success("""
-                ### 🎯 Top Priorities
-
-                **1. Scale Email Marketing**
-                - Highest efficiency score (99.19)
-                - Best revenue per customer ($2,501.80)
-                - Recommendation: Increase budget by 20-30%
-
-                **2. Optimize Radio Campaigns**
-                - Best acquisition rate (84.98%)
-                - High efficiency score (95.46)
-                - Recommendation: A/B test for better conversion
-
-                **3. Strengthen Direct Channel**
-                - Most conversions (1,066 customers)
-                - Strong organic performance
-                - Recommendation: Optimize landing pages & SEO
-            """)
-
-        with col2:
-            st.warning("""
-                ### ⚠️ Areas for Improvement
-
-                **1. Search Engine Optimization**
-                - Lowest ROI (112.73%) among channels
-                - Still profitable but needs attention
-                - Recommendation: Improve ad quality scores
-
-                **2. Cost Efficiency**
-                - Outdoor has highest spend ($20,320)
-                - Recommendation: Optimize cost per acquisition
-
-                **3. Monitoring & Benchmarks**
-                - Track monthly ROI trends
-                - Monitor customer lifetime value by channel
-                - Target: ROI > 130% for all channels
-            """)
-
-        st.markdown("---")
-
-        # Row 7: Key Takeaways
-        st.info("""
-            ### ✅ Key Takeaways
-
-            - **All channels are profitable** - ROI ranges from 112.73% to 140.65%
-            - **Email dominates** in revenue, efficiency, and customer value
-            - **Explosive growth** achieved (+8,414% revenue, +5,046% conversions)
-            - **Strong fundamentals** - High correlation between customers/orders and revenue
-            - **Seasonal patterns** affect all channels equally - plan accordingly
-            - **Direct traffic** shows strong organic brand presence
-            - **Focus on top 3 performers** (Email, Radio, Direct) for maximum ROI
-        """)
-
-
-    else:
-        st.warning("⚠️ No data available. Please check the CSV file.")
-
-# =============================================================================
-# ANALYTICS DASHBOARD
-# =============================================================================
-elif page == "📊 Analytics Dashboard":
-    st.title("📊 Analytics Dashboard")
-    st.markdown("Interactive visualizations with real-time filtering")
-
-    if df is None:
-        st.error("❌ Data not loaded!")
-        st.stop()
-
-    # ========== FILTERS ==========
-    st.sidebar.header("🔍 Filters")
-
-    # Channel filter
-    if 'marketing_channel' in df.columns:
-        channels = ['All Channels'] + sorted(df['marketing_channel'].dropna().unique().tolist())
-        selected_channel = st.sidebar.selectbox("Marketing Channel", channels)
-    else:
-        selected_channel = 'All Channels'
-
-    # Date filter
-    if 'month_date' in df.columns:
-        min_date = df['month_date'].min()
-        max_date = df['month_date'].max()
-        date_range = st.sidebar.date_input(
-            "Date Range",
-            value=(min_date, max_date),
-            min_value=min_date,
-            max_value=max_date
-        )
-    else:
-        date_range = []
-
-    # Apply filters
-    filtered_df = df.copy()
-
-    if selected_channel != 'All Channels' and 'marketing_channel' in df.columns:
-        filtered_df = filtered_df[filtered_df['marketing_channel'] == selected_channel]
-
-    if len(date_range) == 2 and 'month_date' in df.columns:
-        start_date, end_date = date_range
-        filtered_df = filtered_df[
-            (filtered_df['month_date'] >= pd.to_datetime(start_date)) &
-            (filtered_df['month_date'] <= pd.to_datetime(end_date))
-        ]
-
-    st.sidebar.success(f"📊 Showing {len(filtered_df):,} / {len(df):,} records")
-
-     # ========== KPIs ==========
-    st.header("📈 Key Performance Indicators")
-    
-    # إنشاء tabs للـ KPIs المختلفة
-    kpi_tabs = st.tabs([
-        "📊 Overall", 
-        "📦 By Category", 
-        "📢 By Campaign", 
-        "📡 By Channel", 
-        "👥 By Segment", 
-        "🗺️ By Region", 
-        "📅 By Time"
-    ])
-    
-        # ========== TAB 1: OVERALL KPIs WITH GROWTH RATES ==========
-    with kpi_tabs[0]:
-     col1, col2, col3 = st.columns(3)
-    
-    # Current Period Metrics
-    total_revenue = filtered_df['net_revenue'].sum() if 'net_revenue' in filtered_df.columns else 0
-    total_customers = filtered_df['customer_id'].nunique() if 'customer_id' in filtered_df.columns else 0
-    total_orders = len(filtered_df)
-    avg_order_value = filtered_df['final_amount'].mean() if 'final_amount' in filtered_df.columns else 0
-    conversion_rate = (total_customers / total_orders * 100) if total_orders > 0 else 0
-    return_rate = (filtered_df['returned'].sum() / total_orders * 100) if total_orders > 0 and 'returned' in filtered_df.columns else 0
-    avg_satisfaction = filtered_df['satisfaction_rating'].mean() if 'satisfaction_rating' in filtered_df.columns else 0
-    
-    # Calculate Growth Rates (First Month vs Last Month)
-    if 'month_date' in df.columns:
-        monthly_total_sorted = df.groupby('month_date').agg({
-            'net_revenue': 'sum',
-            'customer_id': 'nunique'
-        }).reset_index().sort_values('month_date')
-        
-        first_month_rev = monthly_total_sorted.iloc[0]['net_revenue']
-        last_month_rev = monthly_total_sorted.iloc[-1]['net_revenue']
-        revenue_growth = ((last_month_rev - first_month_rev) / first_month_rev * 100) if first_month_rev > 0 else 0
-        
-        first_month_conv = monthly_total_sorted.iloc[0]['customer_id']
-        last_month_conv = monthly_total_sorted.iloc[-1]['customer_id']
-        conv_growth = ((last_month_conv - first_month_conv) / first_month_conv * 100) if first_month_conv > 0 else 0
-    else:
-        revenue_growth = 0
-        conv_growth = 0
-    
-    revenue_delta = revenue_growth
-    customers_delta = conv_growth
-    orders_delta = 2.5
-    order_value_delta = 1.8
-    conversion_delta = 0.3
-    return_delta = -0.5
-    satisfaction_delta = 0.1
-    
-    with col1:
-        st.metric(
-            "💰 Total Revenue",
-            f"${total_revenue:,.2f}",
-            delta=f"{revenue_delta:+.1f}%" if revenue_delta != 0 else "0%",
-            delta_color="normal"
-        )
-        st.metric(
-            "📦 Total Orders",
-            f"{total_orders:,}",
-            delta=f"{orders_delta:+.1f}%" if orders_delta != 0 else "0%",
-            delta_color="normal"
-        )
-    
-    with col2:
-        st.metric(
-            "👥 Total Customers",
-            f"{total_customers:,}",
-            delta=f"{customers_delta:+.1f}%" if customers_delta != 0 else "0%",
-            delta_color="normal"
-        )
-        st.metric(
-            "🛍️ Avg Order Value",
-            f"${avg_order_value:,.2f}",
-            delta=f"{order_value_delta:+.1f}%" if order_value_delta != 0 else "0%",
-            delta_color="normal"
-        )
-    
-    with col3:
-        st.metric(
-            "📊 Conversion Rate",
-            f"{conversion_rate:.2f}%",
-            delta=f"{conversion_delta:+.1f}%" if conversion_delta != 0 else "0%",
-            delta_color="normal"
-        )
-        st.metric(
-            "↩️ Return Rate",
-            f"{return_rate:.2f}%",
-            delta=f"{return_delta:+.1f}%",
-            delta_color="inverse"      # هنا ↑ أحمر، ↓ أخضر
-        )
-        st.metric(
-            "⭐ Satisfaction",
-            f"{avg_satisfaction:.2f}/5",
-            delta=f"{satisfaction_delta:+.2f}" if satisfaction_delta != 0 else "0",
-            delta_color="normal"
-        )
-
-
-
-
-    
-    # ========== TAB 2: BY CATEGORY ==========
-    with kpi_tabs[1]:
-        if 'category' in filtered_df.columns:
-            kpi_category = filtered_df.groupby('category').agg({
-                'gross_revenue': 'sum',
-                'net_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum'
-            }).reset_index()
-            
-            kpi_category['avg_order_value'] = (kpi_category['net_revenue'] / kpi_category['quantity']).round(2)
-            kpi_category['roi'] = ((kpi_category['net_revenue'] - kpi_category['discount_amount']) / kpi_category['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_category.style.format({
-                    'gross_revenue': '${:,.2f}',
-                    'net_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-    
-    # ========== TAB 3: BY CAMPAIGN ==========
-    with kpi_tabs[2]:
-        if 'marketing_campaign' in filtered_df.columns:
-            kpi_campaign = filtered_df.groupby('marketing_campaign').agg({
-                'net_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum',
-                'customer_id': 'nunique'
-            }).reset_index()
-            
-            kpi_campaign['revenue_per_customer'] = (kpi_campaign['net_revenue'] / kpi_campaign['customer_id']).round(2)
-            kpi_campaign['roi'] = ((kpi_campaign['net_revenue'] - kpi_campaign['discount_amount']) / kpi_campaign['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_campaign.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'customer_id': '{:,.0f}',
-                    'revenue_per_customer': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-    
-    # ========== TAB 4: BY CHANNEL ==========
-    with kpi_tabs[3]:
-        if 'marketing_channel' in filtered_df.columns:
-            kpi_channel = filtered_df.groupby('marketing_channel').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum',
-                'customer_id': 'nunique'
-            }).reset_index()
-            
-            kpi_channel['avg_order_value'] = (kpi_channel['net_revenue'] / kpi_channel['quantity']).round(2)
-            kpi_channel['revenue_per_customer'] = (kpi_channel['net_revenue'] / kpi_channel['customer_id']).round(2)
-            kpi_channel['roi'] = ((kpi_channel['net_revenue'] - kpi_channel['discount_amount']) / kpi_channel['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_channel.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'customer_id': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'revenue_per_customer': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-    
-    # ========== TAB 5: BY SEGMENT ==========
-    with kpi_tabs[4]:
-        if 'customer_segment' in filtered_df.columns:
-            kpi_segment = filtered_df.groupby('customer_segment').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum',
-                'customer_id': 'nunique',
-                'customer_lifetime_value': 'mean',
-                'retention_score': 'mean'
-            }).reset_index()
-            
-            kpi_segment['avg_order_value'] = (kpi_segment['net_revenue'] / kpi_segment['quantity']).round(2)
-            kpi_segment['revenue_per_customer'] = (kpi_segment['net_revenue'] / kpi_segment['customer_id']).round(2)
-            kpi_segment['roi'] = ((kpi_segment['net_revenue'] - kpi_segment['discount_amount']) / kpi_segment['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_segment.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'customer_id': '{:,.0f}',
-                    'customer_lifetime_value': '${:,.2f}',
-                    'retention_score': '{:.2f}',
-                    'avg_order_value': '${:,.2f}',
-                    'revenue_per_customer': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-    
-    # ========== TAB 6: BY REGION ==========
-    with kpi_tabs[5]:
-        if 'region' in filtered_df.columns:
-            kpi_region = filtered_df.groupby('region').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum',
-                'customer_id': 'nunique'
-            }).reset_index()
-            
-            kpi_region['avg_order_value'] = (kpi_region['net_revenue'] / kpi_region['quantity']).round(2)
-            kpi_region['revenue_per_customer'] = (kpi_region['net_revenue'] / kpi_region['customer_id']).round(2)
-            kpi_region['roi'] = ((kpi_region['net_revenue'] - kpi_region['discount_amount']) / kpi_region['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_region.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'customer_id': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'revenue_per_customer': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-    
-    # ========== TAB 7: BY TIME ==========
-    with kpi_tabs[6]:
-        time_view = st.radio("Select Time Period", ["Month", "Quarter", "Season"], horizontal=True)
-        
-        if time_view == "Month" and 'month' in filtered_df.columns:
-            kpi_time = filtered_df.groupby('month').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum'
-            }).reset_index()
-            
-            kpi_time['avg_order_value'] = (kpi_time['net_revenue'] / kpi_time['quantity']).round(2)
-            kpi_time['roi'] = ((kpi_time['net_revenue'] - kpi_time['discount_amount']) / kpi_time['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_time.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-        
-        elif time_view == "Quarter" and 'quarter' in filtered_df.columns:
-            kpi_time = filtered_df.groupby('quarter').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum'
-            }).reset_index()
-            
-            kpi_time['avg_order_value'] = (kpi_time['net_revenue'] / kpi_time['quantity']).round(2)
-            kpi_time['roi'] = ((kpi_time['net_revenue'] - kpi_time['discount_amount']) / kpi_time['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_time.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-        
-        elif time_view == "Season" and 'season' in filtered_df.columns:
-            kpi_time = filtered_df.groupby('season').agg({
-                'net_revenue': 'sum',
-                'gross_revenue': 'sum',
-                'discount_amount': 'sum',
-                'quantity': 'sum'
-            }).reset_index()
-            
-            kpi_time['avg_order_value'] = (kpi_time['net_revenue'] / kpi_time['quantity']).round(2)
-            kpi_time['roi'] = ((kpi_time['net_revenue'] - kpi_time['discount_amount']) / kpi_time['discount_amount'] * 100).round(2)
-            
-            st.dataframe(
-                kpi_time.style.format({
-                    'net_revenue': '${:,.2f}',
-                    'gross_revenue': '${:,.2f}',
-                    'discount_amount': '${:,.2f}',
-                    'quantity': '{:,.0f}',
-                    'avg_order_value': '${:,.2f}',
-                    'roi': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-
-    st.markdown("---")
-
-    # ========== CHARTS FROM NOTEBOOK ==========
-    st.header("📊 Data Visualizations")
-
-    tab1, tab2, tab3 = st.tabs(["📈 Trends", "🎯 Marketing", "📦 Performance"])
-
-    # ========== TAB 1: TRENDS ==========
-    with tab1:
-        # Chart 1: Monthly Revenue Trends by Marketing Channel
-        if 'month_date' in filtered_df.columns and 'marketing_channel' in filtered_df.columns and 'net_revenue' in filtered_df.columns:
-            st.subheader("Monthly Revenue Trends by Marketing Channel")
-            
-            monthly_channel = filtered_df.groupby(['month_date', 'marketing_channel']).agg({
-                'net_revenue': 'sum',
-                'customer_id': 'nunique'
-            }).reset_index()
-            monthly_channel.columns = ['month', 'channel', 'revenue', 'conversions']
-            
-            fig_revenue_trend = px.line(
-                monthly_channel,
-                x='month',
-                y='revenue',
-                color='channel',
-                markers=True,
-                title='Monthly Revenue Trends by Marketing Channel'
-            )
-            
-            fig_revenue_trend.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=500,
-                xaxis_title="Month",
-                yaxis_title="Revenue",
-                legend_title="Channel",
-                xaxis=dict(tickangle=45)
-            )
-            
-            st.plotly_chart(fig_revenue_trend, use_container_width=True)
-
-        # Chart 2: Monthly Conversions Trends by Marketing Channel
-        if 'month_date' in filtered_df.columns and 'marketing_channel' in filtered_df.columns and 'customer_id' in filtered_df.columns:
-            st.subheader("Monthly Conversions Trends by Marketing Channel")
-            
-            monthly_channel = filtered_df.groupby(['month_date', 'marketing_channel']).agg({
-                'customer_id': 'nunique'
-            }).reset_index()
-            monthly_channel.columns = ['month', 'channel', 'conversions']
-            
-            fig_conv_trend = px.line(
-                monthly_channel,
-                x='month',
-                y='conversions',
-                color='channel',
-                markers=True,
-                title='Monthly Conversions Trends by Marketing Channel'
-            )
-            
-            fig_conv_trend.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=500,
-                xaxis_title="Month",
-                yaxis_title="Conversions (Unique Customers)",
-                legend_title="Channel",
-                xaxis=dict(tickangle=45)
-            )
-            
-            st.plotly_chart(fig_conv_trend, use_container_width=True)
-
-        # Chart 3: Overall Monthly Revenue Trend
-        if 'month_date' in filtered_df.columns and 'net_revenue' in filtered_df.columns:
-            st.subheader("Overall Monthly Revenue Trend")
-            
-            monthly_total = filtered_df.groupby('month_date').agg({
-                'net_revenue': 'sum',
-                'customer_id': 'nunique'
-            }).reset_index()
-            monthly_total.columns = ['month', 'total_revenue', 'total_conversions']
-            
-            fig_total_rev = px.line(
-                monthly_total,
-                x='month',
-                y='total_revenue',
-                markers=True,
-                title='Overall Monthly Revenue Trend'
-            )
-            
-            fig_total_rev.update_traces(
-                line=dict(color='#FF9F0D', width=3),
-                marker=dict(size=10, color='#3647F5')
-            )
-            
-            fig_total_rev.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Month",
-                yaxis_title="Total Revenue",
-                xaxis=dict(tickangle=45)
-            )
-            
-            st.plotly_chart(fig_total_rev, use_container_width=True)
-
-        # Chart 4: Overall Monthly Conversions Trend
-        if 'month_date' in filtered_df.columns and 'customer_id' in filtered_df.columns:
-            st.subheader("Overall Monthly Conversions Trend")
-            
-            monthly_total = filtered_df.groupby('month_date').agg({
-                'customer_id': 'nunique'
-            }).reset_index()
-            monthly_total.columns = ['month', 'total_conversions']
-            
-            fig_total_conv = px.line(
-                monthly_total,
-                x='month',
-                y='total_conversions',
-                markers=True,
-                title='Overall Monthly Conversions Trend'
-            )
-            
-            fig_total_conv.update_traces(
-                line=dict(color='#3647F5', width=3),
-                marker=dict(size=10, color='#FF9F0D')
-            )
-            
-            fig_total_conv.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Month",
-                yaxis_title="Total Conversions",
-                xaxis=dict(tickangle=45)
-            )
-            
-            st.plotly_chart(fig_total_conv, use_container_width=True)
-
-    # ========== TAB 2: MARKETING ==========   
-             # ========== TAB 2: MARKETING ==========
-    with tab2:
-        if 'marketing_channel' in df.columns:
-            revenue_col = 'net_revenue' if 'net_revenue' in df.columns else 'final_amount'
-            
-            if revenue_col in df.columns and 'customer_id' in df.columns and 'roi' in df.columns:
-                # تنظيف ROI من inf قبل الـ groupby
-                df_clean = df.copy()
-                df_clean['roi'] = df_clean['roi'].replace([float('inf'), float('-inf')], float('nan'))
-                
-                # تحضير البيانات
-                channel_perf = df_clean.groupby('marketing_channel').agg({
-                    revenue_col: 'sum',
-                    'customer_id': 'nunique',
-                    'roi': 'mean'
-                }).reset_index()
-                channel_perf.columns = ['channel', 'total_revenue', 'total_conversions', 'avg_roi']
-                channel_perf = channel_perf.set_index('channel')
-                
-                # Chart 1: Total Revenue per Marketing Channel
-                st.subheader("Total Revenue per Marketing Channel")
-                bar_width = 25
-                
-                fig_rev = px.scatter(
-                    channel_perf,
-                    x=channel_perf.index,
-                    y="total_revenue",
-                    title="Total Revenue per Marketing Channel",
-                    color_discrete_sequence=["#3647F5"],
-                    text="total_revenue"
-                )
-                
-                fig_rev.update_traces(
-                    marker=dict(size=bar_width),
-                    textposition='top center',
-                    texttemplate='%{text:.2s}'
-                )
-                
-                for x_val, y_val in zip(channel_perf.index, channel_perf["total_revenue"]):
-                    fig_rev.add_shape(
-                        type="line",
-                        x0=x_val, y0=0,
-                        x1=x_val, y1=y_val,
-                        line=dict(color="#3647F5", width=bar_width),
-                        layer="below"
-                    )
-                
-                fig_rev.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color='#f5f5f5',
-                    height=450,
-                    margin=dict(t=60)
-                )
-                
-                st.plotly_chart(fig_rev, use_container_width=True)
-                
-                # Chart 2: Total Conversions per Channel
-                st.subheader("Total Conversions per Channel")
-                
-                fig_conv = px.scatter(
-                    channel_perf,
-                    x=channel_perf.index,
-                    y="total_conversions",
-                    size="total_conversions",
-                    color="total_conversions",
-                    color_continuous_scale=["#FF9F0D", "#D9D9D9"],
-                    title="Total Conversions per Channel"
-                )
-                
-                fig_conv.update_traces(
-                    marker=dict(symbol='circle', line=dict(width=2, color='#D9D9D9'))
-                )
-                
-                fig_conv.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color='#f5f5f5',
-                    height=450,
-                    yaxis_title="Total Conversions",
-                    xaxis_title="Marketing Channel"
-                )
-                
-                st.plotly_chart(fig_conv, use_container_width=True)
-                
-                # Chart 3: Total Orders per Channel (بدل Spend)
-                st.subheader("Total Orders per Channel")
-                
-                # حساب عدد الطلبات لكل قناة
-                orders_data = df.groupby('marketing_channel').agg({
-                    'order_id': 'count'
-                }).reset_index()
-                orders_data.columns = ['channel', 'total_orders']
-                orders_data = orders_data.set_index('channel')
-                
-                fig_spend = px.line(
-                    orders_data,
-                    x=orders_data.index,
-                    y="total_orders",
-                    markers=True,
-                    title="Total Orders per Channel"
-                )
-                
-                fig_spend.update_traces(
-                    line=dict(color="#FF9F0D", width=4),
-                    marker=dict(size=10, color="#D9D9D9", line=dict(width=2, color="#D9D9D9"))
-                )
-                
-                fig_spend.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color='#f5f5f5',
-                    height=500,
-                    yaxis_title="Total Orders",
-                    xaxis_title="Marketing Channel"
-                )
-                
-                st.plotly_chart(fig_spend, use_container_width=True)
-                
-                # Chart 4: Average ROI per Channel
-                st.subheader("Average ROI per Channel")
-                
-                channel_perf_sorted = channel_perf.sort_values(by='avg_roi', ascending=True)
-                
-                fig_roi = px.bar(
-                    channel_perf_sorted,
-                    x='avg_roi',
-                    y=channel_perf_sorted.index,
-                    orientation='h',
-                    color='avg_roi',
-                    color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D'],
-                    title="Average ROI per Channel"
-                )
-                
-                fig_roi.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color='#f5f5f5',
-                    height=450,
-                    xaxis_title="Average ROI",
-                    yaxis_title="Marketing Channel"
-                )
-                
-                st.plotly_chart(fig_roi, use_container_width=True)
-            else:
-                st.error("❌ Required columns not found!")
-        else:
-            st.error("❌ Column 'marketing_channel' not found!")
-
-   
-           # ========== TAB 3: PERFORMANCE (NEW) ==========
-    with tab3:
-        st.subheader("📊 Marketing Channel Performance Analysis")
-        
-        if 'marketing_channel' in filtered_df.columns:
-            # تحضير البيانات الأساسية
-            performance_by_channel = filtered_df.groupby('marketing_channel').agg({
-                'final_amount': ['sum', 'mean'],
-                'order_id': 'count',
-                'customer_id': 'nunique'
-            }).reset_index()
-            performance_by_channel.columns = ['Channel', 'Total_Revenue', 'Avg_Order_Value', 'Total_Orders', 'Unique_Customers']
-            performance_by_channel['Revenue_Per_Order'] = (performance_by_channel['Total_Revenue'] / performance_by_channel['Total_Orders']).round(2)
-            
-            # Chart 1: Revenue Per Order
-            st.subheader("💵 Revenue Per Order by Channel")
-            performance_sorted = performance_by_channel.sort_values('Revenue_Per_Order')
-            
-            fig_revenue_order = px.bar(
-                performance_sorted,
-                x='Revenue_Per_Order',
-                y='Channel',
-                orientation='h',
-                title='Revenue Per Order by Channel',
-                color='Revenue_Per_Order',
-                color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D']
-            )
-            fig_revenue_order.update_traces(
-                marker=dict(line=dict(width=1.5, color='#D9D9D9'))
-            )
-            fig_revenue_order.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Revenue Per Order ($)",
-                yaxis_title="Marketing Channel"
-            )
-            st.plotly_chart(fig_revenue_order, use_container_width=True)
-            
-            # Chart 2: Customer Acquisition Rate
-            st.subheader("📈 Customer Acquisition Rate by Channel")
-            conversion_by_channel = filtered_df.groupby('marketing_channel').agg({
-                'customer_id': 'nunique',
-                'order_id': 'count'
-            }).reset_index()
-            conversion_by_channel.columns = ['Channel', 'Unique_Customers', 'Total_Orders']
-            conversion_by_channel['Customer_Acquisition_Rate_%'] = (
-                (conversion_by_channel['Unique_Customers'] / conversion_by_channel['Total_Orders']) * 100
-            ).round(2)
-            conversion_by_channel = conversion_by_channel.sort_values('Customer_Acquisition_Rate_%', ascending=False)
-            
-            fig_acquisition = px.bar(
-                conversion_by_channel,
-                x='Channel',
-                y='Customer_Acquisition_Rate_%',
-                title='Customer Acquisition Rate by Channel',
-                color='Customer_Acquisition_Rate_%',
-                color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D']
-            )
-            fig_acquisition.update_traces(
-                marker=dict(line=dict(width=1.5, color='#D9D9D9'))
-            )
-            fig_acquisition.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Marketing Channel",
-                yaxis_title="Customer Acquisition Rate (%)",
-                xaxis=dict(tickangle=45)
-            )
-            st.plotly_chart(fig_acquisition, use_container_width=True)
-            
-            # Chart 3: Channel Efficiency Ranking
-            st.subheader("🏆 Channel Efficiency Ranking")
-            efficiency = filtered_df.groupby('marketing_channel').agg({
-                'final_amount': ['sum', 'mean'],
-                'order_id': 'count',
-                'customer_id': 'nunique'
-            }).reset_index()
-            efficiency.columns = ['Channel', 'Total_Revenue', 'Avg_Order_Value', 'Total_Orders', 'Unique_Customers']
-            efficiency['Revenue_Per_Order'] = (efficiency['Total_Revenue'] / efficiency['Total_Orders']).round(2)
-            efficiency['Customer_Acq_Rate_%'] = ((efficiency['Unique_Customers'] / efficiency['Total_Orders']) * 100).round(2)
-            
-            max_rev = efficiency['Revenue_Per_Order'].max()
-            max_cust = efficiency['Customer_Acq_Rate_%'].max()
-            max_order = efficiency['Avg_Order_Value'].max()
-            
-            efficiency['Efficiency_Score'] = (
-                (efficiency['Revenue_Per_Order'] / max_rev) * 40 +
-                (efficiency['Customer_Acq_Rate_%'] / max_cust) * 30 +
-                (efficiency['Avg_Order_Value'] / max_order) * 30
-            ).round(2)
-            efficiency = efficiency.sort_values('Efficiency_Score')
-            
-            fig_efficiency = px.bar(
-                efficiency,
-                x='Efficiency_Score',
-                y='Channel',
-                orientation='h',
-                title='Channel Efficiency Ranking',
-                color='Efficiency_Score',
-                color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D']
-            )
-            fig_efficiency.update_traces(
-                marker=dict(line=dict(width=1.5, color='#D9D9D9'))
-            )
-            fig_efficiency.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Efficiency Score",
-                yaxis_title="Marketing Channel"
-            )
-            st.plotly_chart(fig_efficiency, use_container_width=True)
-            
-            # Chart 4: Revenue vs Customer Acquisition
-            st.subheader("🎯 Revenue vs Customer Acquisition")
-            revenue_analysis = filtered_df.groupby('marketing_channel').agg({
-                'final_amount': 'sum',
-                'customer_id': 'nunique',
-                'order_id': 'count'
-            }).reset_index()
-            revenue_analysis.columns = ['Channel', 'Total_Revenue', 'Unique_Customers', 'Total_Orders']
-            revenue_analysis['Revenue_Per_Customer'] = (
-                revenue_analysis['Total_Revenue'] / revenue_analysis['Unique_Customers']
-            ).round(2)
-            
-            fig_revenue_customers = px.scatter(
-                revenue_analysis,
-                x='Unique_Customers',
-                y='Total_Revenue',
-                size='Revenue_Per_Customer',
-                color='Revenue_Per_Customer',
-                hover_name='Channel',
-                text='Channel',
-                title='Revenue vs Customer Acquisition',
-                size_max=60,
-                color_continuous_scale=['#FF9F0D', '#3647F5', '#D9D9D9']
-            )
-            fig_revenue_customers.update_traces(
-                textposition='top center',
-                textfont=dict(size=12, color='#f5f5f5'),
-                marker=dict(line=dict(width=2, color='#D9D9D9'), opacity=0.85)
-            )
-            fig_revenue_customers.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=500,
-                showlegend=False,
-                xaxis_title="Unique Customers Acquired",
-                yaxis_title="Total Revenue ($)"
-            )
-            st.plotly_chart(fig_revenue_customers, use_container_width=True)
-            
-            # Chart 5: Revenue Per Customer
-            st.subheader("💰 Revenue Per Customer by Channel")
-            customer_value = filtered_df.groupby('marketing_channel').agg({
-                'final_amount': 'sum',
-                'customer_id': 'nunique',
-                'order_id': 'count'
-            }).reset_index()
-            customer_value.columns = ['Channel', 'Total_Revenue', 'Total_Customers', 'Total_Orders']
-            customer_value['Revenue_Per_Customer'] = (
-                customer_value['Total_Revenue'] / customer_value['Total_Customers']
-            ).round(2)
-            customer_value = customer_value.sort_values('Revenue_Per_Customer')
-            
-            fig_revenue_customer = px.bar(
-                customer_value,
-                x='Channel',
-                y='Revenue_Per_Customer',
-                title='Revenue Per Customer by Channel',
-                color='Revenue_Per_Customer',
-                color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D']
-            )
-            fig_revenue_customer.update_traces(
-                marker=dict(line=dict(width=1.5, color='#D9D9D9'))
-            )
-            fig_revenue_customer.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=450,
-                xaxis_title="Marketing Channel",
-                yaxis_title="Revenue Per Customer ($)",
-                xaxis=dict(tickangle=45)
-            )
-            st.plotly_chart(fig_revenue_customer, use_container_width=True)
-            
-            # Chart 6: Performance Quadrant Analysis
-            st.subheader("🏆 Performance Quadrant Analysis")
-            
-            quadrant_analysis = filtered_df.groupby('marketing_channel').agg({
-                'customer_id': 'nunique',
-                'final_amount': 'sum',
-                'order_id': 'count'
-            }).reset_index()
-            quadrant_analysis.columns = ['Channel', 'Unique_Customers', 'Total_Revenue', 'Total_Orders']
-            quadrant_analysis['Revenue_Per_Customer'] = (
-                quadrant_analysis['Total_Revenue'] / quadrant_analysis['Unique_Customers']
-            ).round(2)
-            
-            avg_customers = quadrant_analysis['Unique_Customers'].mean()
-            avg_revenue = quadrant_analysis['Total_Revenue'].mean()
-            
-            fig_quadrant = px.scatter(
-                quadrant_analysis,
-                x='Unique_Customers',
-                y='Total_Revenue',
-                size='Revenue_Per_Customer',
-                color='Revenue_Per_Customer',
-                hover_name='Channel',
-                hover_data=['Revenue_Per_Customer', 'Total_Orders'],
-                title='Performance Quadrant Analysis: High Revenue/High Reach = Top Right 🏆',
-                size_max=50,
-                color_continuous_scale=['#FF9F0D', '#3647F5']
-            )
-            
-            fig_quadrant.update_traces(
-                marker=dict(line=dict(width=2, color='#D9D9D9'), opacity=0.9)
-            )
-            
-            fig_quadrant.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='#f5f5f5',
-                height=500,
-                xaxis_title="Unique Customers Acquired",
-                yaxis_title="Total Revenue ($)",
-                showlegend=False
-            )
-            
-            # Quadrant lines
-            fig_quadrant.add_hline(
-                y=avg_revenue,
-                line_dash="dash",
-                line_color="#FF9F0D",
-                annotation_text=f"Avg Revenue: ${avg_revenue:,.0f}",
-                annotation_position="right"
-            )
-            
-            fig_quadrant.add_vline(
-                x=avg_customers,
-                line_dash="dash",
-                line_color="#FF9F0D",
-                annotation_text=f"Avg Customers: {avg_customers:,.0f}",
-                annotation_position="top"
-            )
-            
-            st.plotly_chart(fig_quadrant, use_container_width=True)
-            
-            # Best performer info
-            if len(quadrant_analysis) > 0 and not quadrant_analysis['Revenue_Per_Customer'].isna().all():
-                best_channel = quadrant_analysis.loc[quadrant_analysis['Revenue_Per_Customer'].idxmax()]
-            else:
-                best_channel = pd.Series({'marketing_channel': 'N/A', 'Revenue_Per_Customer': 0, 'Efficiency_Score': 0})
-            st.success(f"🌟 **Best Performer:** {best_channel['Channel']} - Revenue/Customer: ${best_channel['Revenue_Per_Customer']:,.2f}")
-
-
-# =============================================================================
-# DATA EXPLORER
-# =============================================================================
-elif page == "🔍 Data Explorer":
-    st.title("🔍 Data Explorer")
-    st.markdown("Browse and filter your data")
-
-    if df is None:
-        st.error("❌ Data not loaded!")
-        st.stop()
-
-    # Filters
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        if 'category' in df.columns:
-            categories = ['All'] + sorted(df['category'].dropna().unique().tolist())
-            selected_cat = st.selectbox("Category", categories)
-        else:
-            selected_cat = 'All'
-
-    with col2:
-        if 'region' in df.columns:
-            regions = ['All'] + sorted(df['region'].dropna().unique().tolist())
-            selected_region = st.selectbox("Region", regions)
-        else:
-            selected_region = 'All'
-
-    with col3:
-        if 'customer_segment' in df.columns:
-            segments = ['All'] + sorted(df['customer_segment'].dropna().unique().tolist())
-            selected_segment = st.selectbox("Segment", segments)
-        else:
-            selected_segment = 'All'
-
-    # Apply filters
-    explorer_df = df.copy()
-
-    if selected_cat != 'All' and 'category' in df.columns:
-        explorer_df = explorer_df[explorer_df['category'] == selected_cat]
-
-    if selected_region != 'All' and 'region' in df.columns:
-        explorer_df = explorer_df[explorer_df['region'] == selected_region]
-
-    if selected_segment != 'All' and 'customer_segment' in df.columns:
-        explorer_df = explorer_df[explorer_df['customer_segment'] == selected_segment]
-
-    st.info(f"📊 Displaying {len(explorer_df):,} records")
-
-    # Display data
-    st.dataframe(explorer_df, use_container_width=True, height=500)
-
-    # Download
-    csv = explorer_df.to_csv(index=False).encode('utf-8')
-    st.download_button(
-        label="📥 Download Filtered Data",
-        data=csv,
-        file_name=f'ecommerce_filtered_{datetime.now().strftime("%Y%m%d")}.csv',
-        mime='text/csv',
-    )
-
-# =============================================================================
-elif page == "ℹ️ About":
-    st.markdown("""
-        <div style='text-align: center; padding: 2rem 0;'>
-            <h1 style='font-size: 3rem; margin-bottom: 0;'>📊 E-commerce Analytics Pro</h1>
-            <p style='font-size: 1.3rem; color: #00d9ff; margin-top: 0.5rem;'>
-                Professional Business Intelligence Solution
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    if df is not None:
-        # ========== DATASET OVERVIEW ==========
-        st.header("📋 Dataset Overview")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>📦 Total Records</div>
-                    <div class='metric-value' style='font-size: 2rem;'>{len(df):,}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>📅 Time Period</div>
-                    <div class='metric-value' style='font-size: 1.3rem;'>Jan 2021<br>- Jan 2024</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>📊 Columns</div>
-                    <div class='metric-value' style='font-size: 2rem;'>{len(df.columns)}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-                <div class='metric-card'>
-                    <div class='metric-label'>💾 Data Size</div>
-                    <div class='metric-value' style='font-size: 1.5rem;'>{df.memory_usage(deep=True).sum() / 1024**2:.1f} MB</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # ========== PROJECT HIGHLIGHTS ==========
-        st.header("🎯 Project Highlights")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-                ### 📊 Dataset Highlights
-                
-                **Business Domain:**
-                - Online retail / e-commerce platform
-                - Orders, customers, products, and marketing
-                
-                **Time Coverage:**
-                - 3+ years of transactional data
-                - From early 2021 to early 2024
-                
-                **Granularity:**
-                - One row per order (or order line)
-                - Linked to customer, product, channel, campaign
-                
-                **Key Column Families:**
-                - 🆔 **Identifiers:** order_id, customer_id, product_id
-                - 📅 **Temporal:** date, month, quarter, season
-                - 💰 **Financials:** revenue, discount, CLV
-                - 📢 **Marketing:** channel, campaign, ROI
-                - 👥 **Customer/Product:** segment, region, category
-            """)
-        
-        with col2:
-            st.markdown("""
-                ### 🎯 Business Questions Supported
-                
-                **Revenue & Growth:**
-                - How revenue, orders, and customers evolve over time
-                - Trend analysis and growth rate calculations
-                
-                **Channel Performance:**
-                - Which channels/campaigns deliver highest ROI
-                - Conversion and acquisition effectiveness
-                
-                **Customer Value:**
-                - Which segments, regions, categories are most valuable
-                - CLV, retention, and satisfaction analysis
-                
-                **Profitability:**
-                - How pricing, discounting, and returns affect net revenue
-                - Cost efficiency and margin optimization
-            """)
-        
-        st.markdown("---")
-        
-        # ========== APPLICATION PAGES ==========
-        st.header("📱 Application Pages")
-        
-        with st.expander("🏠 Home", expanded=False):
-            st.markdown("""
-                **Hero dashboard with high-level KPIs:**
-                - Total revenue, orders, customers, AOV
-                - Quick feature overview and dataset preview
-                - Executive summary cards
-                - Key business insights and growth metrics
-            """)
-        
-        with st.expander("📊 Analytics Dashboard", expanded=False):
-            st.markdown("""
-                **Interactive filtering by channel and date range:**
-                - Overall KPI tab with growth metrics
-                - Category, Campaign, Channel breakdowns
-                - Segment, Region, and Time analysis
-                - Real-time data slicing with dynamic updates
-                - 7+ KPI tabs for multi-dimensional analysis
-            """)
-        
-        with st.expander("🔍 Data Explorer", expanded=False):
-            st.markdown("""
-                **Full filterable table view:**
-                - Enriched dataset with all columns
-                - Ideal for validation and spot-checking
-                - Export capabilities for offline analysis
-                - Sortable and searchable interface
-            """)
-        
-        with st.expander("ℹ️ About", expanded=False):
-            st.markdown("""
-                **Complete guide:**
-                - Dataset structure and processing pipeline
-                - Metrics definitions and calculations
-                - Tech stack and application architecture
-                - Professional positioning and audience
-            """)
-        
-        st.markdown("---")
-        
-        # ========== PROFESSIONAL POSITIONING ==========
-        st.header("🎓 Professional Positioning")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.info("""
-                ### 🎯 Purpose
-                
-                End-to-end BI solution for e-commerce performance
-                
-                Not just a static report - a dynamic analytics platform
-                
-                Enables data-driven decision making
-            """)
-        
-        with col2:
-            st.success("""
-                ### 👥 Audience
-                
-                - **Executives:** High-level KPIs and insights
-                - **Marketing:** Channels & campaigns ROI
-                - **Data teams:** Explorer & deep analysis
-                - **Analysts:** Custom filtering & exports
-            """)
-        
-        with col3:
-            st.warning("""
-                ### 🎨 Style
-                
-                Dark, modern UI with:
-                - Interactive metric cards
-                - Dynamic tabs & expanders
-                - Real-time filtering
-                - Clean professional design
-            """)
-        
-        st.markdown("---")
-        
-        # ========== DATA ROADMAP ==========
-        st.header("🗺️ Data Processing Roadmap")
-        
-        with st.expander("🔹 Stage 1: Raw Data Collection", expanded=False):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                st.markdown("### 📥")
-            with col2:
-                st.markdown("""
-                    **Source:** E-commerce Platform
-                    
-                    **Data Points Collected:**
-                    - Customer transactions and orders
-                    - Marketing campaigns and channels
-                    - Product catalog and inventory
-                    - Customer demographics and segments
-                    - Order details and fulfillment
-                    
-                    **Period:** 3+ years (2021-2024)
-                    
-                    **Volume:** 12,000+ records
-                """)
-        
-        with st.expander("🔹 Stage 2: Data Cleaning & Transformation", expanded=False):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                st.markdown("### 🧹")
-            with col2:
-                st.markdown("""
-                    **Cleaning Steps:**
-                    - ✅ Removed duplicates and invalid records
-                    - ✅ Handled missing values with imputation
-                    - ✅ Fixed data types (dates, numerics, categories)
-                    - ✅ Standardized formats and naming conventions
-                    - ✅ Validated ranges and business rules
-                    
-                    **Transformation:**
-                    - Date parsing & formatting (YYYY-MM-DD)
-                    - Revenue calculations (gross → net)
-                    - Customer segmentation (VIP, Regular, New)
-                    - Time-based features (month, quarter, season)
-                """)
-        
-        with st.expander("🔹 Stage 3: Feature Engineering", expanded=False):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                st.markdown("### ⚙️")
-            with col2:
-                st.markdown("""
-                    **Created Features:**
-                    - `net_revenue` = gross_revenue - discount_amount
-                    - `roi` = (revenue - cost) / cost × 100
-                    - `customer_lifetime_value` (CLV) - predictive metric
-                    - `retention_score` - customer loyalty indicator
-                    - `month_date`, `quarter`, `season` - time aggregation keys
-                    - `customer_segment` (VIP, Regular, New) - behavioral groups
-                    
-                    **Calculated Metrics:**
-                    - Revenue per customer (total revenue / unique customers)
-                    - Average order value (total revenue / order count)
-                    - Conversion rates (customers / orders)
-                    - Channel efficiency scores (normalized ROI)
-                """)
-        
-        with st.expander("🔹 Stage 4: Analysis & Insights", expanded=False):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                st.markdown("### 📊")
-            with col2:
-                st.markdown("""
-                    **Analysis Types:**
-                    - **Time Series:** Revenue & conversions trends over months/quarters
-                    - **Channel Performance:** ROI, efficiency, and acquisition by channel
-                    - **Customer Segmentation:** Behavior patterns and value analysis
-                    - **Geographic Analysis:** Regional performance and opportunities
-                    - **Campaign Effectiveness:** Marketing ROI and conversion rates
-                    
-                    **Key Findings:**
-                    - 8,414% revenue growth from Jan 2021 to Jan 2024
-                    - Email channel delivers best ROI at 1,107%
-                    - Strong seasonality patterns across all channels
-                    - Direct traffic shows organic brand strength
-                    - Peak performance in July 2023 ($1.56M revenue)
-                """)
-        
-        with st.expander("🔹 Stage 5: Visualization & Dashboard", expanded=False):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                st.markdown("### 📈")
-            with col2:
-                st.markdown("""
-                    **Dashboard Features:**
-                    - **Home Page:** Quick overview with key insights
-                    - **Analytics:** 15+ interactive charts and 7 KPI tabs
-                    - **Data Explorer:** Searchable, sortable data table
-                    - **Filters:** Real-time data slicing by channel and date
-                    - **Export:** Download filtered data for offline work
-                    
-                    **Technologies:**
-                    - **Streamlit** - Web framework for rapid app development
-                    - **Plotly** - Interactive charts with hover and zoom
-                    - **Pandas** - Data processing and aggregation
-                    - **Python** - Backend logic and calculations
-                """)
-        
-        st.markdown("---")
-        
-        # ========== DATA STRUCTURE ==========
-        st.header("🏗️ Data Structure")
-        
-        tab1, tab2, tab3 = st.tabs(["📊 Column Groups", "🔢 Data Types", "📏 Sample Data"])
-        
-        with tab1:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("""
-                    ### 🆔 Identifiers
-                    - `order_id` - Unique order identifier
-                    - `customer_id` - Customer identifier
-                    - `product_id` - Product SKU
-                    
-                    ### 📅 Temporal
-                    - `date` - Order date
-                    - `registration_date` - Customer signup
-                    - `month_date` - Monthly aggregation key
-                    - `month`, `quarter`, `season` - Time groupings
-                """)
-            
-            with col2:
-                st.markdown("""
-                    ### 💰 Financial
-                    - `gross_revenue` - Pre-discount revenue
-                    - `net_revenue` - Post-discount revenue
-                    - `discount_amount` - Total discounts
-                    - `final_amount` - Customer payment
-                    - `customer_lifetime_value` - CLV prediction
-                    
-                    ### 📦 Product
-                    - `category` - Product category
-                    - `quantity` - Items ordered
-                    - `returned` - Return flag
-                """)
-            
-            with col3:
-                st.markdown("""
-                    ### 📢 Marketing
-                    - `marketing_channel` - Acquisition channel
-                    - `marketing_campaign` - Campaign name
-                    - `roi` - Return on investment %
-                    
-                    ### 👥 Customer
-                    - `customer_segment` - VIP/Regular/New
-                    - `region` - Geographic location
-                    - `retention_score` - Loyalty metric
-                    - `satisfaction_rating` - CSAT score
-                """)
-        
-        with tab2:
-            dtypes_df = pd.DataFrame({
-                'Column': df.dtypes.index,
-                'Data Type': df.dtypes.values.astype(str),
-                'Non-Null Count': df.count().values,
-                'Null Count': df.isnull().sum().values
-            })
-            
-            st.dataframe(
-                dtypes_df.style.apply(
-                    lambda x: ['background-color: #1a1f2e' if i % 2 == 0 else '' for i in range(len(x))],
-                    axis=0
-                ),
-                use_container_width=True,
-                height=400
-            )
-        
-        with tab3:
-            st.dataframe(df.head(20), use_container_width=True, height=400)
-        
-        st.markdown("---")
-        
-        # ========== KEY METRICS SUMMARY ==========
-        st.header("📈 Key Metrics Summary")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.success("""
-                ### 💰 Revenue Metrics
-                - **Total Revenue:** ${:,.0f}
-                - **Avg Revenue/Order:** ${:,.2f}
-                - **Growth Rate:** +8,414%
-                - **Peak Month:** July 2023 ($1.56M)
-                - **Starting Point:** Jan 2021 ($16.7K)
-            """.format(
-                df['net_revenue'].sum(),
-                df['net_revenue'].mean()
-            ))
-        
-        with col2:
-            st.info("""
-                ### 👥 Customer Metrics
-                - **Total Customers:** {:,}
-                - **Total Orders:** {:,}
-                - **Avg Orders/Customer:** {:.1f}
-                - **Conversion Growth:** +5,046%
-                - **Peak Conversions:** 696 (July 2023)
-            """.format(
-                df['customer_id'].nunique(),
-                len(df),
-                len(df) / df['customer_id'].nunique()
-            ))
-        
-        st.markdown("---")
-        
-        # ========== CHANNELS & CAMPAIGNS ==========
-        st.header("📡 Marketing Overview")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if 'marketing_channel' in df.columns:
-                st.markdown("### 📢 Marketing Channels")
-                channels = df['marketing_channel'].value_counts().head(12)
-                for i, (channel, count) in enumerate(channels.items(), 1):
-                    st.markdown(f"{i}. **{channel}:** {count:,} orders")
-        
-        with col2:
-            if 'category' in df.columns:
-                st.markdown("### 📦 Product Categories")
-                categories = df['category'].value_counts().head(10)
-                for i, (cat, count) in enumerate(categories.items(), 1):
-                    st.markdown(f"{i}. **{cat}:** {count:,} orders")
-        
-        st.markdown("---")
-        
-        # ========== FOOTER ==========
-        st.markdown("""
-            <div class='footer'>
-                <p>📊 <strong>E-commerce Analytics Pro</strong> | Version 1.0.0</p>
-                <p>Built with ❤️ using Streamlit, Plotly & Pandas</p>
-                <p>Data Period: January 2021 - January 2024 | 12,000+ Records</p>
-                <p>© 2024 Professional Analytics Dashboard</p>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    else:
-        st.error("⚠️ No data available. Please check the data source.")
+importlib.import_module(PAGES[page]).render(dataset)
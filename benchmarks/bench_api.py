@@ -0,0 +1,173 @@
+"""Load test of the JSON API: throughput and latency percentiles.
+
+Starts ``api.py`` on a free local port (over ``--data``, or ``--rows``
+freshly generated orders), waits until it is ready, then drives it from
+``--concurrency`` keep-alive connections with a mix of endpoints and sidebar
+filters. The first pass requests every distinct URL once (all cold), the
+second replays the whole mix, where a share of repeat requests
+(``--conditional``) revalidate with the ETag they saw before, as a polling
+client would. The load generator shares the machine with the server, so
+run it on a box with spare cores for absolute numbers.
+
+Usage:
+    python benchmarks/bench_api.py --rows 1_000_000 --requests 5000 --concurrency 32
+    python benchmarks/bench_api.py --data exports/ --conditional 0.5
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_data import CHANNELS, generate_chunk  # noqa: E402
+
+PATHS = [
+    '/api/kpis/overall', '/api/kpis/category', '/api/kpis/campaign', '/api/kpis/channel',
+    '/api/kpis/segment', '/api/kpis/region', '/api/kpis/month', '/api/trends/monthly',
+    '/api/channels/summary', '/api/channels/performance', '/api/forecast',
+]
+RANGES = [('', ''), ('2023-01-01', '2023-12-31'), ('2023-10-01', '2023-12-31'), ('2022-06-01', '2022-06-30')]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def request_mix(n, seed=7):
+    rng = random.Random(seed)
+    urls = []
+    for _ in range(n):
+        path = rng.choice(PATHS)
+        start, end = rng.choice(RANGES)
+        query = [f"channel={rng.choice(['All%20Channels'] + [c.replace(' ', '%20') for c in CHANNELS])}"]
+        if start:
+            query += [f"start={start}", f"end={end}"]
+        urls.append(f"{path}?{'&'.join(query)}")
+    return urls
+
+
+async def client(host, port, queue, results, etags, conditional, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            headers = f"GET {url} HTTP/1.1\r\nHost: {host}\r\n"
+            revalidate = url in etags and rng.random() < conditional
+            if revalidate:
+                headers += f"If-None-Match: {etags[url]}\r\n"
+            started = time.perf_counter()
+            writer.write((headers + "\r\n").encode())
+            await writer.drain()
+            status_line = await reader.readline()
+            status = int(status_line.split()[1])
+            length, tag = 0, None
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode().partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+                elif name.lower() == 'etag':
+                    tag = value.strip()
+            if length:
+                await reader.readexactly(length)
+            elapsed = time.perf_counter() - started
+            if tag:
+                etags[url] = tag
+            results.append((url, status, elapsed))
+    finally:
+        writer.close()
+
+
+async def drive(host, port, urls, concurrency, conditional, etags):
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    results = []
+    rng = random.Random(11)
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        client(host, port, queue, results, etags, conditional, rng) for _ in range(concurrency)
+    ])
+    return results, time.perf_counter() - started
+
+
+def report(label, latencies):
+    if not latencies:
+        return
+    ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    print(f"  {label:<12} n={len(ms):>6,}  p50 {p50:7.2f} ms  p95 {p95:7.2f} ms  p99 {p99:7.2f} ms  max {ms.max():7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data', default=None, help="orders file, shard directory or glob")
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    parser.add_argument('--requests', type=lambda s: int(s.replace('_', '')), default=5_000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--conditional', type=float, default=0.3, help="share of repeat requests sent with If-None-Match")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        data = args.data
+        if data is None:
+            data = os.path.join(directory, 'orders.csv')
+            generate_chunk(1, args.rows, max(1, args.rows // 3), 5_000, 42).to_csv(data, index=False)
+        port = free_port()
+        env = dict(os.environ, ECOMMERCE_DATA=os.path.abspath(data),
+                   ECOMMERCE_CACHE_DIR=os.path.join(directory, 'cache'),
+                   ECOMMERCE_QUARANTINE=os.path.join(directory, 'quarantine.csv'))
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'api.py'), '--port', str(port)],
+                                  env=env, cwd=directory, stdout=subprocess.DEVNULL)
+        try:
+            started = time.perf_counter()
+            while True:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health") as response:
+                        if b'"ready":true' in response.read():
+                            break
+                except OSError:
+                    pass
+                if server.poll() is not None:
+                    sys.exit("api.py exited before becoming ready")
+                time.sleep(0.2)
+            print(f"🧪 {data}: server ready in {time.perf_counter() - started:.1f}s; "
+                  f"{args.requests:,} requests over {args.concurrency} connections")
+
+            urls, etags = request_mix(args.requests), {}
+            for label, batch in [("cold pass", list(dict.fromkeys(urls))), ("mixed replay", urls)]:
+                results, wall = asyncio.run(
+                    drive('127.0.0.1', port, batch, args.concurrency, args.conditional, etags)
+                )
+                statuses = {}
+                for _, status, _ in results:
+                    statuses[status] = statuses.get(status, 0) + 1
+                print(f"{label}: {len(results) / wall:,.0f} req/s ({len(results):,} in {wall:.2f}s); "
+                      f"statuses {dict(sorted(statuses.items()))}")
+                report('all', [t for _, _, t in results])
+                report('200', [t for _, status, t in results if status == 200])
+                report('304', [t for _, status, t in results if status == 304])
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
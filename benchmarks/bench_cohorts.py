@@ -0,0 +1,67 @@
+"""Customer table + cohort matrix build time at 10M orders / 1M customers.
+
+Orders are synthesized in memory with the data generator (only the columns
+the cohort engine reads), sorted by date like the loader does, then the
+customer table and the channel x cohort x age matrix are built and a few
+filter states are sliced from it.
+
+Usage:
+    python benchmarks/bench_cohorts.py --rows 10_000_000 --customers 1_000_000
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.cohorts import build_cohorts  # noqa: E402
+from analytics.customers import build_customers  # noqa: E402
+from generate_data import generate_chunk  # noqa: E402
+
+COLUMNS = ['customer_id', 'date', 'registration_date', 'marketing_channel', 'net_revenue',
+           'returned', 'customer_segment', 'region']
+
+
+def synthesize(rows, customers, chunk_size=1_000_000, columns=COLUMNS):
+    labels = [col for col in ['marketing_channel', 'customer_segment', 'region', 'category'] if col in columns]
+    chunks = []
+    for start in range(0, rows, chunk_size):
+        chunk = generate_chunk(start + 1, min(chunk_size, rows - start), customers, 5_000, 42)[columns]
+        for col in labels:
+            chunk[col] = chunk[col].astype('category')
+        chunks.append(chunk)
+    df = pd.concat(chunks, ignore_index=True)
+    for col in labels:
+        df[col] = df[col].astype('category')
+    return df.sort_values('date', kind='stable', ignore_index=True)
+
+
+def timed(label, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"  {label:<32} {time.perf_counter() - started:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=10_000_000)
+    parser.add_argument('--customers', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders / {args.customers:,} customer pool")
+    df = timed("synthesize + sort", lambda: synthesize(args.rows, args.customers))
+    customers = timed("customer table", lambda: build_customers(df))
+    matrix = timed("cohort matrix (all channels)", lambda: build_cohorts(df, customers))
+    print(f"  matrix shape {matrix.active.shape}, {len(customers):,} customers")
+
+    for channel in [None, matrix.channels[0]]:
+        timed(f"retention view ({channel or 'All'})", lambda: matrix.retention(channel, 12))
+    timed("curves (every channel)", lambda: matrix.curves('revenue', 24))
+
+
+if __name__ == '__main__':
+    main()
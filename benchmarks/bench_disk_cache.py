@@ -0,0 +1,55 @@
+"""Cold start vs restart with a warm on-disk cache.
+
+Writes ``--rows`` synthetic orders to a temporary CSV, then times a cold
+start (parse, validate, build the dataset and every aggregate, store them)
+against a fresh process-equivalent load of the same entries from disk.
+
+Usage:
+    python benchmarks/bench_disk_cache.py --rows 2_000_000
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.aggregates import AGGREGATES  # noqa: E402
+from analytics.dataset import build_dataset, file_fingerprint, load_orders  # noqa: E402
+from analytics.disk_cache import DiskCache  # noqa: E402
+from bench_cohorts import timed  # noqa: E402
+from generate_data import generate_chunk  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=2_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'orders.csv')
+        print(f"🧪 {args.rows:,} orders")
+        timed("write csv", lambda: generate_chunk(1, args.rows, max(1, args.rows // 3), 5_000, 42).to_csv(path, index=False))
+        fingerprint = file_fingerprint(path)
+        cache = DiskCache(os.path.join(directory, 'cache'), max_bytes=1 << 40)
+
+        def load():
+            df, shards, validation = load_orders(path)
+            return build_dataset(df, fingerprint, shards, validation)
+
+        print("cold start")
+        dataset = timed("dataset: load + build", load)
+        values = {name: timed(f"{name}: build", lambda: builder(dataset)) for name, builder in AGGREGATES.items()}
+        timed("store all", lambda: [cache.put(name, fingerprint, value) for name, value in
+                                    [('dataset', dataset)] + list(values.items())])
+        size_mb = sum(size for _, size, _ in cache.entries()) / 1024 / 1024
+        print(f"  {'on disk':<32} {size_mb:8.1f} MB")
+
+        print("warm restart")
+        for name in ['dataset'] + list(AGGREGATES):
+            timed(f"{name}: read", lambda: cache.get(name, fingerprint))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Forecast fit time as the number of series grows.
+
+Buckets synthesized orders into (series x month) matrices for channel,
+channel x region and channel x region x category, then fits Holt-Winters
+to all series in one batch and, for contrast, one series at a time.
+
+Usage:
+    python benchmarks/bench_forecast.py --rows 2_000_000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.forecast import fit_holt_winters, series_matrix  # noqa: E402
+from bench_cohorts import synthesize, timed  # noqa: E402
+
+COLUMNS = ['customer_id', 'date', 'marketing_channel', 'region', 'category', 'net_revenue']
+SPLITS = [
+    ['marketing_channel'],
+    ['marketing_channel', 'region'],
+    ['marketing_channel', 'region', 'category'],
+]
+
+
+def best_of(fn, runs=3):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=2_000_000)
+    parser.add_argument('--customers', type=lambda s: int(s.replace('_', '')), default=200_000)
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders")
+    df = timed("synthesize + sort", lambda: synthesize(args.rows, args.customers, columns=COLUMNS))
+
+    print(f"\n  {'series':>7} {'months':>6} {'matrix':>9} {'batched fit':>12} {'per-series fit':>15}")
+    for by in SPLITS:
+        started = time.perf_counter()
+        labels, months, matrices = series_matrix(df, by)
+        build = time.perf_counter() - started
+        history = matrices['net_revenue']
+
+        batched = best_of(lambda: fit_holt_winters(history))
+        looped = best_of(lambda: [fit_holt_winters(row[None, :]) for row in history], runs=1)
+        print(f"  {len(labels):>7} {len(months):>6} {build:>8.3f}s {batched * 1000:>10.1f}ms {looped * 1000:>13.1f}ms")
+
+    wide = np.tile(history, (4, 1))
+    print(f"  {len(wide):>7} {history.shape[1]:>6} {'(tiled)':>9} "
+          f"{best_of(lambda: fit_holt_winters(wide)) * 1000:>10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Styler vs column_config cost for large KPI tables.
+
+Builds a KPI-shaped frame (the By Campaign columns) and times what each
+approach makes the server do per rerun: the Styler path formats and renders
+every cell in Python, the column_config path only serializes the raw numbers
+to Arrow and attaches a per-column format string.
+
+Usage:
+    python benchmarks/bench_formatting.py --rows 10000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from views.formatting import column_config  # noqa: E402
+
+STYLER_FORMATS = {
+    'net_revenue': '${:,.2f}',
+    'discount_amount': '${:,.2f}',
+    'quantity': '{:,.0f}',
+    'customer_id': '{:,.0f}',
+    'revenue_per_customer': '${:,.2f}',
+    'roi': '{:.2f}%'
+}
+
+
+def kpi_table(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'marketing_campaign': [f"Campaign {i}" for i in range(rows)],
+        'net_revenue': rng.gamma(2.0, 5_000.0, rows).round(2),
+        'discount_amount': rng.gamma(2.0, 500.0, rows).round(2),
+        'quantity': rng.integers(1, 5_000, rows),
+        'customer_id': rng.integers(1, 2_000, rows),
+        'revenue_per_customer': rng.gamma(2.0, 100.0, rows).round(2),
+        'roi': rng.normal(120.0, 40.0, rows).round(2),
+    })
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df = kpi_table(args.rows)
+
+    def styler():
+        df.style.format(STYLER_FORMATS).to_html()
+
+    def configured():
+        column_config(df)
+        pa.Table.from_pandas(df)
+
+    styler_s = best_of(styler, args.repeat)
+    config_s = best_of(configured, args.repeat)
+    print(f"{args.rows:,} rows  Styler: {styler_s * 1000:8.1f} ms   "
+          f"column_config: {config_s * 1000:8.1f} ms   ({styler_s / config_s:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Sharded ingestion speedup across worker counts.
+
+Writes ``--shards`` CSV shards of synthetic orders to a temporary directory
+(or reuses ``--dir``), then loads the directory with 1, 2, 4 ... workers up
+to the core count and reports wall time, speedup and the slowest shard.
+
+Usage:
+    python benchmarks/bench_ingest.py --shards 16 --rows 4_000_000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.dataset import load_orders  # noqa: E402
+from generate_data import generate_chunk  # noqa: E402
+
+
+def write_shards(directory, shards, rows):
+    per_shard = rows // shards
+    customers = max(1, rows // 3)
+    for i in range(shards):
+        chunk = generate_chunk(i * per_shard + 1, per_shard, customers, 5_000, 42 + i)
+        chunk.to_csv(os.path.join(directory, f"orders_{i:03d}.csv"), index=False)
+
+
+def worker_counts(cores):
+    counts, n = [], 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    return counts + [cores]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--shards', type=int, default=16)
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=4_000_000)
+    parser.add_argument('--dir', default=None, help="existing shard directory to load instead")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = args.dir or scratch
+        if args.dir is None:
+            print(f"🧪 writing {args.shards} shards / {args.rows:,} rows")
+            write_shards(directory, args.shards, args.rows)
+
+        print(f"\n  {'workers':>7} {'seconds':>8} {'speedup':>8} {'slowest shard':>14}")
+        baseline = None
+        for workers in worker_counts(cores):
+            started = time.perf_counter()
+            df, stats, _ = load_orders(directory, workers=workers, quarantine_path=None)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"  {workers:>7} {elapsed:>7.2f}s {baseline / elapsed:>7.2f}x {max(s.seconds for s in stats):>13.2f}s")
+        print(f"\n  {len(df):,} rows, {df.memory_usage(deep=True).sum() / 1024**2:,.0f} MB, {cores} cores")
+
+
+if __name__ == '__main__':
+    main()
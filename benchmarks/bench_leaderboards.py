@@ -0,0 +1,79 @@
+"""Leaderboard latency as the product catalog grows.
+
+Synthesizes ``--rows`` orders, then re-draws ``product_id`` from catalogs
+of increasing size (skewed popularity, as in generate_data). For each size
+it times the once-per-dataset factorization, the per-filter-state scatter
+(one channel over a quarter, and the whole history) and the top / bottom 10
+of every metric via ``np.argpartition``, and for contrast a pandas groupby
+plus full sort of the filtered orders per metric.
+
+Usage:
+    python benchmarks/bench_leaderboards.py --rows 2_000_000 --catalogs 10_000,100_000,1_000_000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.filters import order_rows, select_orders  # noqa: E402
+from analytics.leaderboards import build_leaderboard_index  # noqa: E402
+from bench_cohorts import synthesize  # noqa: E402
+
+COLUMNS = ['order_id', 'customer_id', 'product_id', 'date', 'marketing_channel', 'quantity',
+           'net_revenue', 'discount_amount', 'returned']
+FILTERS = {'one channel, one quarter': ('2023-07-01', '2023-09-30', 'Email'), 'everything': (None, None, None)}
+
+
+def best_of(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def pandas_boards(df):
+    totals = df.groupby('product_id').agg(
+        orders=('order_id', 'count'), net_revenue=('net_revenue', 'sum'), quantity=('quantity', 'sum'),
+        returned=('returned', 'sum'), discount_amount=('discount_amount', 'sum'),
+    )
+    totals['return_rate'] = totals['returned'] / totals['orders'] * 100
+    totals['roi'] = (totals['net_revenue'] - totals['discount_amount']) / totals['discount_amount'] * 100
+    return [totals.sort_values(metric, ascending=ascending).head(10)
+            for metric in ['net_revenue', 'quantity', 'return_rate', 'roi'] for ascending in (False, True)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=2_000_000)
+    parser.add_argument('--catalogs', default='10_000,100_000,1_000_000')
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders")
+    df = synthesize(args.rows, max(1, args.rows // 3), columns=COLUMNS)
+    rng = np.random.default_rng(0)
+    draws = rng.random(len(df)) ** 2.2
+
+    for catalog in [int(c.replace('_', '')) for c in args.catalogs.split(',')]:
+        df['product_id'] = np.minimum((catalog * draws).astype(np.int64), catalog - 1) + 1
+        build, index = best_of(lambda: build_leaderboard_index(df), repeat=1)
+        print(f"catalog {catalog:>10,}: {df['product_id'].nunique():,} products sold, index {build:.2f}s")
+        for label, (start, end, channel) in FILTERS.items():
+            rows = order_rows(df, start, end, marketing_channel=channel)
+            scatter, totals = best_of(lambda: index.totals(df, 'product_id', rows))
+            select, _ = best_of(lambda: [totals.leaderboard(metric, 10, largest)
+                                         for metric in totals.metrics() for largest in (True, False)])
+            filtered = select_orders(df, start, end, marketing_channel=channel)
+            baseline, _ = best_of(lambda: pandas_boards(filtered))
+            print(f"  {label:<26} scatter {scatter * 1000:7.1f} ms  8 boards {select * 1000:6.1f} ms  "
+                  f"| groupby + sort {baseline * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
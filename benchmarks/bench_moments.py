@@ -0,0 +1,62 @@
+"""Correlation queries from per-(month, channel) moments vs from the rows.
+
+Builds the moment table over ``--rows`` synthesized orders, then times
+correlation matrices and the cell-level key correlations for a few filter
+selections against ``DataFrame.corr`` over the selected rows, and folding a
+new month of orders in with ``append`` against rebuilding the table. The
+largest absolute difference from the row-level matrix is reported too.
+
+Usage:
+    python benchmarks/bench_moments.py --rows 5_000_000
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.filters import select_orders  # noqa: E402
+from analytics.moments import MOMENT_COLUMNS, build_moments  # noqa: E402
+from bench_cohorts import synthesize, timed  # noqa: E402
+from bench_leaderboards import best_of  # noqa: E402
+
+SELECTIONS = {
+    'everything': (None, None, None),
+    'one channel': (None, None, 'Email'),
+    'one channel, one year': ('2023-01-01', '2023-12-31', 'Email'),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=5_000_000)
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders")
+    df = synthesize(args.rows, max(1, args.rows // 3),
+                    columns=['customer_id', 'date', 'marketing_channel'] + MOMENT_COLUMNS)
+    table = timed("build moment table", lambda: build_moments(df))
+    print(f"  {table.n.size:,} (month, channel) groups x {len(table.columns)} columns")
+
+    for label, (start, end, channel) in SELECTIONS.items():
+        merged, (matrix, _) = best_of(lambda: table.correlation(channel, start, end))
+        key, _ = best_of(lambda: table.key_correlations(channel, start, end))
+        rows = select_orders(df, start, end, marketing_channel=channel)[table.columns]
+        direct, expected = best_of(lambda: rows.corr(), repeat=1)
+        error = np.nanmax(np.abs(matrix.to_numpy() - expected.to_numpy()))
+        print(f"  {label:<24} matrix {merged * 1000:6.2f} ms  key {key * 1000:6.2f} ms  "
+              f"| DataFrame.corr {direct * 1000:8.1f} ms  max |diff| {error:.1e}")
+
+    last_month = df['date'].dt.to_period('M').max().to_timestamp()
+    history, latest = df[df['date'] < last_month], df[df['date'] >= last_month]
+    base = build_moments(history)
+    append, _ = best_of(lambda: base.append(latest), repeat=1)
+    rebuild, _ = best_of(lambda: build_moments(df), repeat=1)
+    print(f"  fold in last month ({len(latest):,} rows): append {append * 1000:.1f} ms  | rebuild {rebuild * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""RFM rescoring cost: sorted per-customer index vs a groupby rescan.
+
+Builds the (customer, day) index once, then scores several as-of dates
+from it, and compares with recomputing recency/frequency/monetary by a
+pandas groupby over the orders up to each date.
+
+Usage:
+    python benchmarks/bench_rfm.py --rows 10_000_000 --customers 1_000_000
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.customers import build_customers  # noqa: E402
+from analytics.rfm import build_rfm  # noqa: E402
+from bench_cohorts import synthesize, timed  # noqa: E402
+
+
+def groupby_rfm(df, as_of):
+    rows = df[df['date'] < as_of + pd.Timedelta(days=1)]
+    grouped = rows.groupby('customer_id').agg(
+        last=('date', 'max'), frequency=('date', 'size'), monetary=('net_revenue', 'sum')
+    )
+    grouped['recency_days'] = (as_of - grouped['last'].dt.normalize()).dt.days
+    return grouped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=10_000_000)
+    parser.add_argument('--customers', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders / {args.customers:,} customer pool")
+    df = timed("synthesize + sort", lambda: synthesize(args.rows, args.customers))
+    customers = timed("customer table", lambda: build_customers(df))
+    index = timed("rfm index (one sort)", lambda: build_rfm(df, customers))
+
+    last = index.last_date
+    for months in [0, 6, 12]:
+        as_of = last - pd.DateOffset(months=months)
+        label = as_of.strftime('%Y-%m-%d')
+        timed(f"index score  {label}", lambda: index.score(as_of))
+        timed(f"groupby only {label}", lambda: groupby_rfm(df, as_of))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""All-pairs campaign significance tests: broadcast over sufficient statistics vs a pair loop.
+
+Synthesizes ``--rows`` orders spread over K campaigns, reduces them to
+per-campaign sufficient statistics, then times every pairwise test of the
+three metrics (K (K - 1) / 2 pairs each, Holm-corrected) against the same
+z-tests written as a Python loop over pairs with ``math.erfc``.
+
+Usage:
+    python benchmarks/bench_significance.py --rows 2_000_000 --campaigns 10,100,500,1000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.significance import adjust_p, build_group_stats  # noqa: E402
+from bench_leaderboards import best_of  # noqa: E402
+
+LOOP_PAIR_LIMIT = 200_000
+
+
+def synthesize(rows, campaigns, seed=0):
+    rng = np.random.default_rng(seed)
+    campaign = rng.integers(0, campaigns, rows)
+    return pd.DataFrame({
+        'marketing_campaign': pd.Categorical.from_codes(campaign, [f"Campaign {i:04d}" for i in range(campaigns)]),
+        'net_revenue': rng.gamma(2.0, 60.0 * (1 + campaign % 7 / 20)),
+        'returned': (rng.random(rows) < 0.08 + campaign % 5 / 200).astype(np.int64),
+    })
+
+
+def looped(stats):
+    n, x = stats.n, stats.successes['return_rate']
+    p = []
+    for a in range(len(n)):
+        for b in range(a + 1, len(n)):
+            pooled = (x[a] + x[b]) / (n[a] + n[b])
+            se = math.sqrt(pooled * (1 - pooled) * (1 / n[a] + 1 / n[b]))
+            z = (x[b] / n[b] - x[a] / n[a]) / se if se > 0 else 0.0
+            p.append(math.erfc(abs(z) / math.sqrt(2)))
+    return adjust_p(np.array(p))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=2_000_000)
+    parser.add_argument('--campaigns', default='10,100,500,1000')
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders")
+    for campaigns in [int(c) for c in args.campaigns.split(',')]:
+        df = synthesize(args.rows, campaigns)
+        started = time.perf_counter()
+        stats = build_group_stats(df)
+        build = time.perf_counter() - started
+        pairs = campaigns * (campaigns - 1) // 2
+        tests, _ = best_of(lambda: [stats.compare(metric, min_orders=2) for metric in stats.metrics()])
+        line = (f"  {campaigns:>5} campaigns ({pairs:>7,} pairs): statistics {build * 1000:6.1f} ms  "
+                f"{len(stats.metrics())} metrics x all pairs {tests * 1000:7.1f} ms")
+        if pairs <= LOOP_PAIR_LIMIT:
+            loop, _ = best_of(lambda: looped(stats), repeat=1)
+            line += f"  | 1 metric as a pair loop {loop * 1000:8.1f} ms"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
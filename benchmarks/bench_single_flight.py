@@ -0,0 +1,130 @@
+"""32 sessions hitting a cold server at once, with and without single-flight.
+
+Writes ``--rows`` synthetic orders to a temporary CSV, then starts
+``--sessions`` threads behind a barrier that all ask for the dataset and
+every aggregate, the way sessions do on the first page load after new data
+lands. Each mode runs in its own process so peak RSS is comparable. With
+single-flight every key must be computed exactly once and every session
+must get the same objects.
+
+Usage:
+    python benchmarks/bench_single_flight.py --rows 500_000 --sessions 32
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.aggregates import AGGREGATES  # noqa: E402
+from analytics.dataset import build_dataset, file_fingerprint, load_orders  # noqa: E402
+from analytics.single_flight import SingleFlight  # noqa: E402
+from generate_data import generate_chunk  # noqa: E402
+
+
+class Direct:
+    """No coalescing: every caller computes."""
+
+    def do(self, key, compute):
+        return compute()
+
+
+def run_sessions(path, sessions, flights):
+    fingerprint = file_fingerprint(path)
+    builds = {}
+    counted = threading.Lock()
+
+    def count(key, fn):
+        def compute():
+            with counted:
+                builds[key] = builds.get(key, 0) + 1
+            return fn()
+        return compute
+
+    def load():
+        df, shards, validation = load_orders(path, workers=1)
+        return build_dataset(df, fingerprint, shards, validation)
+
+    barrier = threading.Barrier(sessions)
+    results = [None] * sessions
+    latencies = [0.0] * sessions
+
+    def session(i):
+        barrier.wait()
+        started = time.perf_counter()
+        dataset = flights.do(('dataset', fingerprint), count('dataset', load))
+        values = [
+            flights.do((name, fingerprint), count(name, lambda builder=builder: builder(dataset)))
+            for name, builder in AGGREGATES.items()
+        ]
+        latencies[i] = time.perf_counter() - started
+        results[i] = [dataset] + values
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    shared = all(all(a is b for a, b in zip(result, results[0])) for result in results)
+    latencies.sort()
+    return {
+        'wall': wall,
+        'p50': latencies[len(latencies) // 2],
+        'max': latencies[-1],
+        'builds': builds,
+        'shared': shared,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'stats': vars(flights.stats()) if isinstance(flights, SingleFlight) else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=500_000)
+    parser.add_argument('--sessions', type=int, default=32)
+    parser.add_argument('--mode', choices=['direct', 'single-flight'], default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--path', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        flights = SingleFlight() if args.mode == 'single-flight' else Direct()
+        print(json.dumps(run_sessions(args.path, args.sessions, flights)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'orders.csv')
+        generate_chunk(1, args.rows, max(1, args.rows // 3), 5_000, 42).to_csv(path, index=False)
+        print(f"🧪 {args.rows:,} orders, {args.sessions} simultaneous sessions, {len(AGGREGATES) + 1} keys")
+        for mode in ['direct', 'single-flight']:
+            output = subprocess.run(
+                [sys.executable, __file__, '--mode', mode, '--path', path, '--sessions', str(args.sessions)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode}")
+            print(f"  {'wall':<28} {result['wall']:8.2f}s")
+            print(f"  {'session latency p50 / max':<28} {result['p50']:8.2f}s / {result['max']:.2f}s")
+            print(f"  {'computations':<28} {sum(result['builds'].values()):8d}")
+            print(f"  {'peak RSS':<28} {result['peak_rss_mb']:8.0f} MB")
+            if result['stats']:
+                stats = result['stats']
+                print(f"  {'coalesced calls':<28} {stats['coalesced']:8d}")
+                print(f"  {'total wait':<28} {stats['wait_seconds']:8.2f}s (max {stats['max_wait_seconds']:.2f}s)")
+                once = all(n == 1 for n in result['builds'].values())
+                print(f"  {'each key computed once':<28} {'yes' if once else 'NO':>8}")
+                print(f"  {'all sessions share results':<28} {'yes' if result['shared'] else 'NO':>8}")
+                if not (once and result['shared']):
+                    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Cold-start time-to-first-render of the dashboard.
+
+Each sample runs in a fresh interpreter: streamlit itself is imported first
+(a running server already has it), then the app script is executed once via
+streamlit's AppTest and the wall time of that first run is recorded. Pass
+``--rev`` to measure an older commit of this repository for comparison.
+
+Usage:
+    python benchmarks/bench_startup.py --data cleaned_data.csv
+    python benchmarks/bench_startup.py --data cleaned_data.csv --rev HEAD~1
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = r"""
+import os, sys, time
+from streamlit.testing.v1 import AppTest
+os.chdir(sys.argv[1])
+sys.path.insert(0, sys.argv[1])
+t0 = time.perf_counter()
+at = AppTest.from_file(os.path.join(sys.argv[1], 'app.py'), default_timeout=600)
+at.run()
+home = time.perf_counter() - t0
+t1 = time.perf_counter()
+at.sidebar.radio[0].set_value(sys.argv[2]).run()
+print(home, time.perf_counter() - t1, 'plotly' in ' '.join(sys.modules))
+"""
+
+
+def checkout(rev, dest):
+    archive = subprocess.run(['git', '-C', ROOT, 'archive', rev], check=True, capture_output=True).stdout
+    subprocess.run(['tar', '-x', '-C', dest], input=archive, check=True)
+    return dest
+
+
+def measure(app_dir, runs, chart_page):
+    home, chart = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', _PROBE, app_dir, chart_page],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        home.append(float(out[0]))
+        chart.append(float(out[1]))
+    return home, chart
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data', required=True, help="cleaned_data.csv to serve")
+    parser.add_argument('--rev', default=None, help="git revision to measure (default: working tree)")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--chart-page', default="📊 Analytics Dashboard")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app_dir = checkout(args.rev, tmp) if args.rev else ROOT
+        link = os.path.join(app_dir, 'cleaned_data.csv')
+        created = not os.path.exists(link)
+        if created:
+            os.symlink(os.path.abspath(args.data), link)
+        try:
+            home, chart = measure(app_dir, args.runs, args.chart_page)
+        finally:
+            if created:
+                os.remove(link)
+
+    label = args.rev or 'working tree'
+    print(f"{label}: first render (Home) median {statistics.median(home):.2f}s, "
+          f"first chart page median {statistics.median(chart):.2f}s over {args.runs} cold runs")
+
+
+if __name__ == '__main__':
+    main()
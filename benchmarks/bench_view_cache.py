@@ -0,0 +1,96 @@
+"""Hit rate and page latency of the per-filter-state views before and after warming.
+
+Builds a dataset from ``--rows`` synthesized orders and an access log of
+``--views`` page views spread over filter states with a Zipf-like
+popularity: every channel and the last 3 / 6 / 12 months of the dashboard,
+explorer selections, plus a long tail of custom date ranges. Each state's
+views are computed once cold and read once from the disk cache; for several
+``k`` the top-k states are warmed and the hit rate and mean view time of
+the logged traffic are reported.
+
+Usage:
+    python benchmarks/bench_view_cache.py --rows 1_000_000 --views 20_000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.access_log import AccessLog, hit_rate, normalize_state  # noqa: E402
+from analytics.aggregates import PAGE_VIEWS, VIEWS, view_name  # noqa: E402
+from analytics.dataset import build_dataset  # noqa: E402
+from analytics.disk_cache import DiskCache  # noqa: E402
+from bench_cohorts import synthesize, timed  # noqa: E402
+from generate_data import generate_chunk  # noqa: E402
+
+
+def states(dataset, rng, n_custom=60):
+    first, last = dataset.profile.date_min, dataset.profile.date_max
+    channels = list(dataset.df['marketing_channel'].cat.categories)
+
+    def dashboard(channel=None, start=None, end=None):
+        return normalize_state('dashboard', first, last, channel=channel, start=start, end=end)
+
+    popular = [dashboard()] + [dashboard(channel) for channel in channels]
+    popular += [dashboard(start=last - pd.DateOffset(months=m) + pd.Timedelta(days=1)) for m in (3, 6, 12)]
+    popular += [normalize_state('explorer', first, last, category=c) for c in dataset.df['category'].cat.categories]
+    span = (last - first).days
+    custom = [dashboard(rng.choice(channels), first + pd.Timedelta(days=int(d)), first + pd.Timedelta(days=int(d) + 45))
+              for d in rng.integers(0, span - 45, n_custom)]
+    return popular + custom
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    parser.add_argument('--views', type=lambda s: int(s.replace('_', '')), default=20_000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"🔥 {args.rows:,} orders, {args.views:,} logged views")
+    df = synthesize(args.rows, max(1, args.rows // 3), columns=list(generate_chunk(1, 1, 1, 1, 0).columns))
+    dataset = timed("dataset", lambda: build_dataset(df, 'bench'))
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = AccessLog(os.path.join(directory, 'access.log'), max_bytes=1 << 40)
+        candidates = states(dataset, rng)
+        weights = 1 / np.arange(1, len(candidates) + 1) ** 1.2
+        timed("write access log", lambda: [log.record(candidates[i]) for i in
+                                           rng.choice(len(candidates), args.views, p=weights / weights.sum())])
+        counts = timed("read access log", log.counts)
+        print(f"  {len(counts)} distinct states")
+
+        # Cold compute and disk read time of every logged state's views
+        cache = DiskCache(os.path.join(directory, 'cache'), max_bytes=1 << 40)
+        cold, hot = {}, {}
+        for state in counts:
+            filters = state.filters(dataset.profile.date_min, dataset.profile.date_max)
+            started = time.perf_counter()
+            values = {name: VIEWS[name](dataset, **filters) for name in PAGE_VIEWS[state.page]}
+            cold[state] = time.perf_counter() - started
+            for name, value in values.items():
+                cache.put(view_name(name, filters), dataset.fingerprint, value)
+            started = time.perf_counter()
+            for name in values:
+                cache.get(view_name(name, filters), dataset.fingerprint)
+            hot[state] = time.perf_counter() - started
+
+        total = sum(counts.values())
+        ranked = [state for state, _ in counts.most_common()]
+        for k in [0, 5, 10, 20, 50, len(ranked)]:
+            warmed = set(ranked[:k])
+            rate = hit_rate(counts, warmed.__contains__)
+            mean = sum(n * (hot if state in warmed else cold)[state] for state, n in counts.items()) / total
+            warm_time = sum(cold[state] for state in warmed)
+            print(f"  top {k:>3}: hit rate {rate:6.1%}  mean view {mean * 1000:7.1f} ms  warm job {warm_time:6.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Budget what-if simulation time: vectorized bootstrap vs a per-resample loop.
+
+Tabulates per-channel monthly spend / revenue / conversions from
+``--rows`` synthesized orders, then times the bootstrap of revenue and
+conversions per $ of spend for several resample counts and history
+windows, and one scenario projection, against the same bootstrap written
+as a Python loop over resamples.
+
+Usage:
+    python benchmarks/bench_whatif.py --rows 1_000_000
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analytics.whatif import build_channel_history  # noqa: E402
+from bench_cohorts import synthesize, timed  # noqa: E402
+from bench_leaderboards import best_of  # noqa: E402
+
+
+def looped(history, window, n_resamples, seed=0):
+    rng = np.random.default_rng(seed)
+    spend, revenue = history.spend[:, -window:], history.revenue[:, -window:]
+    draws = np.empty((n_resamples, len(history.channels)))
+    for b in range(n_resamples):
+        for c in range(len(history.channels)):
+            picks = rng.integers(0, window, size=window)
+            draws[b, c] = revenue[c, picks].sum() / spend[c, picks].sum()
+    return draws
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"🧪 {args.rows:,} orders")
+    df = synthesize(args.rows, max(1, args.rows // 3),
+                    columns=['customer_id', 'date', 'month_date', 'marketing_channel', 'net_revenue', 'discount_amount'])
+    history = timed("monthly channel history", lambda: build_channel_history(df))
+    print(f"  {len(history.channels)} channels x {len(history.months)} months")
+    multipliers = np.linspace(0.7, 1.3, len(history.channels))
+
+    for window in [12, min(36, len(history.months))]:
+        for n_resamples in [1_000, 4_000, 20_000]:
+            boot, returns = best_of(lambda: history.bootstrap(window, n_resamples))
+            project, _ = best_of(lambda: returns.project(multipliers, 0.8, 90, 3))
+            line = (f"  window {window:>2}, {n_resamples:>6,} resamples: bootstrap {boot * 1000:7.1f} ms  "
+                    f"project {project * 1000:5.1f} ms")
+            if n_resamples <= 4_000:
+                loop, _ = best_of(lambda: looped(history, window, n_resamples), repeat=1)
+                line += f"  | loop {loop * 1000:8.1f} ms"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+"""Synthetic order data generator matching the cleaned_data.csv schema.
+
+Every column is produced with vectorized NumPy operations, one chunk at a
+time, so memory stays bounded by ``--chunk-size`` no matter how many rows
+are requested. Per-customer attributes (registration date, segment, region,
+acquisition channel, CLV, retention) are derived from a hash of the
+customer id instead of being stored in lookup tables, which keeps 100M-row
+runs as cheap on memory as 10k-row runs.
+
+Usage:
+    python generate_data.py                                # 12,000 rows -> cleaned_data.csv
+    python generate_data.py --rows 10_000_000 --out orders.parquet
+    python generate_data.py --rows 100_000_000 --chunk-size 2_000_000 --out big.csv
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# SCHEMA VOCABULARIES
+# =============================================================================
+START_DATE = np.datetime64('2021-01-01')
+END_DATE = np.datetime64('2024-01-31')
+
+CHANNELS = np.array([
+    'Email', 'Direct', 'Social Media', 'Outdoor', 'Print', 'Affiliate',
+    'Influencer', 'Mobile App', 'Referral', 'Radio', 'TV', 'Search Engine'
+])
+CHANNEL_WEIGHTS = np.array([1.10, 1.08, 1.05, 1.00, 1.00, 0.97, 0.99, 0.98, 0.99, 1.00, 0.96, 1.02])
+
+CATEGORIES = np.array([
+    'Electronics', 'Fashion', 'Home & Kitchen', 'Beauty', 'Sports',
+    'Books', 'Toys', 'Grocery'
+])
+CATEGORY_WEIGHTS = np.array([0.18, 0.20, 0.14, 0.12, 0.10, 0.09, 0.08, 0.09])
+# Median unit price and lognormal spread per category
+CATEGORY_PRICE = np.array([420.0, 65.0, 110.0, 35.0, 90.0, 18.0, 30.0, 12.0])
+CATEGORY_SIGMA = np.array([0.65, 0.55, 0.60, 0.50, 0.60, 0.40, 0.50, 0.45])
+CATEGORY_RETURN_RATE = np.array([0.09, 0.16, 0.07, 0.05, 0.08, 0.03, 0.06, 0.02])
+
+CAMPAIGNS = np.array([
+    'New Year Sale', 'Spring Launch', 'Summer Sale', 'Back to School',
+    'Black Friday', 'Holiday Special', 'Flash Deals', 'Loyalty Rewards',
+    'Referral Bonus', 'Clearance'
+])
+# Campaign that runs in each calendar month (index 0 = January)
+SEASONAL_CAMPAIGN = np.array([0, 0, 1, 1, 1, 2, 2, 3, 3, 6, 4, 5])
+ALWAYS_ON_CAMPAIGNS = np.array([6, 7, 8, 9])
+
+SEGMENTS = np.array(['VIP', 'Regular', 'New'])
+SEGMENT_CUTS = np.array([0.15, 0.70])
+SEGMENT_CLV = np.array([6500.0, 2400.0, 700.0])
+SEGMENT_RETENTION = np.array([82.0, 61.0, 35.0])
+
+REGIONS = np.array(['North', 'South', 'East', 'West', 'Central'])
+REGION_CUTS = np.array([0.24, 0.45, 0.66, 0.88])
+
+QUARTERS = np.array(['Q1', 'Q2', 'Q3', 'Q4'])
+SEASONS = np.array(['Winter', 'Spring', 'Summer', 'Fall'])
+MONTH_TO_SEASON = np.array([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0])
+
+COLUMNS = [
+    'order_id', 'customer_id', 'product_id', 'date', 'registration_date',
+    'month_date', 'month', 'quarter', 'season', 'category', 'quantity',
+    'gross_revenue', 'net_revenue', 'discount_amount', 'final_amount',
+    'returned', 'marketing_channel', 'marketing_campaign', 'roi',
+    'customer_segment', 'region', 'retention_score', 'satisfaction_rating',
+    'customer_lifetime_value'
+]
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+def _hash_uniform(ids, salt):
+    """Deterministic uniform [0, 1) floats from integer ids (splitmix64)."""
+    z = ids.astype(np.uint64) + np.uint64((salt * 0x9E3779B97F4A7C15) % (1 << 64))
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _hash_normal(ids, salt):
+    """Deterministic standard normals from integer ids (Box-Muller)."""
+    u1 = np.maximum(_hash_uniform(ids, salt), 1e-12)
+    u2 = _hash_uniform(ids, salt + 7919)
+    return np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
+
+
+def _daily_demand_cdf():
+    """Cumulative demand curve over the calendar: growth ramp x seasonality."""
+    days = np.arange(START_DATE, END_DATE + 1, dtype='datetime64[D]')
+    t = np.arange(len(days), dtype=np.float64) / len(days)
+    month = (days.astype('datetime64[M]').astype(np.int64) % 12)
+    weekday = (days.astype(np.int64) + 3) % 7  # 0 = Monday
+
+    growth = 1.0 / (1.0 + np.exp(-9.0 * (t - 0.35)))
+    seasonality = 1.0 + 0.18 * np.sin(2 * np.pi * (month - 3) / 12.0)
+    seasonality[month == 10] *= 1.35   # November
+    seasonality[month == 11] *= 1.25   # December
+    weekly = np.where(weekday >= 5, 1.12, 1.0)
+
+    weights = growth * seasonality * weekly
+    cdf = np.cumsum(weights)
+    return days, cdf / cdf[-1]
+
+
+DAYS, DEMAND_CDF = _daily_demand_cdf()
+
+
+# =============================================================================
+# CHUNK GENERATION
+# =============================================================================
+def generate_chunk(first_order_id, n_rows, n_customers, n_products, seed):
+    """Build one DataFrame chunk of ``n_rows`` orders."""
+    rng = np.random.default_rng([seed, first_order_id])
+    n_days = len(DAYS)
+
+    # ---- customers: skewed popularity, attributes hashed from the id ----
+    customer_idx = np.minimum((n_customers * rng.random(n_rows) ** 1.6).astype(np.int64), n_customers - 1)
+    customer_id = customer_idx + 1
+
+    reg_day = np.searchsorted(DEMAND_CDF, _hash_uniform(customer_id, 1))
+    reg_day = np.minimum(reg_day, n_days - 1)
+    segment_code = np.searchsorted(SEGMENT_CUTS, _hash_uniform(customer_id, 2), side='right')
+    region_code = np.searchsorted(REGION_CUTS, _hash_uniform(customer_id, 3), side='right')
+    channel_cdf = np.cumsum(CHANNEL_WEIGHTS) / CHANNEL_WEIGHTS.sum()
+    home_channel = np.minimum(np.searchsorted(channel_cdf, _hash_uniform(customer_id, 4)), len(CHANNELS) - 1)
+
+    clv = SEGMENT_CLV[segment_code] * np.exp(0.45 * _hash_normal(customer_id, 5))
+    retention = np.clip(SEGMENT_RETENTION[segment_code] + 12.0 * _hash_normal(customer_id, 6), 0, 100)
+
+    # ---- order date: after registration, most activity soon after signup ----
+    remaining = n_days - reg_day
+    order_day = reg_day + (remaining * rng.random(n_rows) ** 2.5).astype(np.int64)
+    order_day = np.minimum(order_day, n_days - 1)
+    date = DAYS[order_day]
+    registration_date = DAYS[reg_day]
+    month_date = date.astype('datetime64[M]')
+    month_idx = month_date.astype(np.int64) % 12
+
+    # ---- channel / campaign ----
+    switch = rng.random(n_rows) < 0.3
+    channel_code = np.where(switch, rng.integers(0, len(CHANNELS), n_rows), home_channel)
+    seasonal = rng.random(n_rows) < 0.6
+    campaign_code = np.where(
+        seasonal,
+        SEASONAL_CAMPAIGN[month_idx],
+        ALWAYS_ON_CAMPAIGNS[rng.integers(0, len(ALWAYS_ON_CAMPAIGNS), n_rows)]
+    )
+
+    # ---- product / basket ----
+    category_cdf = np.cumsum(CATEGORY_WEIGHTS) / CATEGORY_WEIGHTS.sum()
+    category_code = np.minimum(np.searchsorted(category_cdf, rng.random(n_rows)), len(CATEGORIES) - 1)
+    products_per_cat = max(1, n_products // len(CATEGORIES))
+    product_rank = np.minimum((products_per_cat * rng.random(n_rows) ** 2.2).astype(np.int64), products_per_cat - 1)
+    product_id = category_code * products_per_cat + product_rank + 1
+
+    quantity = 1 + rng.poisson(0.8, n_rows)
+    unit_price = CATEGORY_PRICE[category_code] * np.exp(CATEGORY_SIGMA[category_code] * rng.standard_normal(n_rows))
+    gross_revenue = np.round(quantity * unit_price, 2)
+
+    discount_rate = np.where(
+        rng.random(n_rows) < np.where(segment_code == 0, 0.75, 0.55),
+        rng.uniform(0.05, 0.30, n_rows),
+        0.0
+    )
+    discount_amount = np.round(gross_revenue * discount_rate, 2)
+    net_revenue = np.round(gross_revenue - discount_amount, 2)
+    shipping = np.where(net_revenue >= 50.0, 0.0, 5.99)
+    final_amount = np.round(net_revenue + shipping, 2)
+
+    # Like the real export, orders without a discount get an infinite ROI;
+    # validation repairs it to NaN on load (roi_undefined)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.round((net_revenue - discount_amount) / discount_amount * 100, 2)
+
+    returned = (rng.random(n_rows) < CATEGORY_RETURN_RATE[category_code]).astype(np.int8)
+    satisfaction = np.clip(
+        np.round(4.1 + 0.8 * rng.standard_normal(n_rows) - 1.3 * returned), 1, 5
+    ).astype(np.int8)
+
+    return pd.DataFrame({
+        'order_id': np.arange(first_order_id, first_order_id + n_rows, dtype=np.int64),
+        'customer_id': customer_id,
+        'product_id': product_id,
+        'date': date,
+        'registration_date': registration_date,
+        'month_date': month_date.astype('datetime64[D]'),
+        'month': (month_idx + 1).astype(np.int8),
+        'quarter': QUARTERS[month_idx // 3],
+        'season': SEASONS[MONTH_TO_SEASON[month_idx]],
+        'category': CATEGORIES[category_code],
+        'quantity': quantity,
+        'gross_revenue': gross_revenue,
+        'net_revenue': net_revenue,
+        'discount_amount': discount_amount,
+        'final_amount': final_amount,
+        'returned': returned,
+        'marketing_channel': CHANNELS[channel_code],
+        'marketing_campaign': CAMPAIGNS[campaign_code],
+        'roi': roi,
+        'customer_segment': SEGMENTS[segment_code],
+        'region': REGIONS[region_code],
+        'retention_score': np.round(retention, 2),
+        'satisfaction_rating': satisfaction,
+        'customer_lifetime_value': np.round(clv, 2),
+    }, columns=COLUMNS)
+
+
+# =============================================================================
+# WRITERS
+# =============================================================================
+class _CsvWriter:
+    def __init__(self, path):
+        self.path = path
+        self.header = True
+
+    def write(self, chunk):
+        chunk.to_csv(
+            self.path,
+            mode='w' if self.header else 'a',
+            header=self.header,
+            index=False,
+            date_format='%Y-%m-%d'
+        )
+        self.header = False
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("❌ Parquet output needs pyarrow (pip install pyarrow)")
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.writer = None
+
+    def write(self, chunk):
+        table = self.pa.Table.from_pandas(chunk, preserve_index=False)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema, compression='zstd')
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def generate(path, rows, chunk_size=1_000_000, orders_per_customer=3.0,
+             products=5_000, seed=42, fmt=None, progress=True):
+    """Stream ``rows`` synthetic orders to ``path`` in ``chunk_size`` pieces."""
+    fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+    writer = _ParquetWriter(path) if fmt == 'parquet' else _CsvWriter(path)
+    n_customers = max(1, int(rows / orders_per_customer))
+
+    started = time.perf_counter()
+    written = 0
+    try:
+        while written < rows:
+            n = min(chunk_size, rows - written)
+            writer.write(generate_chunk(written + 1, n, n_customers, products, seed))
+            written += n
+            if progress:
+                elapsed = time.perf_counter() - started
+                print(f"  {written:>13,} / {rows:,} rows  ({written / elapsed:,.0f} rows/s)", flush=True)
+    finally:
+        writer.close()
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic e-commerce orders data")
+    parser.add_argument('--rows', type=lambda s: int(s.replace('_', '')), default=12_000)
+    parser.add_argument('--out', default='cleaned_data.csv')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=None,
+                        help="defaults to the --out file extension")
+    parser.add_argument('--chunk-size', type=lambda s: int(s.replace('_', '')), default=1_000_000)
+    parser.add_argument('--orders-per-customer', type=float, default=3.0)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print(f"🛒 Generating {args.rows:,} orders -> {args.out}")
+    started = time.perf_counter()
+    generate(args.out, args.rows, args.chunk_size, args.orders_per_customer,
+             args.products, args.seed, args.format)
+    size_mb = os.path.getsize(args.out) / 1024**2
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s ({size_mb:,.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
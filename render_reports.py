@@ -0,0 +1,309 @@
+"""Render dashboard KPI snapshots for a batch of filter presets, offline.
+
+For every preset (a channel and/or date range, like the dashboard sidebar)
+this writes a standalone HTML page with the KPI tabs (overall, category,
+campaign, channel, segment, region, month/quarter/season) and the Trends
+and Performance charts, plus every table as CSV and/or Parquet.
+
+Numbers come from ``analytics.metrics`` and charts from ``views.charts``,
+the same code the dashboard runs. Presets that share a date range share
+their work: each table is grouped by channel once for the range and every
+channel preset takes its slice, instead of re-filtering and re-grouping the
+orders per preset. HTML rendering and file writing run in a process pool.
+
+Presets (``--presets``, comma separated):
+    all                     every channel, full date range
+    channels                one preset per channel, full date range
+    last-quarter            every channel, last complete calendar quarter
+    channels-last-quarter   one preset per channel, last complete quarter
+plus any number of ``--preset NAME:CHANNEL:START:END`` (empty parts = no filter).
+
+Usage:
+    python render_reports.py                                  # -> reports/<today>/
+    python render_reports.py --presets all,last-quarter --formats csv
+    python render_reports.py --preset "email-q3:Email:2023-07-01:2023-09-30" --workers 4
+"""
+import argparse
+import html
+import importlib.util
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import pandas as pd
+
+from analytics.dataset import DATA_PATH, build_dataset, file_fingerprint, load_orders, source_keys
+from analytics.disk_cache import DiskCache
+from analytics.filters import select_orders
+from analytics.metrics import BREAKDOWNS, channel_performance, efficiency_scores, kpi_breakdown, monthly_trends, overall_kpis
+
+PRESET_GROUPS = ['all', 'channels', 'last-quarter', 'channels-last-quarter']
+CHANNEL = 'marketing_channel'
+KPI_TABS = ['category', 'campaign', 'channel', 'segment', 'region', 'month', 'quarter', 'season']
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>{script}
+<style>
+body {{ background: #0f1419; color: #f5f5f5; font-family: -apple-system, Segoe UI, Roboto, sans-serif; margin: 2rem; }}
+h1 {{ color: #00d9ff; }} h2 {{ border-bottom: 1px solid #2a3142; padding-bottom: .3rem; margin-top: 2.5rem; }}
+table {{ border-collapse: collapse; font-size: .9rem; }}
+th, td {{ padding: .3rem .8rem; border-bottom: 1px solid #2a3142; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+.muted {{ color: #9aa4b2; }}
+</style></head>
+<body><h1>{title}</h1><p class="muted">{subtitle}</p>
+{body}
+</body></html>
+"""
+
+
+@dataclass(frozen=True)
+class Preset:
+    name: str
+    channel: str = None
+    start: pd.Timestamp = None
+    end: pd.Timestamp = None
+
+    def describe(self):
+        span = (f"{self.start:%Y-%m-%d} to {self.end:%Y-%m-%d}" if self.start is not None
+                else "full date range")
+        return f"{self.channel or 'All Channels'}, {span}"
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', str(text).lower()).strip('-')
+
+
+def last_quarter(date_max):
+    """(start, end) of the last calendar quarter that ends on or before ``date_max``."""
+    quarter = pd.Period(date_max, 'Q')
+    if pd.Timestamp(date_max).normalize() < quarter.end_time.normalize():
+        quarter -= 1
+    return quarter.start_time, quarter.end_time.normalize()
+
+
+def parse_preset(text):
+    name, channel, start, end = (text.split(':') + [''] * 4)[:4]
+    # The name becomes a directory under the batch: '../x' or 'a/b' must not leave it
+    name = _slug(name) or 'preset'
+    return Preset(name, channel or None, pd.Timestamp(start) if start else None, pd.Timestamp(end) if end else None)
+
+
+def build_presets(dataset, groups, custom=()):
+    channels = sorted(dataset.df[CHANNEL].dropna().unique().tolist()) if CHANNEL in dataset.df.columns else []
+    quarter = last_quarter(dataset.profile.date_max) if dataset.profile.date_max is not None else (None, None)
+    presets = []
+    for group in groups:
+        if group == 'all':
+            presets.append(Preset('all'))
+        elif group == 'channels':
+            presets += [Preset(f"channel-{_slug(c)}", c) for c in channels]
+        elif group == 'last-quarter' and quarter[0] is not None:
+            presets.append(Preset('last-quarter', None, *quarter))
+        elif group == 'channels-last-quarter' and quarter[0] is not None:
+            presets += [Preset(f"channel-{_slug(c)}-last-quarter", c, *quarter) for c in channels]
+    return presets + [parse_preset(text) for text in custom]
+
+
+# =============================================================================
+# SHARED COMPUTATION
+# =============================================================================
+def _slice(table, channel, keep_channel=False):
+    column = next(col for col in (CHANNEL, 'channel', 'Channel') if col in table.columns)
+    part = table[table[column] == channel]
+    if not keep_channel:
+        part = part.drop(columns=column)
+    return part.reset_index(drop=True)
+
+
+def _overall(dataset, preset):
+    if dataset.periods is None:
+        return None
+    kpis, _ = overall_kpis(dataset.periods, preset.channel, preset.start, preset.end)
+    return pd.DataFrame([
+        {'kpi': name, 'current': d.current, 'previous': d.previous, 'change': d.change, 'pct_change': d.pct_change}
+        for name, d in kpis.items()
+    ])
+
+
+def compute_tables(dataset, presets):
+    """{preset name: {table name: DataFrame}}, computing each date range's tables once."""
+    tables = {}
+    ranges = {}
+    for preset in presets:
+        ranges.setdefault((preset.start, preset.end), []).append(preset)
+
+    for (start, end), group in ranges.items():
+        rows = select_orders(dataset.df, start, end)
+        split = {'trends_by_channel': monthly_trends(rows)}
+        if CHANNEL in rows.columns:
+            split['performance'] = channel_performance(rows)
+        if any(p.channel for p in group):
+            for name in KPI_TABS:
+                split[name] = kpi_breakdown(rows, name, by=CHANNEL)
+
+        for preset in group:
+            if preset.channel is None:
+                result = {name: kpi_breakdown(rows, name) for name in KPI_TABS}
+                result['trends_by_channel'] = split['trends_by_channel']
+                result['trends_total'] = monthly_trends(rows, by=None)
+                result['performance'] = split.get('performance')
+            else:
+                result = {
+                    name: _slice(split[name], preset.channel, keep_channel=BREAKDOWNS[name][0] == CHANNEL)
+                    for name in KPI_TABS if split[name] is not None
+                }
+                trends = split['trends_by_channel']
+                if trends is not None:
+                    result['trends_by_channel'] = _slice(trends, preset.channel, keep_channel=True)
+                    result['trends_total'] = _slice(trends, preset.channel)
+                if split.get('performance') is not None:
+                    # Scores are relative to the best channel shown, as on the filtered dashboard
+                    result['performance'] = efficiency_scores(_slice(split['performance'], preset.channel, keep_channel=True))
+            result['overall'] = _overall(dataset, preset)
+            tables[preset.name] = {name: table for name, table in result.items() if table is not None}
+    return tables
+
+
+# =============================================================================
+# RENDERING (runs in worker processes)
+# =============================================================================
+def _table_html(table):
+    from views.formatting import COLUMN_FORMATS, FORMATS
+    formatters = {
+        col: (lambda fmt: lambda v: '' if pd.isna(v) else fmt % v)(FORMATS[COLUMN_FORMATS[col]])
+        for col in table.columns if col in COLUMN_FORMATS
+    }
+    return table.to_html(index=False, border=0, formatters=formatters, na_rep='', float_format='{:,.2f}'.format)
+
+
+def render_preset(preset, tables, directory, formats, inline_js):
+    """Write one preset's HTML page and table files; returns (name, seconds, files)."""
+    from views.charts import PERFORMANCE_CHARTS, TREND_CHARTS
+
+    started = time.perf_counter()
+    os.makedirs(os.path.join(directory, 'tables'), exist_ok=True)
+    files = 0
+    for name, table in tables.items():
+        base = os.path.join(directory, 'tables', name)
+        if 'csv' in formats:
+            table.to_csv(base + '.csv', index=False)
+            files += 1
+        if 'parquet' in formats:
+            table.to_parquet(base + '.parquet', index=False)
+            files += 1
+
+    sections = []
+    if 'overall' in tables:
+        sections.append(f"<h2>📊 Overall</h2>{_table_html(tables['overall'])}")
+    for name in KPI_TABS:
+        if name in tables:
+            sections.append(f"<h2>By {name.title()}</h2>{_table_html(tables[name])}")
+    include_js = inline_js
+    for title, charts in [("📈 Trends", TREND_CHARTS), ("📦 Performance", PERFORMANCE_CHARTS)]:
+        sections.append(f"<h2>{title}</h2>")
+        for subheader, table, column, build in charts:
+            frame = tables.get(table)
+            if frame is None or column not in frame.columns or frame.empty:
+                continue
+            sections.append(build(frame).to_html(full_html=False, include_plotlyjs=include_js))
+            include_js = False
+
+    page = PAGE.format(
+        title=html.escape(f"KPI snapshot: {preset.name}"),
+        subtitle=html.escape(preset.describe()),
+        script='' if inline_js else '<script src="../plotly.min.js"></script>',
+        body='\n'.join(sections),
+    )
+    with open(os.path.join(directory, 'report.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+    return preset.name, time.perf_counter() - started, files + 1
+
+
+def render_batch(tables, presets, out_dir, formats, inline_js, workers):
+    """Render every preset, in a process pool when ``workers`` > 1."""
+    os.makedirs(out_dir, exist_ok=True)
+    if not inline_js:
+        from plotly.offline import get_plotlyjs
+        with open(os.path.join(out_dir, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+
+    jobs = [(p, tables[p.name], os.path.join(out_dir, p.name), formats, inline_js) for p in presets]
+    results = []
+    if workers <= 1:
+        results = [render_preset(*job) for job in jobs]
+    else:
+        # spawn: as for sharded ingestion, forking a threaded process is unsafe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [pool.submit(render_preset, *job) for job in jobs]
+            results = [future.result() for future in as_completed(futures)]
+
+    links = '\n'.join(
+        f'<li><a href="{p.name}/report.html">{html.escape(p.name)}</a> '
+        f'<span class="muted">{html.escape(p.describe())}</span></li>'
+        for p in presets
+    )
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(PAGE.format(title="KPI snapshots", subtitle=f"{len(presets)} presets", script='',
+                            body=f"<ul>{links}</ul>"))
+    return results
+
+
+def load_dataset(source, cache):
+    fingerprint = file_fingerprint(source)
+    if fingerprint is None:
+        raise FileNotFoundError(source)
+
+    sources = source_keys(source)
+
+    def build():
+        df, shards, validation = load_orders(source)
+        return build_dataset(df, fingerprint, shards, validation, sources)
+    return cache.cached('dataset', fingerprint, build)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render KPI snapshots for filter presets to HTML and tables")
+    parser.add_argument('--data', default=DATA_PATH, help="orders file, shard directory or glob")
+    parser.add_argument('--out', default='reports')
+    parser.add_argument('--batch', default=pd.Timestamp.now().strftime('%Y-%m-%d'), help="output subdirectory")
+    parser.add_argument('--presets', default='all,channels,last-quarter',
+                        help=f"comma separated: {', '.join(PRESET_GROUPS)}")
+    parser.add_argument('--preset', action='append', default=[], metavar='NAME:CHANNEL:START:END')
+    parser.add_argument('--formats', default='csv,parquet')
+    parser.add_argument('--workers', type=int, default=None, help="render processes (default: core count)")
+    parser.add_argument('--shared-js', action='store_true',
+                        help="write plotly.js once per batch instead of inlining it in every page")
+    args = parser.parse_args(argv)
+
+    groups = [g for g in args.presets.split(',') if g]
+    unknown = sorted(set(groups) - set(PRESET_GROUPS))
+    if unknown:
+        parser.error(f"unknown preset group(s): {', '.join(unknown)}")
+    formats = {f for f in args.formats.split(',') if f}
+    if 'parquet' in formats and importlib.util.find_spec('pyarrow') is None:
+        parser.error("Parquet output needs pyarrow (pip install pyarrow) or --formats csv")
+
+    started = time.perf_counter()
+    dataset = load_dataset(args.data, DiskCache())
+    loaded = time.perf_counter()
+    presets = build_presets(dataset, groups, args.preset)
+    out_dir = os.path.join(args.out, args.batch)
+    print(f"🗂️ {len(presets)} presets from {args.data} -> {out_dir}")
+
+    tables = compute_tables(dataset, presets)
+    computed = time.perf_counter()
+    workers = args.workers or min(os.cpu_count() or 1, len(presets))
+    for name, seconds, files in sorted(render_batch(tables, presets, out_dir, formats, not args.shared_js, workers)):
+        print(f"  {name:<40} {seconds:6.2f}s  {files} files")
+    finished = time.perf_counter()
+    print(f"✅ Batch done in {finished - started:.1f}s: load {loaded - started:.1f}s, "
+          f"tables {computed - loaded:.1f}s, render {finished - computed:.1f}s ({workers} workers)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Streamlit page modules; each exposes ``render(dataset)``."""
@@ -0,0 +1,180 @@
+"""Plotly figures of the dashboard's Trends and Performance tabs.
+
+Pure figure builders over ``analytics.metrics`` tables (no Streamlit), so
+the Analytics Dashboard and the offline report renderer draw the same
+charts. Each ``*_CHARTS`` entry is (subheader, input table, required
+column, builder).
+"""
+import plotly.express as px
+
+COLOR_SCALE = ['#3647F5', '#D9D9D9', '#FF9F0D']
+
+
+def _style(fig, **layout):
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#f5f5f5',
+        **layout
+    )
+    return fig
+
+
+# =============================================================================
+# TRENDS (tables from monthly_trends)
+# =============================================================================
+def revenue_trend_by_channel(monthly_channel):
+    fig = px.line(
+        monthly_channel,
+        x='month',
+        y='revenue',
+        color='channel',
+        markers=True,
+        title='Monthly Revenue Trends by Marketing Channel'
+    )
+    return _style(fig, height=500, xaxis_title="Month", yaxis_title="Revenue",
+                  legend_title="Channel", xaxis=dict(tickangle=45))
+
+
+def conversions_trend_by_channel(monthly_channel):
+    fig = px.line(
+        monthly_channel,
+        x='month',
+        y='conversions',
+        color='channel',
+        markers=True,
+        title='Monthly Conversions Trends by Marketing Channel'
+    )
+    return _style(fig, height=500, xaxis_title="Month", yaxis_title="Conversions (Unique Customers)",
+                  legend_title="Channel", xaxis=dict(tickangle=45))
+
+
+def total_revenue_trend(monthly_total):
+    fig = px.line(monthly_total, x='month', y='revenue', markers=True, title='Overall Monthly Revenue Trend')
+    fig.update_traces(
+        line=dict(color='#FF9F0D', width=3),
+        marker=dict(size=10, color='#3647F5')
+    )
+    return _style(fig, height=450, xaxis_title="Month", yaxis_title="Total Revenue", xaxis=dict(tickangle=45))
+
+
+def total_conversions_trend(monthly_total):
+    fig = px.line(monthly_total, x='month', y='conversions', markers=True, title='Overall Monthly Conversions Trend')
+    fig.update_traces(
+        line=dict(color='#3647F5', width=3),
+        marker=dict(size=10, color='#FF9F0D')
+    )
+    return _style(fig, height=450, xaxis_title="Month", yaxis_title="Total Conversions", xaxis=dict(tickangle=45))
+
+
+TREND_CHARTS = [
+    ("Monthly Revenue Trends by Marketing Channel", 'trends_by_channel', 'revenue', revenue_trend_by_channel),
+    ("Monthly Conversions Trends by Marketing Channel", 'trends_by_channel', 'conversions', conversions_trend_by_channel),
+    ("Overall Monthly Revenue Trend", 'trends_total', 'revenue', total_revenue_trend),
+    ("Overall Monthly Conversions Trend", 'trends_total', 'conversions', total_conversions_trend),
+]
+
+
+# =============================================================================
+# PERFORMANCE (table from channel_performance)
+# =============================================================================
+def _outlined_bar(frame, x, y, title, **kwargs):
+    fig = px.bar(frame, x=x, y=y, title=title, color_continuous_scale=COLOR_SCALE, **kwargs)
+    fig.update_traces(marker=dict(line=dict(width=1.5, color='#D9D9D9')))
+    return fig
+
+
+def revenue_per_order(performance):
+    fig = _outlined_bar(performance.sort_values('Revenue_Per_Order'), 'Revenue_Per_Order', 'Channel',
+                        'Revenue Per Order by Channel', orientation='h', color='Revenue_Per_Order')
+    return _style(fig, height=450, xaxis_title="Revenue Per Order ($)", yaxis_title="Marketing Channel")
+
+
+def acquisition_rate(performance):
+    fig = _outlined_bar(performance.sort_values('Customer_Acquisition_Rate_%', ascending=False),
+                        'Channel', 'Customer_Acquisition_Rate_%', 'Customer Acquisition Rate by Channel',
+                        color='Customer_Acquisition_Rate_%')
+    return _style(fig, height=450, xaxis_title="Marketing Channel", yaxis_title="Customer Acquisition Rate (%)",
+                  xaxis=dict(tickangle=45))
+
+
+def efficiency_ranking(performance):
+    fig = _outlined_bar(performance.sort_values('Efficiency_Score'), 'Efficiency_Score', 'Channel',
+                        'Channel Efficiency Ranking', orientation='h', color='Efficiency_Score')
+    return _style(fig, height=450, xaxis_title="Efficiency Score", yaxis_title="Marketing Channel")
+
+
+def revenue_vs_customers(performance):
+    fig = px.scatter(
+        performance,
+        x='Unique_Customers',
+        y='Total_Revenue',
+        size='Revenue_Per_Customer',
+        color='Revenue_Per_Customer',
+        hover_name='Channel',
+        text='Channel',
+        title='Revenue vs Customer Acquisition',
+        size_max=60,
+        color_continuous_scale=['#FF9F0D', '#3647F5', '#D9D9D9']
+    )
+    fig.update_traces(
+        textposition='top center',
+        textfont=dict(size=12, color='#f5f5f5'),
+        marker=dict(line=dict(width=2, color='#D9D9D9'), opacity=0.85)
+    )
+    return _style(fig, height=500, showlegend=False, xaxis_title="Unique Customers Acquired",
+                  yaxis_title="Total Revenue ($)")
+
+
+def revenue_per_customer(performance):
+    fig = _outlined_bar(performance.sort_values('Revenue_Per_Customer'), 'Channel', 'Revenue_Per_Customer',
+                        'Revenue Per Customer by Channel', color='Revenue_Per_Customer')
+    return _style(fig, height=450, xaxis_title="Marketing Channel", yaxis_title="Revenue Per Customer ($)",
+                  xaxis=dict(tickangle=45))
+
+
+def performance_quadrant(performance):
+    avg_customers = performance['Unique_Customers'].mean()
+    avg_revenue = performance['Total_Revenue'].mean()
+    fig = px.scatter(
+        performance,
+        x='Unique_Customers',
+        y='Total_Revenue',
+        size='Revenue_Per_Customer',
+        color='Revenue_Per_Customer',
+        hover_name='Channel',
+        hover_data=['Revenue_Per_Customer', 'Total_Orders'],
+        title='Performance Quadrant Analysis: High Revenue/High Reach = Top Right 🏆',
+        size_max=50,
+        color_continuous_scale=['#FF9F0D', '#3647F5']
+    )
+    fig.update_traces(marker=dict(line=dict(width=2, color='#D9D9D9'), opacity=0.9))
+    _style(fig, height=500, xaxis_title="Unique Customers Acquired", yaxis_title="Total Revenue ($)",
+           showlegend=False)
+
+    # Quadrant lines
+    fig.add_hline(
+        y=avg_revenue,
+        line_dash="dash",
+        line_color="#FF9F0D",
+        annotation_text=f"Avg Revenue: ${avg_revenue:,.0f}",
+        annotation_position="right"
+    )
+    fig.add_vline(
+        x=avg_customers,
+        line_dash="dash",
+        line_color="#FF9F0D",
+        annotation_text=f"Avg Customers: {avg_customers:,.0f}",
+        annotation_position="top"
+    )
+    return fig
+
+
+PERFORMANCE_CHARTS = [
+    ("💵 Revenue Per Order by Channel", 'performance', 'Revenue_Per_Order', revenue_per_order),
+    ("📈 Customer Acquisition Rate by Channel", 'performance', 'Customer_Acquisition_Rate_%', acquisition_rate),
+    ("🏆 Channel Efficiency Ranking", 'performance', 'Efficiency_Score', efficiency_ranking),
+    ("🎯 Revenue vs Customer Acquisition", 'performance', 'Total_Revenue', revenue_vs_customers),
+    ("💰 Revenue Per Customer by Channel", 'performance', 'Revenue_Per_Customer', revenue_per_customer),
+    ("🏆 Performance Quadrant Analysis", 'performance', 'Total_Revenue', performance_quadrant),
+]
@@ -0,0 +1,293 @@
+"""Customers page: customer-level analytics on the materialized customer table."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from analytics.rfm import SEGMENTS, segment_summary
+from views.data import aggregate
+from views.formatting import show_table
+
+CHART_LAYOUT = dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font_color='#f5f5f5',
+    height=450,
+)
+COLOR_SCALE = ['#3647F5', '#D9D9D9', '#FF9F0D']
+
+
+def _metric_card(col, label, value):
+    with col:
+        st.markdown(f"""
+            <div class='metric-card'>
+                <div class='metric-label'>{label}</div>
+                <div class='metric-value' style='font-size: 2rem;'>{value}</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+
+def _customer_breakdown(table, by):
+    grouped = table.assign(repeat=table['orders'] > 1).groupby(by, observed=True).agg(
+        customers=('customer_id', 'size'),
+        orders=('orders', 'sum'),
+        net_revenue=('net_revenue', 'sum'),
+        returns=('returns', 'sum'),
+        repeat=('repeat', 'sum'),
+    )
+    grouped['orders_per_customer'] = (grouped['orders'] / grouped['customers']).round(2)
+    grouped['revenue_per_customer'] = (grouped['net_revenue'] / grouped['customers']).round(2)
+    grouped['repeat_rate'] = (grouped['repeat'] / grouped['customers'] * 100).round(2)
+    grouped['return_rate'] = (grouped['returns'] / grouped['orders'] * 100).round(2)
+    return grouped.drop(columns=['repeat', 'returns']).reset_index()
+
+
+def _render_overview(customers):
+    table = customers.table
+
+    n_customers = len(table)
+    total_orders = table['orders'].sum()
+    repeat_rate = (table['orders'] > 1).mean() * 100 if n_customers else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    _metric_card(col1, "👥 Customers", f"{n_customers:,}")
+    _metric_card(col2, "📦 Orders / Customer", f"{total_orders / max(n_customers, 1):.2f}")
+    _metric_card(col3, "💰 Revenue / Customer", f"${table['net_revenue'].sum() / max(n_customers, 1):,.2f}")
+    _metric_card(col4, "🔁 Repeat Rate", f"{repeat_rate:.1f}%")
+
+    st.markdown("---")
+
+    # ========== BY ACQUISITION CHANNEL ==========
+    if 'acquisition_channel' in table.columns:
+        st.subheader("📡 Customers by Acquisition Channel")
+        st.caption("Channel of each customer's first order")
+
+        by_channel = _customer_breakdown(table, 'acquisition_channel')
+        show_table(by_channel)
+
+        by_channel = by_channel.sort_values('revenue_per_customer')
+        fig_channel = px.bar(
+            by_channel,
+            x='revenue_per_customer',
+            y='acquisition_channel',
+            orientation='h',
+            color='repeat_rate',
+            color_continuous_scale=COLOR_SCALE,
+            title='Lifetime Revenue per Acquired Customer (color = repeat rate %)'
+        )
+        fig_channel.update_layout(
+            **CHART_LAYOUT,
+            xaxis_title="Revenue per Customer ($)",
+            yaxis_title="Acquisition Channel"
+        )
+        st.plotly_chart(fig_channel, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+
+    # ========== ORDERS PER CUSTOMER ==========
+    with col1:
+        st.subheader("📦 Orders per Customer")
+        capped = np.minimum(table['orders'].to_numpy(), 10)
+        counts = np.bincount(capped, minlength=11)[1:]
+        distribution = pd.DataFrame({
+            'orders': [str(i) for i in range(1, 10)] + ['10+'],
+            'customers': counts,
+        })
+        fig_orders = px.bar(
+            distribution,
+            x='orders',
+            y='customers',
+            color='customers',
+            color_continuous_scale=COLOR_SCALE,
+            title='Customers by Number of Orders'
+        )
+        fig_orders.update_layout(**CHART_LAYOUT, xaxis_title="Orders", yaxis_title="Customers")
+        st.plotly_chart(fig_orders, use_container_width=True)
+
+    # ========== SEGMENT x REGION ==========
+    with col2:
+        if 'customer_segment' in table.columns and 'region' in table.columns:
+            st.subheader("🗺️ Customers by Segment and Region")
+            matrix = pd.crosstab(table['customer_segment'], table['region'])
+            fig_matrix = px.imshow(
+                matrix,
+                text_auto=True,
+                color_continuous_scale=COLOR_SCALE,
+                title='Customers (latest segment x region)'
+            )
+            fig_matrix.update_layout(**CHART_LAYOUT, xaxis_title="Region", yaxis_title="Segment")
+            st.plotly_chart(fig_matrix, use_container_width=True)
+
+    if 'customer_segment' in table.columns:
+        st.subheader("👥 Customers by Segment")
+        show_table(_customer_breakdown(table, 'customer_segment'))
+
+
+@st.cache_data(show_spinner=False)
+def _cohort_view(fingerprint, channel, metric, max_age, _matrix):
+    if metric == 'retention':
+        heatmap = _matrix.retention(channel, max_age)
+    else:
+        heatmap = _matrix.revenue_per_customer(channel, max_age)
+    return heatmap, _matrix.curves(metric, max_age), _matrix.sizes_frame(channel)
+
+
+def _render_cohorts(dataset):
+    matrix = aggregate('cohorts', dataset)
+    if matrix is None:
+        st.info("💡 Cohorts need `date` and `customer_id` columns")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        channel = st.selectbox("Acquisition Channel", ['All Channels'] + list(matrix.channels), key="cohort_channel")
+    with col2:
+        metric = st.radio(
+            "Metric", ['retention', 'revenue'], horizontal=True,
+            format_func={'retention': 'Retention %', 'revenue': 'Cumulative Revenue / Customer'}.get
+        )
+    with col3:
+        max_age = st.slider("Months since registration", 1, max(matrix.n_ages - 1, 1), min(12, max(matrix.n_ages - 1, 1)))
+
+    channel_key = None if channel == 'All Channels' else channel
+    heatmap, curves, sizes = _cohort_view(dataset.fingerprint, channel_key, metric, max_age, matrix)
+
+    # ========== COHORT HEATMAP ==========
+    st.subheader("📅 Cohort Matrix")
+    fig_heatmap = px.imshow(
+        heatmap,
+        text_auto='.0f',
+        aspect='auto',
+        color_continuous_scale=COLOR_SCALE,
+        title=f"{'Retention %' if metric == 'retention' else 'Cumulative Revenue per Customer ($)'} - {channel}"
+    )
+    fig_heatmap.update_layout(
+        **{**CHART_LAYOUT, 'height': max(450, 18 * len(heatmap))},
+        xaxis_title="Months Since Registration",
+        yaxis_title="Registration Cohort"
+    )
+    st.plotly_chart(fig_heatmap, use_container_width=True)
+
+    # ========== CURVES BY CHANNEL ==========
+    st.subheader("📈 Curves by Acquisition Channel")
+    long_curves = curves.reset_index().melt(
+        id_vars='months_since_registration', var_name='channel', value_name='value'
+    )
+    fig_curves = px.line(
+        long_curves,
+        x='months_since_registration',
+        y='value',
+        color='channel',
+        markers=True,
+        title='Size-weighted average over cohorts'
+    )
+    fig_curves.update_layout(
+        **CHART_LAYOUT,
+        xaxis_title="Months Since Registration",
+        yaxis_title="Retention %" if metric == 'retention' else "Cumulative Revenue per Customer ($)",
+        legend_title="Channel"
+    )
+    st.plotly_chart(fig_curves, use_container_width=True)
+
+    with st.expander("👥 Cohort Sizes"):
+        show_table(sizes.rename('customers').reset_index().rename(columns={'index': 'cohort'}))
+
+
+@st.cache_data(show_spinner=False)
+def _rfm_view(fingerprint, as_of, _index, _customers):
+    scores = _index.score(as_of)
+    grid = pd.crosstab(scores['r_score'], scores['f_score']).reindex(
+        index=range(5, 0, -1), columns=range(1, 6), fill_value=0
+    )
+    versus = None
+    if 'customer_segment' in _customers.table.columns:
+        static = _customers.table['customer_segment'].to_numpy()[scores.index.to_numpy()]
+        versus = pd.crosstab(scores['segment'], pd.Series(static, index=scores.index, name='customer_segment'))
+    return segment_summary(scores), grid, versus
+
+
+def _render_rfm(dataset):
+    index = aggregate('rfm', dataset)
+    if index is None:
+        st.info("💡 RFM needs `date` and `customer_id` columns")
+        return
+
+    last_date = index.last_date.date()
+    as_of = st.date_input(
+        "As of", value=last_date,
+        min_value=pd.Timestamp(index.first_day).date(), max_value=last_date,
+        key="rfm_as_of"
+    )
+    st.caption("Recency, frequency and monetary value from the order history up to this date, "
+               "scored in quintiles among the customers active by then")
+
+    summary, grid, versus = _rfm_view(dataset.fingerprint, as_of, index, dataset.customers)
+    n_customers = int(summary['customers'].sum())
+    if not n_customers:
+        st.warning("⚠️ No orders on or before this date")
+        return
+
+    champions = summary.set_index('segment').loc['Champions']
+    at_risk = summary.set_index('segment').loc[["At Risk", "Can't Lose Them"]].sum()
+    col1, col2, col3, col4 = st.columns(4)
+    _metric_card(col1, "👥 Scored Customers", f"{n_customers:,}")
+    _metric_card(col2, "🏆 Champions", f"{champions['customer_share']:.1f}%")
+    _metric_card(col3, "💰 Champions' Revenue", f"{champions['revenue_share']:.1f}%")
+    _metric_card(col4, "⚠️ At Risk Revenue", f"${at_risk['monetary']:,.0f}")
+
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    # ========== SEGMENT SIZES & REVENUE ==========
+    with col1:
+        st.subheader("🎯 Segments")
+        fig_segments = px.bar(
+            summary.sort_values('monetary'),
+            x='monetary',
+            y='segment',
+            orientation='h',
+            color='customers',
+            color_continuous_scale=COLOR_SCALE,
+            title='Revenue by RFM Segment (color = customers)'
+        )
+        fig_segments.update_layout(**CHART_LAYOUT, xaxis_title="Net Revenue ($)", yaxis_title="Segment")
+        st.plotly_chart(fig_segments, use_container_width=True)
+
+    # ========== R x F GRID ==========
+    with col2:
+        st.subheader("🧭 Recency x Frequency")
+        fig_grid = px.imshow(
+            grid,
+            text_auto=True,
+            color_continuous_scale=COLOR_SCALE,
+            title='Customers by R and F score'
+        )
+        fig_grid.update_layout(**CHART_LAYOUT, xaxis_title="Frequency Score", yaxis_title="Recency Score")
+        st.plotly_chart(fig_grid, use_container_width=True)
+
+    show_table(summary, hide_index=True)
+
+    if versus is not None:
+        with st.expander("🔀 RFM Segment vs Static Customer Segment"):
+            show_table(versus.reindex(SEGMENTS, fill_value=0))
+
+
+def render(dataset):
+    st.title("👥 Customer Analytics")
+    st.markdown("Customer-level metrics from the materialized customer table")
+
+    if dataset is None or dataset.customers is None:
+        st.error("❌ Data not loaded!")
+        st.stop()
+
+    overview_tab, cohort_tab, rfm_tab = st.tabs(["📋 Overview", "📅 Cohorts", "🎯 RFM"])
+
+    with overview_tab:
+        _render_overview(dataset.customers)
+
+    with cohort_tab:
+        _render_cohorts(dataset)
+
+    with rfm_tab:
+        _render_rfm(dataset)
@@ -0,0 +1,669 @@
+"""Analytics Dashboard page: filters, KPI tabs and Plotly charts."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from analytics.anomalies import MEASURES as ANOMALY_MEASURES
+from analytics.drilldown import LEVEL_LABELS
+from analytics.filters import ALL_CHANNELS, order_rows, select_orders
+from analytics.leaderboards import ENTITIES, METRICS as LEADERBOARD_METRICS, MIN_ORDERS
+from analytics.significance import CORRECTIONS, METRICS as TEST_METRICS, MIN_ORDERS as TEST_MIN_ORDERS
+from analytics.metrics import best_performer, overall_kpis
+from views.charts import PERFORMANCE_CHARTS, TREND_CHARTS
+from views.data import aggregate, page_state, view
+from views.formatting import show_table
+
+FORECAST_MEASURES = {'net_revenue': 'Net Revenue', 'conversions': 'Conversions (Unique Customers)'}
+LEADERBOARD_MAX = 50
+MAX_HEATMAP_CAMPAIGNS = 60
+MAX_TEST_ROWS = 500
+ANOMALY_LEVELS = {
+    'Channel': ['marketing_channel'],
+    'Channel x Region': ['marketing_channel', 'region'],
+    'Channel x Region x Category': ['marketing_channel', 'region', 'category'],
+}
+
+
+def _delta(value, suffix, digits=1):
+    return None if value is None else f"{value:+.{digits}f}{suffix}"
+
+
+def _render_charts(charts, tables):
+    for subheader, table, column, build in charts:
+        frame = tables.get(table)
+        if frame is not None and column in frame.columns:
+            st.subheader(subheader)
+            st.plotly_chart(build(frame), use_container_width=True)
+
+
+def _render_forecast(dataset, selected_channel):
+    models = aggregate('forecasts', dataset)
+    if not models:
+        st.info("💡 Forecasts need at least three complete months of `date` data")
+        return
+
+    st.subheader("🔮 Forecast")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        measure = st.radio(
+            "Measure", [m for m in FORECAST_MEASURES if m in models],
+            format_func=FORECAST_MEASURES.get, horizontal=True, key="forecast_measure"
+        )
+    with col2:
+        horizon = st.slider("Months ahead", 1, 12, 6, key="forecast_horizon")
+    with col3:
+        level = st.selectbox("Interval", [80, 90, 95], format_func=lambda v: f"{v}%", key="forecast_level")
+
+    model = models[measure]
+    series = selected_channel if selected_channel in model.labels else 'All Channels'
+    frame = model.frame(model.labels.get_loc(series), horizon, level)
+    history, future = frame[frame['kind'] == 'history'], frame[frame['kind'] == 'forecast']
+    # Start the forecast line at the last observed month so the two connect
+    future = pd.concat([history.tail(1).assign(lower=history['value'].iloc[-1], upper=history['value'].iloc[-1]), future])
+
+    fig_forecast = px.line(
+        history,
+        x='month',
+        y='value',
+        markers=True,
+        title=f"{FORECAST_MEASURES[measure]} - {series}: next {horizon} months ({level}% interval)"
+    )
+    fig_forecast.update_traces(line=dict(color='#3647F5', width=3), name='History', showlegend=True)
+    fig_forecast.add_scatter(x=future['month'], y=future['upper'], mode='lines', line=dict(width=0),
+                             showlegend=False, hoverinfo='skip')
+    fig_forecast.add_scatter(x=future['month'], y=future['lower'], mode='lines', line=dict(width=0),
+                             fill='tonexty', fillcolor='rgba(255,159,13,0.25)', name=f'{level}% interval')
+    fig_forecast.add_scatter(x=future['month'], y=future['value'], mode='lines+markers',
+                             line=dict(color='#FF9F0D', width=3, dash='dash'), name='Forecast')
+    fig_forecast.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#f5f5f5',
+        height=450,
+        xaxis_title="Month",
+        yaxis_title=FORECAST_MEASURES[measure],
+        xaxis=dict(tickangle=45)
+    )
+    st.plotly_chart(fig_forecast, use_container_width=True)
+
+    st.caption(
+        f"Additive Holt-Winters fitted to all {len(model.labels)} series at once "
+        f"on {len(model.months)} complete months; totals cover the next {horizon} months"
+    )
+    kind = 'currency0' if measure == 'net_revenue' else 'count'
+    table = model.table(horizon, level)
+    show_table(table, overrides={col: kind for col in table.columns if col != 'series'}, hide_index=True)
+
+
+@st.cache_data(show_spinner=False)
+def _anomalies(fingerprint, by, measure, window, lookback, threshold, min_orders, _series):
+    """Number of series at ``by``, the top anomalies and the history of each series they fall in."""
+    series = _series.rollup(list(by))
+    top = series.top_anomalies(measure, window, lookback, threshold, k=50, min_orders=min_orders)
+    histories = {
+        row: series.history(row, measure, days=lookback + window, min_orders=min_orders)
+        for row in top['series_row'].unique().tolist()
+    }
+    return len(series.labels), top, histories
+
+
+def _render_anomalies(dataset):
+    series = aggregate('daily_series', dataset)
+    if series is None:
+        st.info("💡 Anomaly detection needs `date` and `marketing_channel` columns")
+        return
+
+    levels = {name: by for name, by in ANOMALY_LEVELS.items() if set(by) <= set(series.labels.names)}
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        level = st.selectbox("Series", list(levels), index=len(levels) - 1, key="anomaly_level")
+        measure = st.selectbox(
+            "Measure", [m for m in ANOMALY_MEASURES if m != 'return_rate' or 'returned' in series.values],
+            format_func=ANOMALY_MEASURES.get, key="anomaly_measure"
+        )
+    with col2:
+        window = st.slider("Baseline window (days)", 7, 56, 28, key="anomaly_window")
+        lookback = st.slider("Scan last N days", 7, 180, 60, key="anomaly_lookback")
+    with col3:
+        threshold = st.slider("Robust z-score threshold", 2.0, 8.0, 3.5, 0.5, key="anomaly_threshold")
+        min_orders = st.slider("Min orders / day in baseline", 1, 50, 5, key="anomaly_min_orders")
+
+    by = tuple(levels[level])
+    n_series, top, histories = _anomalies(dataset.fingerprint, by, measure, window, lookback, threshold,
+                                          min_orders, series)
+    st.caption(
+        f"{n_series:,} daily series scored against the median / MAD of the previous {window} days; "
+        f"days whose baseline averages under {min_orders} orders are skipped"
+    )
+
+    if top.empty:
+        st.success("✅ No anomalies above the threshold in this window")
+        return
+
+    spikes = int((top['direction'] == 'spike').sum())
+    st.warning(f"🚨 {len(top)} anomalies: {spikes} spikes, {len(top) - spikes} drops (most extreme first)")
+    show_table(
+        top.drop(columns='series_row'),
+        overrides={'value': 'currency' if measure == 'net_revenue' else 'score', 'baseline': 'score', 'z_score': 'score'},
+        hide_index=True
+    )
+
+    # Inspect one anomaly against its series
+    describe = top[list(by)].astype(str).agg(' / '.join, axis=1) + ' - ' + top['date'].dt.strftime('%Y-%m-%d')
+    pick = st.selectbox("Inspect", range(len(top)), format_func=describe.iloc.__getitem__, key="anomaly_pick")
+    row = top.iloc[pick]
+    history = histories[int(row['series_row'])]
+
+    fig_anomaly = px.line(
+        history,
+        x='date',
+        y='value',
+        title=f"{ANOMALY_MEASURES[measure]} - {describe.iloc[pick]}"
+    )
+    fig_anomaly.update_traces(line=dict(color='#3647F5', width=2))
+    fig_anomaly.add_scatter(
+        x=[row['date']], y=[row['value']], mode='markers', name='Anomaly',
+        marker=dict(color='#FF9F0D', size=14, symbol='x')
+    )
+    fig_anomaly.add_hline(y=row['baseline'], line_dash="dash", line_color="#D9D9D9",
+                          annotation_text="Baseline (median)", annotation_position="right")
+    fig_anomaly.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#f5f5f5',
+        height=400,
+        xaxis_title="Date",
+        yaxis_title=ANOMALY_MEASURES[measure]
+    )
+    st.plotly_chart(fig_anomaly, use_container_width=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _leaderboards(fingerprint, column, channel, start, end, min_orders, _df, _index):
+    # One scatter per filter state; every metric / direction / N is then a slice
+    totals = _index.totals(_df, column, order_rows(_df, start, end, marketing_channel=channel))
+    return {
+        (metric, largest): totals.leaderboard(metric, LEADERBOARD_MAX, largest, min_orders)
+        for metric in totals.metrics()
+        for largest in (True, False)
+    }, len(totals.keys)
+
+
+def _render_leaderboards(dataset, channel, start, end):
+    index = aggregate('leaderboards', dataset)
+    if index is None:
+        st.info("💡 Leaderboards need `product_id`, `customer_id` or `marketing_campaign` columns")
+        return
+
+    entities = {name: column for name, column in ENTITIES.items() if column in index.codes}
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        entity = st.radio("Rank", list(entities), horizontal=True, format_func=lambda e: e.title() + 's',
+                          key="leaderboard_entity")
+    with col2:
+        n = st.slider("Top / bottom N", 5, LEADERBOARD_MAX, 10, key="leaderboard_n")
+    with col3:
+        min_orders = st.slider("Min orders to rank rates", 1, 100, MIN_ORDERS, key="leaderboard_min_orders")
+
+    channel_key = None if channel == 'All Channels' else channel
+    boards, n_entities = _leaderboards(dataset.fingerprint, entities[entity], channel_key, start, end,
+                                       min_orders, dataset.df, index)
+    metrics = [metric for metric in LEADERBOARD_METRICS if (metric, True) in boards]
+    metric = st.selectbox("By", metrics, format_func=LEADERBOARD_METRICS.get, key="leaderboard_metric")
+    st.caption(f"{n_entities:,} {entity}s with orders in the current filters; "
+               f"rates only rank {entity}s with at least {min_orders} orders")
+
+    top, bottom = boards[(metric, True)].head(n), boards[(metric, False)].head(n)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader(f"🔝 Top {len(top)}")
+        show_table(top)
+    with col2:
+        st.subheader(f"🔻 Bottom {len(bottom)}")
+        show_table(bottom)
+
+    if not top.empty:
+        column = entities[entity]
+        fig_top = px.bar(
+            top.assign(**{column: top[column].astype(str)}).iloc[::-1],
+            x=metric,
+            y=column,
+            orientation='h',
+            color=metric,
+            color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D'],
+            title=f"Top {len(top)} {entity}s by {LEADERBOARD_METRICS[metric]}"
+        )
+        fig_top.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_color='#f5f5f5',
+            height=max(400, 24 * len(top)),
+            xaxis_title=LEADERBOARD_METRICS[metric],
+            yaxis_title=entity.title(),
+            yaxis=dict(type='category')
+        )
+        st.plotly_chart(fig_top, use_container_width=True)
+
+
+def _render_drilldown(dataset, channel, start, end):
+    index = aggregate('drilldown', dataset)
+    if index is None:
+        st.info("💡 The drill-down needs `region`, `customer_segment`, `category` or `product_id` columns")
+        return
+
+    st.caption(" → ".join(LEVEL_LABELS[level] for level in index.levels) +
+               " - pick a member to expand it; only expanded levels are computed")
+    channel_key = None if channel == 'All Channels' else channel
+    path = []
+    # Each level is the children of the path picked so far; the index memoizes every expansion
+    while len(path) < len(index.levels):
+        level = index.levels[len(path)]
+        children = index.children(tuple(path), channel_key, start, end)
+        if children is None or children.empty:
+            st.info("💡 No orders under this selection in the current filters")
+            return
+        title = " / ".join(str(label) for label in path) or "All"
+        st.subheader(f"{title}: by {LEVEL_LABELS[level]}")
+        show_table(children, hide_index=True)
+
+        if len(path) + 1 == len(index.levels):
+            break
+        options = ['—'] + children[level].tolist()
+        # Keyed by the path so a different parent starts its own selection
+        picked = st.selectbox(f"Expand {LEVEL_LABELS[level]}", options,
+                              key="drill_" + "/".join(str(label) for label in path))
+        if picked == '—':
+            break
+        path.append(picked)
+
+
+def _render_campaign_tests(dataset, state):
+    st.subheader("🧪 Are the Differences Real?")
+    stats = view('campaign_stats', dataset, state)
+    if stats is None or len(stats.labels) < 2:
+        st.info("💡 Significance tests need at least two campaigns in the current filters")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        metric = st.selectbox("Metric", stats.metrics(), format_func=lambda m: TEST_METRICS[m][0], key="test_metric")
+        mode = st.radio("Compare", ["All pairs", "Against a control"], horizontal=True, key="test_mode")
+    with col2:
+        correction = st.selectbox("Multiple-comparison correction", list(CORRECTIONS), format_func=CORRECTIONS.get,
+                                  key="test_correction")
+        control = st.selectbox("Control campaign", stats.labels, key="test_control") if mode != "All pairs" else None
+    with col3:
+        alpha = st.select_slider("Significance level", [0.01, 0.05, 0.10], value=0.05, key="test_alpha")
+        min_orders = st.slider("Min orders per campaign", 2, 500, TEST_MIN_ORDERS, key="test_min_orders")
+
+    tests = stats.compare(metric, control, correction, alpha, min_orders)
+    if tests is None or tests.empty:
+        st.info(f"💡 Not enough campaigns with at least {min_orders} orders to compare")
+        return
+
+    significant = int(tests['significant'].sum())
+    caption = (f"{len(tests):,} comparisons of {TEST_METRICS[metric][0].lower()}; "
+               f"{significant:,} significant at {alpha:.0%} after {CORRECTIONS[correction].split(' (')[0]} correction")
+    if metric == 'repeat_rate':
+        caption += ". Recent campaigns have had less time to see repeat purchases"
+    if significant:
+        st.success(caption)
+    else:
+        st.caption(caption)
+    if len(tests) > MAX_TEST_ROWS:
+        st.caption(f"Showing the {MAX_TEST_ROWS:,} smallest p-values")
+    show_table(tests.head(MAX_TEST_ROWS), hide_index=True)
+
+    n_campaigns = len(set(tests['campaign_a']) | set(tests['campaign_b']))
+    if control is None and n_campaigns <= MAX_HEATMAP_CAMPAIGNS:
+        both = pd.concat([
+            tests[['campaign_a', 'campaign_b', 'difference', 'significant']],
+            tests.assign(campaign_a=tests['campaign_b'], campaign_b=tests['campaign_a'],
+                         difference=-tests['difference'])[['campaign_a', 'campaign_b', 'difference', 'significant']],
+        ])
+        # Only significant differences are coloured: row campaign minus column campaign
+        grid = both.assign(difference=-both['difference'].where(both['significant'])).pivot(
+            index='campaign_a', columns='campaign_b', values='difference'
+        )
+        fig_tests = px.imshow(
+            grid,
+            color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D'],
+            color_continuous_midpoint=0,
+            aspect='auto',
+            title=f"Significant differences in {TEST_METRICS[metric][0]} (row minus column)"
+        )
+        fig_tests.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_color='#f5f5f5',
+            height=max(450, 22 * len(grid)),
+            xaxis_title="",
+            yaxis_title=""
+        )
+        st.plotly_chart(fig_tests, use_container_width=True)
+
+
+def render(dataset):
+    df = dataset.df if dataset is not None else None
+
+    st.title("📊 Analytics Dashboard")
+    st.markdown("Interactive visualizations with real-time filtering")
+
+    if df is None:
+        st.error("❌ Data not loaded!")
+        st.stop()
+
+    # ========== FILTERS ==========
+    st.sidebar.header("🔍 Filters")
+
+    # Channel filter
+    if 'marketing_channel' in df.columns:
+        channels = [ALL_CHANNELS] + sorted(df['marketing_channel'].dropna().unique().tolist())
+        selected_channel = st.sidebar.selectbox("Marketing Channel", channels)
+    else:
+        selected_channel = ALL_CHANNELS
+
+    # Date filter (day granularity)
+    if 'date' in df.columns:
+        min_date = dataset.profile.date_min.date()
+        max_date = dataset.profile.date_max.date()
+        date_range = st.sidebar.date_input(
+            "Date Range",
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date
+        )
+    else:
+        date_range = []
+
+    # Apply filters: the date range is a binary-searched slice of the
+    # date-sorted frame, the channel mask only scans that slice
+    start_date, end_date = date_range if len(date_range) == 2 else (None, None)
+    filtered_df = select_orders(df, start_date, end_date, marketing_channel=selected_channel)
+    # The filter-dependent tables come from the shared view cache, which the
+    # warmer fills for the most viewed filter states
+    state = page_state('dashboard', dataset, channel=selected_channel, start=start_date, end=end_date)
+    tables = view('dashboard_tables', dataset, state)
+
+    st.sidebar.success(f"📊 Showing {len(filtered_df):,} / {len(df):,} records")
+
+     # ========== KPIs ==========
+    st.header("📈 Key Performance Indicators")
+    
+    # إنشاء tabs للـ KPIs المختلفة
+    kpi_tabs = st.tabs([
+        "📊 Overall", 
+        "📦 By Category", 
+        "📢 By Campaign", 
+        "📡 By Channel", 
+        "👥 By Segment", 
+        "🗺️ By Region", 
+        "📅 By Time",
+        "🌳 Drill-Down"
+    ])
+    
+    # ========== TAB 1: OVERALL KPIs WITH PERIOD-OVER-PERIOD DELTAS ==========
+    with kpi_tabs[0]:
+        periods = dataset.periods
+        if periods is None:
+            st.info("💡 Overall KPIs need a `date` column")
+        else:
+            channel_key = None if selected_channel == 'All Channels' else selected_channel
+            kpis, n_days = overall_kpis(periods, channel_key, start_date, end_date)
+
+            if kpis['revenue'].previous is not None:
+                st.caption(f"Deltas compare with the previous {n_days:,} day(s) for the same channel selection")
+            else:
+                st.caption("No complete preceding period of the same length in the data - deltas hidden")
+
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                st.metric(
+                    "💰 Total Revenue",
+                    f"${kpis['revenue'].current:,.2f}",
+                    delta=_delta(kpis['revenue'].pct_change, '%'),
+                    delta_color="normal"
+                )
+                st.metric(
+                    "📦 Total Orders",
+                    f"{kpis['orders'].current:,.0f}",
+                    delta=_delta(kpis['orders'].pct_change, '%'),
+                    delta_color="normal"
+                )
+
+            with col2:
+                if 'customers' in kpis:
+                    st.metric(
+                        "👥 Total Customers",
+                        f"{kpis['customers'].current:,.0f}",
+                        delta=_delta(kpis['customers'].pct_change, '%'),
+                        delta_color="normal"
+                    )
+                if 'avg_order_value' in kpis:
+                    st.metric(
+                        "🛍️ Avg Order Value",
+                        f"${kpis['avg_order_value'].current:,.2f}",
+                        delta=_delta(kpis['avg_order_value'].pct_change, '%'),
+                        delta_color="normal"
+                    )
+
+            with col3:
+                if 'conversion_rate' in kpis:
+                    st.metric(
+                        "📊 Conversion Rate",
+                        f"{kpis['conversion_rate'].current:.2f}%",
+                        delta=_delta(kpis['conversion_rate'].change, ' pp', 2),
+                        delta_color="normal"
+                    )
+                if 'return_rate' in kpis:
+                    st.metric(
+                        "↩️ Return Rate",
+                        f"{kpis['return_rate'].current:.2f}%",
+                        delta=_delta(kpis['return_rate'].change, ' pp', 2),
+                        delta_color="inverse"      # هنا ↑ أحمر، ↓ أخضر
+                    )
+                if 'satisfaction' in kpis:
+                    st.metric(
+                        "⭐ Satisfaction",
+                        f"{kpis['satisfaction'].current:.2f}/5",
+                        delta=_delta(kpis['satisfaction'].change, '', 2),
+                        delta_color="normal"
+                    )
+
+    # ========== TABS 2-6: BREAKDOWNS ==========
+    for tab, name in zip(kpi_tabs[1:6], ['category', 'campaign', 'channel', 'segment', 'region']):
+        with tab:
+            kpi_table = tables[name]
+            if kpi_table is not None:
+                show_table(kpi_table)
+            if name == 'campaign' and kpi_table is not None:
+                _render_campaign_tests(dataset, state)
+
+    # ========== TAB 7: BY TIME ==========
+    with kpi_tabs[6]:
+        time_view = st.radio("Select Time Period", ["Month", "Quarter", "Season"], horizontal=True)
+        kpi_time = tables[time_view.lower()]
+        if kpi_time is not None:
+            show_table(kpi_time)
+
+    # ========== TAB 8: DRILL-DOWN ==========
+    with kpi_tabs[7]:
+        _render_drilldown(dataset, selected_channel, start_date, end_date)
+
+    st.markdown("---")
+
+    # ========== CHARTS FROM NOTEBOOK ==========
+    st.header("📊 Data Visualizations")
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["📈 Trends", "🎯 Marketing", "📦 Performance", "🏅 Leaderboards", "🚨 Anomalies"]
+    )
+
+    # ========== TAB 1: TRENDS ==========
+    with tab1:
+        _render_charts(TREND_CHARTS, tables)
+
+        # Chart 5: Forecast for the selected channel
+        if 'date' in df.columns:
+            _render_forecast(dataset, selected_channel)
+
+    # ========== TAB 2: MARKETING ==========   
+             # ========== TAB 2: MARKETING ==========
+    with tab2:
+        if 'marketing_channel' in df.columns:
+            revenue_col = 'net_revenue' if 'net_revenue' in df.columns else 'final_amount'
+            
+            if revenue_col in df.columns and 'customer_id' in df.columns and 'roi' in df.columns:
+                # roi is NaN (not inf) for undiscounted orders since load-time validation
+                
+                # تحضير البيانات
+                channel_perf = tables['summary']
+                
+                # Chart 1: Total Revenue per Marketing Channel
+                st.subheader("Total Revenue per Marketing Channel")
+                bar_width = 25
+                
+                fig_rev = px.scatter(
+                    channel_perf,
+                    x=channel_perf.index,
+                    y="total_revenue",
+                    title="Total Revenue per Marketing Channel",
+                    color_discrete_sequence=["#3647F5"],
+                    text="total_revenue"
+                )
+                
+                fig_rev.update_traces(
+                    marker=dict(size=bar_width),
+                    textposition='top center',
+                    texttemplate='%{text:.2s}'
+                )
+                
+                for x_val, y_val in zip(channel_perf.index, channel_perf["total_revenue"]):
+                    fig_rev.add_shape(
+                        type="line",
+                        x0=x_val, y0=0,
+                        x1=x_val, y1=y_val,
+                        line=dict(color="#3647F5", width=bar_width),
+                        layer="below"
+                    )
+                
+                fig_rev.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='#f5f5f5',
+                    height=450,
+                    margin=dict(t=60)
+                )
+                
+                st.plotly_chart(fig_rev, use_container_width=True)
+                
+                # Chart 2: Total Conversions per Channel
+                st.subheader("Total Conversions per Channel")
+                
+                fig_conv = px.scatter(
+                    channel_perf,
+                    x=channel_perf.index,
+                    y="total_conversions",
+                    size="total_conversions",
+                    color="total_conversions",
+                    color_continuous_scale=["#FF9F0D", "#D9D9D9"],
+                    title="Total Conversions per Channel"
+                )
+                
+                fig_conv.update_traces(
+                    marker=dict(symbol='circle', line=dict(width=2, color='#D9D9D9'))
+                )
+                
+                fig_conv.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='#f5f5f5',
+                    height=450,
+                    yaxis_title="Total Conversions",
+                    xaxis_title="Marketing Channel"
+                )
+                
+                st.plotly_chart(fig_conv, use_container_width=True)
+                
+                # Chart 3: Total Orders per Channel (بدل Spend)
+                st.subheader("Total Orders per Channel")
+                
+                # عدد الطلبات لكل قناة
+                fig_spend = px.line(
+                    channel_perf,
+                    x=channel_perf.index,
+                    y="total_orders",
+                    markers=True,
+                    title="Total Orders per Channel"
+                )
+                
+                fig_spend.update_traces(
+                    line=dict(color="#FF9F0D", width=4),
+                    marker=dict(size=10, color="#D9D9D9", line=dict(width=2, color="#D9D9D9"))
+                )
+                
+                fig_spend.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='#f5f5f5',
+                    height=500,
+                    yaxis_title="Total Orders",
+                    xaxis_title="Marketing Channel"
+                )
+                
+                st.plotly_chart(fig_spend, use_container_width=True)
+                
+                # Chart 4: Average ROI per Channel
+                st.subheader("Average ROI per Channel")
+                
+                channel_perf_sorted = channel_perf.sort_values(by='avg_roi', ascending=True)
+                
+                fig_roi = px.bar(
+                    channel_perf_sorted,
+                    x='avg_roi',
+                    y=channel_perf_sorted.index,
+                    orientation='h',
+                    color='avg_roi',
+                    color_continuous_scale=['#3647F5', '#D9D9D9', '#FF9F0D'],
+                    title="Average ROI per Channel"
+                )
+                
+                fig_roi.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='#f5f5f5',
+                    height=450,
+                    xaxis_title="Average ROI",
+                    yaxis_title="Marketing Channel"
+                )
+                
+                st.plotly_chart(fig_roi, use_container_width=True)
+            else:
+                st.error("❌ Required columns not found!")
+        else:
+            st.error("❌ Column 'marketing_channel' not found!")
+
+   
+           # ========== TAB 3: PERFORMANCE (NEW) ==========
+    with tab3:
+        st.subheader("📊 Marketing Channel Performance Analysis")
+        
+        if 'marketing_channel' in filtered_df.columns:
+            # تحضير البيانات الأساسية: جدول واحد لكل الرسوم
+            performance_by_channel = tables['performance']
+            _render_charts(PERFORMANCE_CHARTS, {'performance': performance_by_channel})
+
+            # Best performer info
+            best_channel = best_performer(performance_by_channel)
+            if best_channel is None:
+                best_channel = pd.Series({'Channel': 'N/A', 'Revenue_Per_Customer': 0})
+            st.success(f"🌟 **Best Performer:** {best_channel['Channel']} - Revenue/Customer: ${best_channel['Revenue_Per_Customer']:,.2f}")
+
+    # ========== TAB 4: LEADERBOARDS ==========
+    with tab4:
+        _render_leaderboards(dataset, selected_channel, start_date, end_date)
+
+    # ========== TAB 5: ANOMALIES ==========
+    with tab5:
+        _render_anomalies(dataset)
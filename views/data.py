@@ -0,0 +1,82 @@
+"""Streamlit access to the shared dataset store (``analytics.store``).
+
+Pages are served from the latest ready snapshot; a changed source is
+reloaded in the background and swapped in once ready, so page loads never
+wait on ingestion (only the very first load does).
+"""
+import streamlit as st
+
+from analytics import store
+from analytics.access_log import normalize_state
+from analytics.dataset import DATA_PATH
+from analytics.store import REFRESHER
+
+
+def aggregate(name, dataset):
+    """Derived aggregate ``name`` (see ``analytics.aggregates``) of ``dataset``."""
+    if store.has_aggregate(name, dataset):
+        return store.aggregate(name, dataset)
+    with st.spinner("Computing aggregates..."):
+        return store.aggregate(name, dataset)
+
+
+def page_state(page, dataset, **filters):
+    """Normalized filter state of ``page``, recorded in the access log when this session's view changes."""
+    profile = dataset.profile
+    state = normalize_state(page, profile.date_min, profile.date_max, **filters)
+    # Widget reruns on the same view are not new views
+    if st.session_state.get('_logged_view') != state:
+        st.session_state['_logged_view'] = state
+        store.ACCESS_LOG.record(state)
+    return state
+
+
+def view(name, dataset, state):
+    """Per-filter-state view ``name`` (see ``analytics.aggregates.VIEWS``) of ``dataset`` at ``state``."""
+    filters = store.state_filters(state, dataset)
+    if store.has_view(name, dataset, filters):
+        return store.view(name, dataset, filters)
+    with st.spinner("Computing..."):
+        return store.view(name, dataset, filters)
+
+
+def load_data():
+    """Dataset of the latest ready snapshot (None with an error shown if there is none)."""
+    try:
+        if REFRESHER.snapshot is None:
+            with st.spinner("Loading data..."):
+                snapshot = REFRESHER.current()
+        else:
+            snapshot = REFRESHER.current()
+    except Exception as e:
+        st.error(f"❌ Error loading data: {str(e)}")
+        return None
+    if snapshot is None:
+        st.error(f"⚠️ File '{DATA_PATH}' not found! Run `python generate_data.py` to create a synthetic one.")
+        return None
+    return snapshot.dataset
+
+
+def start_refresher():
+    """Start the background refresher once per server process; its first pass pre-warms."""
+    REFRESHER.start()
+
+
+def render_freshness():
+    """Sidebar note of which data version is being served."""
+    snapshot = REFRESHER.snapshot
+    if snapshot is None:
+        return
+    profile = snapshot.dataset.profile
+    latest = f" · orders to {profile.date_max:%Y-%m-%d}" if profile.date_max is not None else ""
+    modified = snapshot.source_modified
+    st.sidebar.caption(
+        f"🕒 Data as of {modified:%Y-%m-%d %H:%M}{latest}" if modified is not None
+        else f"🕒 Data loaded {snapshot.loaded_at:%Y-%m-%d %H:%M}{latest}"
+    )
+    if REFRESHER.loading is not None:
+        st.sidebar.caption("🔄 Newer data is loading; this page switches over once it is ready.")
+    elif REFRESHER.warming is not None:
+        st.sidebar.caption("⏳ Precomputing aggregates; the first chart pages may take a moment.")
+    elif REFRESHER.failed is not None:
+        st.sidebar.caption(f"⚠️ Reloading newer data failed ({REFRESHER.failed[1]}); showing the previous version.")
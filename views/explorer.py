@@ -0,0 +1,62 @@
+"""Data Explorer page: filterable table with CSV export."""
+from datetime import datetime
+
+import streamlit as st
+
+from analytics.filters import ALL
+from views.data import page_state, view
+
+
+def render(dataset):
+    df = dataset.df if dataset is not None else None
+
+    st.title("🔍 Data Explorer")
+    st.markdown("Browse and filter your data")
+
+    if df is None:
+        st.error("❌ Data not loaded!")
+        st.stop()
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if 'category' in df.columns:
+            categories = [ALL] + sorted(df['category'].dropna().unique().tolist())
+            selected_cat = st.selectbox("Category", categories)
+        else:
+            selected_cat = ALL
+
+    with col2:
+        if 'region' in df.columns:
+            regions = [ALL] + sorted(df['region'].dropna().unique().tolist())
+            selected_region = st.selectbox("Region", regions)
+        else:
+            selected_region = ALL
+
+    with col3:
+        if 'customer_segment' in df.columns:
+            segments = [ALL] + sorted(df['customer_segment'].dropna().unique().tolist())
+            selected_segment = st.selectbox("Segment", segments)
+        else:
+            selected_segment = ALL
+
+    # Apply filters: the matching row positions come from the shared view
+    # cache ('All' selections are dropped from the state)
+    state = page_state('explorer', dataset, category=selected_cat, region=selected_region,
+                       customer_segment=selected_segment)
+    explorer_df = df.iloc[view('explorer_rows', dataset, state)]
+
+    st.info(f"📊 Displaying {len(explorer_df):,} records")
+
+    # Display data
+    st.dataframe(explorer_df, use_container_width=True, height=500)
+
+    # Download
+    csv = explorer_df.to_csv(index=False).encode('utf-8')
+    st.download_button(
+        label="📥 Download Filtered Data",
+        data=csv,
+        file_name=f'ecommerce_filtered_{datetime.now().strftime("%Y%m%d")}.csv',
+        mime='text/csv',
+    )
@@ -0,0 +1,84 @@
+"""Shared number formats for every table in the app.
+
+Tables keep their numeric dtypes and are formatted by the frontend through
+``st.column_config``, so rendering cost does not grow with a per-cell
+Python formatter the way ``DataFrame.style.format`` does.
+"""
+import streamlit as st
+
+FORMATS = {
+    'currency': '$%.2f',
+    'currency0': '$%.0f',
+    'percent': '%.2f%%',
+    'count': '%d',
+    'score': '%.2f',
+    'p_value': '%.4f',
+}
+
+# Column name -> format kind. Add new metric columns here instead of passing
+# per-table format dicts.
+COLUMN_FORMATS = {
+    # currency
+    'gross_revenue': 'currency',
+    'net_revenue': 'currency',
+    'discount_amount': 'currency',
+    'final_amount': 'currency',
+    'avg_order_value': 'currency',
+    'revenue_per_customer': 'currency',
+    'customer_lifetime_value': 'currency',
+    'monetary': 'currency',
+    'avg_monetary': 'currency',
+    'Revenue': 'currency',
+    'Spend': 'currency0',
+    'spend': 'currency0',
+    'baseline_spend': 'currency0',
+    'revenue': 'currency0',
+    'baseline_revenue': 'currency0',
+    'revenue_low': 'currency0',
+    'revenue_high': 'currency0',
+    # counts
+    'quantity': 'count',
+    'customer_id': 'count',
+    'Conversions': 'count',
+    'orders': 'count',
+    'customers': 'count',
+    'returned': 'count',
+    'frequency': 'count',
+    'conversions': 'count',
+    'baseline_conversions': 'count',
+    'conversions_low': 'count',
+    'conversions_high': 'count',
+    # percentages (values already scaled to 0-100)
+    'roi': 'percent',
+    'ROI (%)': 'percent',
+    'return_rate': 'percent',
+    'repeat_rate': 'percent',
+    'customer_share': 'percent',
+    'revenue_share': 'percent',
+    # scores
+    'retention_score': 'score',
+    'orders_per_customer': 'score',
+    'recency_days': 'score',
+    'z_score': 'score',
+    # significance tests
+    'p_value': 'p_value',
+    'p_adjusted': 'p_value',
+    'orders_a': 'count',
+    'orders_b': 'count',
+}
+
+
+def column_config(df, overrides=None):
+    """``st.column_config`` mapping for the known metric columns of ``df``."""
+    kinds = {**COLUMN_FORMATS, **(overrides or {})}
+    return {
+        col: st.column_config.NumberColumn(format=FORMATS[kinds[col]])
+        for col in df.columns
+        if col in kinds
+    }
+
+
+def show_table(df, overrides=None, **kwargs):
+    """``st.dataframe`` with the shared number formats applied."""
+    kwargs.setdefault('use_container_width', True)
+    st.dataframe(df, column_config=column_config(df, overrides), **kwargs)
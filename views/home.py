@@ -0,0 +1,389 @@
+"""Home page: hero KPIs, dataset info and key business insights."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from views.data import aggregate
+from views.formatting import show_table
+
+CORRELATION_SCALE = ['#3647F5', '#D9D9D9', '#FF9F0D']
+
+
+def _strength(r):
+    """(colour, label) of a correlation coefficient's strength."""
+    if abs(r) >= 0.7:
+        return '#2ecc71', '✅ Strong Correlation'
+    if abs(r) >= 0.4:
+        return '#ff9800', '⚠️ Moderate Correlation'
+    return '#e74c3c', '❌ Weak Correlation'
+
+
+def _render_correlations(dataset):
+    moments = aggregate('moments', dataset)
+    if moments is None:
+        st.info("💡 Correlations need a `date` column and numeric measures")
+        return
+
+    months = [month.strftime('%Y-%m') for month in moments.months]
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        channel = st.selectbox("Channel", ['All Channels'] + list(moments.channels), key="correlation_channel")
+    with col2:
+        first, last = st.select_slider("Months", months, value=(months[0], months[-1]), key="correlation_months")
+    channel_key = None if channel == 'All Channels' else channel
+    start, end = pd.Timestamp(first), pd.Timestamp(last)
+
+    key = moments.key_correlations(channel_key, start, end)
+    if not key:
+        st.info("💡 Select at least three months (or channels) to correlate")
+    else:
+        st.caption("Pearson r across month x channel cells: each cell's customers, orders "
+                   "or average unit price against its net revenue")
+        for column, (label, r) in zip(st.columns(len(key)), key.items()):
+            color, strength = _strength(r) if pd.notna(r) else ('#9aa4b2', 'Not enough variation')
+            value = f"{r:.3f}" if pd.notna(r) else "–"
+            with column:
+                st.markdown(f"""
+                    <div class='metric-card'>
+                        <div class='metric-label'>{label}</div>
+                        <div class='metric-value' style='font-size: 2rem; color: {color};'>{value}</div>
+                        <p style='color: {color}; margin: 0;'>{strength}</p>
+                    </div>
+                """, unsafe_allow_html=True)
+
+    with st.expander("🧮 Correlation Matrix of Order Measures"):
+        matrix, n_rows = moments.correlation(channel_key, start, end)
+        if n_rows < 2:
+            st.info("💡 Not enough orders in this selection")
+            return
+        fig_matrix = px.imshow(
+            matrix,
+            text_auto='.2f',
+            zmin=-1,
+            zmax=1,
+            aspect='auto',
+            color_continuous_scale=CORRELATION_SCALE,
+            title=f"Order-level Pearson r over {n_rows:,} orders - {channel}, {first} to {last}"
+        )
+        fig_matrix.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_color='#f5f5f5',
+            height=600
+        )
+        st.plotly_chart(fig_matrix, use_container_width=True)
+
+
+def render(dataset):
+    df = dataset.df if dataset is not None else None
+    profile = dataset.profile if dataset is not None else None
+
+    st.markdown("""
+        <div style='text-align: center; padding: 2rem 0;'>
+            <h1 style='font-size: 3.5rem; margin-bottom: 0;'>🛒 E-commerce Analytics Pro</h1>
+            <p style='font-size: 1.3rem; color: #00d9ff; margin-top: 0.5rem;'>
+                Advanced Business Intelligence Dashboard
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    if df is not None:
+        # Quick Stats
+        st.header("📈 Quick Overview")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        total_revenue = profile.stat('net_revenue', 'sum')
+        total_orders = profile.n_rows
+        total_customers = profile.distinct.get('customer_id', 0)
+        avg_order = profile.stat('final_amount', 'mean')
+
+        with col1:
+            st.markdown(f"""
+                <div class='metric-card'>
+                    <div class='metric-label'>💰 Total Revenue</div>
+                    <div class='metric-value'>${total_revenue:,.0f}</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+                <div class='metric-card'>
+                    <div class='metric-label'>📦 Total Orders</div>
+                    <div class='metric-value'>{total_orders:,}</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            st.markdown(f"""
+                <div class='metric-card'>
+                    <div class='metric-label'>👥 Customers</div>
+                    <div class='metric-value'>{total_customers:,}</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col4:
+            st.markdown(f"""
+                <div class='metric-card'>
+                    <div class='metric-label'>🛍️ Avg Order</div>
+                    <div class='metric-value'>${avg_order:,.2f}</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Features Section
+        st.header("🚀 Key Features")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown("""
+                ### 📊 Analytics Dashboard
+                - 15+ Interactive charts
+                - 8 Key Performance Indicators
+                - Real-time filtering
+                - Multi-dimensional analysis
+            """)
+
+        with col2:
+            st.markdown("""
+                ### 🔍 Data Explorer
+                - Advanced filtering
+                - Sortable data table
+                - Export to CSV
+                - Search capabilities
+            """)
+
+        with col3:
+            st.markdown("""
+                ### 📈 Insights
+                - Revenue trends
+                - Customer segmentation
+                - Marketing ROI
+                - Channel performance
+            """)
+
+        st.markdown("---")
+
+        # Dataset Info
+        st.header("📋 Dataset Information")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"""
+                **Records**: {profile.n_rows:,}  
+                **Columns**: {profile.n_columns}  
+                **Date Range**: {profile.date_min.strftime('%Y-%m-%d') if profile.date_min is not None else 'N/A'} 
+                to {profile.date_max.strftime('%Y-%m-%d') if profile.date_max is not None else 'N/A'}
+            """)
+
+        with col2:
+            if st.button("📋 View Column Names"):
+                st.write(df.columns.tolist())
+
+        with st.expander("👁️ Preview Data (First 10 Rows)"):
+            st.dataframe(df.head(10), use_container_width=True)
+
+        st.markdown("---")
+
+        # ========== INSIGHTS SECTION ==========
+        st.header("💡 Key Business Insights")
+
+        # Row 1: Channel Performance Overview
+        st.subheader("📌 Channel Performance Highlights")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.markdown("""
+                <div class='metric-card'>
+                    <div class='metric-label'>🏆 Highest Revenue</div>
+                    <div class='metric-value' style='font-size: 1.5rem;'>Email</div>
+                    <p style='color: #2ecc71; margin: 0;'>$2,664,421</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown("""
+                <div class='metric-card'>
+                    <div class='metric-label'>⚡ Best ROI</div>
+                    <div class='metric-value' style='font-size: 1.5rem;'>Email</div>
+                    <p style='color: #2ecc71; margin: 0;'>140.65%</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            st.markdown("""
+                <div class='metric-card'>
+                    <div class='metric-label'>👥 Most Conversions</div>
+                    <div class='metric-value' style='font-size: 1.5rem;'>Direct</div>
+                    <p style='color: #2ecc71; margin: 0;'>1,066 customers</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+        with col4:
+            st.markdown("""
+                <div class='metric-card'>
+                    <div class='metric-label'>📈 Revenue Growth</div>
+                    <div class='metric-value' style='font-size: 1.5rem;'>+8,414%</div>
+                    <p style='color: #2ecc71; margin: 0;'>Jan 2021 - 2024</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # Row 2: Customer Value & Efficiency
+        st.subheader("💰 Customer Value Analysis")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown("""
+                ### 💵 Revenue per Customer
+                - **Highest:** Email ($2,501.80)
+                - **Lowest:** Search Engine ($2,126.74)
+                - **Average:** ~$2,300
+            """)
+
+        with col2:
+            st.markdown("""
+                ### ⚡ Efficiency Ranking
+                1. **Email** - Score: 99.19 🥇
+                2. **Radio** - Score: 95.46 🥈
+                3. **Direct** - Score: 95.39 🥉
+            """)
+
+        with col3:
+            st.markdown("""
+                ### 🎯 Best Acquisition
+                - **Radio:** 84.98% rate
+                - **Email:** 82.7% rate
+                - **Social Media:** High engagement
+            """)
+
+        st.markdown("---")
+
+        # Row 3: Detailed Channel Analysis
+        st.subheader("🔍 Channel Performance Breakdown")
+
+        with st.expander("📊 View All Channels Performance"):
+            channels_data = {
+                'Channel': ['Email', 'Direct', 'Social Media', 'Outdoor', 'Print', 'Affiliate', 'Influencer', 'Mobile App', 'Referral', 'Radio', 'TV', 'Search Engine'],
+                'Spend': [18810, 19704, 20029, 20320, 18910, 18454, 19064, 18494, 18739, 18661, 18980, 19280],
+                'Revenue': [2664421.06, 2558265.78, 2542261.76, 2464162.33, 2424964.46, 2269248.63, 2355706.59, 2314844.33, 2346574.16, 2331049.15, 2381122.24, 2192672.20],
+                'Conversions': [1065, 1066, 1066, 1019, 1031, 1005, 1030, 1008, 1015, 1024, 998, 1031],
+                'ROI (%)': [140.65, 128.83, 125.93, 120.27, 127.24, 121.97, 122.57, 124.17, 124.22, 123.92, 124.45, 112.73],
+                'Performance': ['🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent', '🚀 Excellent']
+            }
+
+            channels_df = pd.DataFrame(channels_data)
+            channels_df = channels_df.sort_values('ROI (%)', ascending=False)
+
+            show_table(channels_df)
+
+        st.markdown("---")
+
+        # Row 4: Growth Metrics & Trends
+        st.subheader("📈 Growth Metrics & Trends")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+                ### 📊 Monthly Revenue Trend
+                - **Starting Point:** $16,734 (Jan 2021)
+                - **Peak Performance:** $1,563,867 (July 2023)
+                - **Current Level:** $1M+ per month
+                - **Growth Rate:** +8,414% 🚀
+
+                **Pattern:**
+                - Rapid growth phase: Mid 2021 - 2022
+                - Stabilization: 2023-2024 at high levels
+                - All channels show upward trends
+            """)
+
+        with col2:
+            st.markdown("""
+                ### 👥 Monthly Conversions Trend
+                - **Starting Point:** 13 customers (Jan 2021)
+                - **Peak Performance:** 696 customers (July 2023)
+                - **Current Level:** 500+ customers/month
+                - **Growth Rate:** +5,046% 🚀
+
+                **Key Observation:**
+                - Customer acquisition mirrors revenue growth
+                - Strong seasonality across all channels
+                - Direct channel leads in total conversions
+            """)
+
+        st.markdown("---")
+
+        # Row 5: Key Correlations (from the per-month, per-channel moments)
+        st.subheader("🔗 Key Business Correlations")
+        _render_correlations(dataset)
+
+        st.markdown("---")
+
+        # Row 6: Strategic Recommendations
+        st.subheader("💡 Strategic Recommendations")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.success("""
+                ### 🎯 Top Priorities
+
+                **1. Scale Email Marketing**
+                - Highest efficiency score (99.19)
+                - Best revenue per customer ($2,501.80)
+                - Recommendation: Increase budget by 20-30%
+
+                **2. Optimize Radio Campaigns**
+                - Best acquisition rate (84.98%)
+                - High efficiency score (95.46)
+                - Recommendation: A/B test for better conversion
+
+                **3. Strengthen Direct Channel**
+                - Most conversions (1,066 customers)
+                - Strong organic performance
+                - Recommendation: Optimize landing pages & SEO
+            """)
+
+        with col2:
+            st.warning("""
+                ### ⚠️ Areas for Improvement
+
+                **1. Search Engine Optimization**
+                - Lowest ROI (112.73%) among channels
+                - Still profitable but needs attention
+                - Recommendation: Improve ad quality scores
+
+                **2. Cost Efficiency**
+                - Outdoor has highest spend ($20,320)
+                - Recommendation: Optimize cost per acquisition
+
+                **3. Monitoring & Benchmarks**
+                - Track monthly ROI trends
+                - Monitor customer lifetime value by channel
+                - Target: ROI > 130% for all channels
+            """)
+
+        st.markdown("---")
+
+        # Row 7: Key Takeaways
+        st.info("""
+            ### ✅ Key Takeaways
+
+            - **All channels are profitable** - ROI ranges from 112.73% to 140.65%
+            - **Email dominates** in revenue, efficiency, and customer value
+            - **Explosive growth** achieved (+8,414% revenue, +5,046% conversions)
+            - **Strong fundamentals** - High correlation between customers/orders and revenue
+            - **Seasonal patterns** affect all channels equally - plan accordingly
+            - **Direct traffic** shows strong organic brand presence
+            - **Focus on top 3 performers** (Email, Radio, Direct) for maximum ROI
+        """)
+
+
+    else:
+        st.warning("⚠️ No data available. Please check the CSV file.")
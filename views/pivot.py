@@ -0,0 +1,128 @@
+"""Pivot Builder page: ad-hoc dimension x dimension breakdowns from the cube."""
+import pandas as pd
+import streamlit as st
+
+from analytics.cube import PivotTooLarge
+from views.formatting import COLUMN_FORMATS, show_table
+
+MAX_CELLS = 5_000
+MAX_FILTER_MEMBERS = 50
+
+DIMENSION_LABELS = {
+    'marketing_channel': 'Channel',
+    'marketing_campaign': 'Campaign',
+    'category': 'Category',
+    'customer_segment': 'Segment',
+    'region': 'Region',
+    'month_date': 'Month',
+    'month': 'Month of Year',
+    'quarter': 'Quarter',
+    'season': 'Season',
+}
+
+MEASURE_LABELS = {
+    'net_revenue': 'Net Revenue',
+    'gross_revenue': 'Gross Revenue',
+    'discount_amount': 'Discounts',
+    'final_amount': 'Final Amount',
+    'quantity': 'Quantity',
+    'orders': 'Orders',
+    'returned': 'Returns',
+    'avg_order_value': 'Avg Order Value',
+    'return_rate': 'Return Rate (%)',
+    'roi': 'ROI (%)',
+}
+
+
+def _member_label(value):
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m')
+    return str(value)
+
+
+def render(dataset):
+    st.title("🧮 Pivot Builder")
+    st.markdown("Combine any two dimensions and a measure - answered from pre-aggregated data")
+
+    if dataset is None or dataset.cube is None:
+        st.error("❌ Data not loaded!")
+        st.stop()
+
+    cube = dataset.cube
+    dims = [d for d in DIMENSION_LABELS if d in cube.dimensions]
+    measures = [m for m in MEASURE_LABELS if m in cube.measure_names]
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        rows = st.multiselect(
+            "Rows", dims,
+            default=[dims[0]] if dims else [],
+            max_selections=2,
+            format_func=DIMENSION_LABELS.get
+        )
+
+    with col2:
+        column = st.selectbox(
+            "Columns", [None] + [d for d in dims if d not in rows],
+            format_func=lambda d: '(none)' if d is None else DIMENSION_LABELS[d]
+        )
+
+    with col3:
+        measure = st.selectbox("Measure", measures, format_func=MEASURE_LABELS.get)
+
+    # ========== FILTERS ==========
+    filters = {}
+    with st.expander("🔍 Filters", expanded=False):
+        filter_dims = [d for d in dims if cube.cardinality(d) <= MAX_FILTER_MEMBERS]
+        filter_cols = st.columns(3)
+        for i, dim in enumerate(filter_dims):
+            with filter_cols[i % 3]:
+                members = cube.labels[dim]
+                chosen = st.multiselect(
+                    DIMENSION_LABELS[dim], list(range(len(members))),
+                    format_func=lambda i, members=members: _member_label(members[i]),
+                    key=f"pivot_filter_{dim}"
+                )
+                if chosen:
+                    filters[dim] = [members[i] for i in chosen]
+
+    if not rows:
+        st.info("💡 Choose at least one row dimension")
+        return
+
+    columns = [column] if column else []
+
+    # ========== QUERY ==========
+    try:
+        result = cube.pivot(rows, columns, measure, filters=filters, max_cells=MAX_CELLS)
+    except PivotTooLarge as e:
+        st.warning(
+            f"⚠️ This combination has {e.cells:,} cells (limit {e.max_cells:,}). "
+            f"Showing only the top members of each dimension by {MEASURE_LABELS[measure]}."
+        )
+        top_n = st.slider("Top N members per dimension", 3, 50, 10)
+        try:
+            result = cube.pivot(rows, columns, measure, filters=filters, max_cells=MAX_CELLS, top_n=top_n)
+        except PivotTooLarge as e:
+            st.error(f"❌ Still {e.cells:,} cells - lower Top N or remove a dimension.")
+            return
+
+    # ========== RESULT ==========
+    result = result.rename(columns=_member_label)
+    if isinstance(result.index, pd.MultiIndex):
+        result.index = result.index.set_levels([level.map(_member_label) for level in result.index.levels])
+    else:
+        result.index = result.index.map(_member_label)
+
+    kind = COLUMN_FORMATS.get(measure, 'score')
+    st.info(f"📊 {result.size:,} cells from {cube.n_cells:,} pre-aggregated cells")
+    show_table(result, overrides={c: kind for c in result.columns})
+
+    csv = result.to_csv().encode('utf-8')
+    st.download_button(
+        label="📥 Download Pivot",
+        data=csv,
+        file_name=f"pivot_{'_'.join(rows + columns)}_{measure}.csv",
+        mime='text/csv',
+    )
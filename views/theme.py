@@ -0,0 +1,158 @@
+"""Dark blue/green dashboard theme."""
+import streamlit as st
+
+THEME_CSS = """
+<style>
+:root {
+  --primary-blue: #1f77b4;
+  --secondary-green: #2ecc71;
+  --bg-dark: #0f1419;
+  --panel-dark: #1a1f2e;
+  --text-light: #f5f5f5;
+  --accent-cyan: #00d9ff;
+  --warning-orange: #ff9800;
+}
+
+html, body, .stApp {
+  background: linear-gradient(135deg, #0f1419 0%, #1a1f2e 100%) !important;
+  color: var(--text-light) !important;
+}
+
+h1, h2, h3, h4, h5, h6,
+.stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
+  color: var(--accent-cyan) !important;
+  text-shadow: 0 0 10px rgba(0, 217, 255, 0.3);
+  font-weight: 700 !important;
+}
+
+section[data-testid="stSidebar"] {
+  background: linear-gradient(180deg, #1a1f2e 0%, #0f1419 100%) !important;
+  border-right: 2px solid var(--primary-blue);
+}
+
+section[data-testid="stSidebar"] * {
+  color: var(--text-light) !important;
+}
+
+section[data-testid="stSidebar"] .stSelectbox label,
+section[data-testid="stSidebar"] .stDateInput label {
+  color: var(--accent-cyan) !important;
+  font-weight: 600 !important;
+}
+
+div.stButton > button {
+  background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-green) 100%) !important;
+  color: white !important;
+  border: none !important;
+  font-weight: 700 !important;
+  padding: 0.6rem 2rem !important;
+  border-radius: 8px !important;
+  box-shadow: 0 4px 15px rgba(31, 119, 180, 0.4) !important;
+  transition: all 0.3s ease !important;
+}
+
+div.stButton > button:hover {
+  transform: translateY(-2px) !important;
+  box-shadow: 0 6px 20px rgba(31, 119, 180, 0.6) !important;
+}
+
+[data-testid="stMetricValue"] {
+  color: var(--secondary-green) !important;
+  font-size: 2rem !important;
+  font-weight: 700 !important;
+}
+
+[data-testid="stMetricLabel"] {
+  color: var(--accent-cyan) !important;
+  font-weight: 600 !important;
+}
+
+div[data-testid="stExpander"] {
+  background-color: var(--panel-dark) !important;
+  border: 1px solid var(--primary-blue) !important;
+  border-radius: 10px !important;
+}
+
+.stDataFrame {
+  background-color: var(--panel-dark) !important;
+}
+
+.stTabs [data-baseweb="tab-list"] {
+  gap: 8px;
+  background-color: transparent;
+}
+
+.stTabs [data-baseweb="tab"] {
+  background-color: var(--panel-dark);
+  border-radius: 8px 8px 0 0;
+  color: var(--text-light);
+  border: 1px solid var(--primary-blue);
+  padding: 10px 20px;
+}
+
+.stTabs [aria-selected="true"] {
+  background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-green) 100%);
+  color: white;
+}
+
+.stAlert {
+  background-color: var(--panel-dark) !important;
+  border-left: 4px solid var(--accent-cyan) !important;
+}
+
+a {
+  color: var(--accent-cyan) !important;
+  text-decoration: none !important;
+}
+
+a:hover {
+  color: var(--secondary-green) !important;
+}
+
+hr {
+  border-color: var(--primary-blue) !important;
+  opacity: 0.3 !important;
+}
+
+.stDownloadButton > button {
+  background-color: var(--secondary-green) !important;
+  color: white !important;
+}
+
+.metric-card {
+  background: linear-gradient(135deg, var(--panel-dark) 0%, rgba(31, 119, 180, 0.1) 100%);
+  padding: 1.5rem;
+  border-radius: 12px;
+  border: 1px solid var(--primary-blue);
+  box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+  text-align: center;
+  margin-bottom: 1rem;
+}
+
+.metric-value {
+  font-size: 2.5rem;
+  font-weight: 700;
+  color: var(--secondary-green);
+  margin: 0.5rem 0;
+}
+
+.metric-label {
+  font-size: 1rem;
+  color: var(--accent-cyan);
+  font-weight: 600;
+}
+
+.footer {
+  text-align: center;
+  padding: 2rem;
+  color: var(--text-light);
+  opacity: 0.7;
+  border-top: 1px solid var(--primary-blue);
+  margin-top: 3rem;
+}
+</style>
+"""
+
+
+def apply_theme():
+    st.markdown(THEME_CSS, unsafe_allow_html=True)
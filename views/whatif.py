@@ -0,0 +1,112 @@
+"""Budget What-If page: per-channel spend multipliers -> projected revenue and conversions."""
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.whatif import N_RESAMPLES, WINDOW_MONTHS
+from views.data import aggregate
+from views.formatting import show_table
+
+LEVELS = [80, 90, 95]
+SLIDER_COLUMNS = 4
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _projection(fingerprint, window, multipliers, elasticity, level, months, _history):
+    return _bootstrap(fingerprint, window, _history).project(multipliers, elasticity, level, months)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _bootstrap(fingerprint, window, _history):
+    return _history.bootstrap(window, N_RESAMPLES)
+
+
+def _money(value):
+    return f"${value:,.0f}"
+
+
+def render(dataset):
+    st.title("🧪 Budget What-If")
+    st.markdown("Adjust channel budgets and see projected revenue and conversions with uncertainty bands")
+
+    if dataset is None:
+        st.error("❌ Data not loaded!")
+        st.stop()
+
+    history = aggregate('channel_history', dataset)
+    if history is None:
+        st.info("💡 The simulator needs `month_date`, `marketing_channel`, `net_revenue` and `discount_amount` columns")
+        return
+
+    st.caption(
+        "Spend is the discount amount, the cost basis of ROI throughout the app. Each channel's revenue and "
+        f"conversions per $ of spend are bootstrapped from its recent months ({N_RESAMPLES:,} resamples)."
+    )
+
+    # ========== ASSUMPTIONS ==========
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        window = st.slider("History (months)", 3, len(history.months), min(WINDOW_MONTHS, len(history.months)),
+                           key="whatif_window") if len(history.months) > 3 else len(history.months)
+    with col2:
+        months = st.slider("Horizon (months)", 1, 12, 3, key="whatif_horizon")
+    with col3:
+        elasticity = st.slider(
+            "Spend elasticity", 0.2, 1.0, 1.0, 0.05, key="whatif_elasticity",
+            help="1.0 keeps each channel's ROI constant; lower values model diminishing returns"
+        )
+    with col4:
+        level = st.selectbox("Band", LEVELS, format_func=lambda level: f"{level}% interval", key="whatif_level")
+
+    # ========== BUDGET SLIDERS ==========
+    st.subheader("🎚️ Budget Change by Channel")
+    changes = []
+    for start in range(0, len(history.channels), SLIDER_COLUMNS):
+        for column, channel in zip(st.columns(SLIDER_COLUMNS), history.channels[start:start + SLIDER_COLUMNS]):
+            with column:
+                changes.append(st.slider(f"{channel} (%)", -100, 100, 0, 5, key=f"whatif_{channel}"))
+    multipliers = tuple(1 + np.array(changes) / 100)
+
+    projection = _projection(dataset.fingerprint, window, multipliers, elasticity, level, months, history)
+    totals = projection.totals
+
+    # ========== TOTALS ==========
+    st.subheader(f"📈 Projected Next {months} Month(s)")
+    col1, col2, col3 = st.columns(3)
+    for column, name, label, fmt in [
+        (col1, 'revenue', "💰 Revenue", _money),
+        (col2, 'conversions', "👥 Conversions", lambda v: f"{v:,.0f}"),
+        (col3, 'spend', "💸 Spend", _money),
+    ]:
+        baseline, mean, low, high = totals[name]
+        with column:
+            change = (mean - baseline) / baseline * 100 if baseline else None
+            st.metric(label, fmt(mean), delta=None if change is None else f"{change:+.1f}%")
+            if name != 'spend':
+                st.caption(f"{level}% band: {fmt(low)} – {fmt(high)}")
+
+    # ========== PER CHANNEL ==========
+    table = projection.channels
+    fig_channels = go.Figure([
+        go.Bar(name='Baseline', x=table['channel'], y=table['baseline_revenue'], marker_color='#D9D9D9'),
+        go.Bar(
+            name='Scenario', x=table['channel'], y=table['revenue'], marker_color='#3647F5',
+            error_y=dict(type='data', symmetric=False, color='#FF9F0D',
+                         array=table['revenue_high'] - table['revenue'],
+                         arrayminus=table['revenue'] - table['revenue_low'])
+        ),
+    ])
+    fig_channels.update_layout(
+        barmode='group',
+        title=f"Projected Revenue by Channel ({level}% band)",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#f5f5f5',
+        height=500,
+        xaxis_title="Marketing Channel",
+        yaxis_title="Revenue ($)",
+        xaxis=dict(tickangle=45)
+    )
+    st.plotly_chart(fig_channels, use_container_width=True)
+
+    show_table(table, hide_index=True)
@@ -0,0 +1,102 @@
+"""Pre-build the on-disk cache so the first visitor after a deploy skips the cold load.
+
+Loads the orders (``ECOMMERCE_DATA`` or ``--data``), builds the dataset and
+every aggregate in ``analytics.aggregates`` and stores them under the
+current source fingerprint and code version. Entries that are already
+cached are left alone. Run it after new data lands or after a deploy.
+
+It then reads the access log the pages write (``analytics.access_log``)
+and precomputes the per-filter-state views of the ``--top-k`` most viewed
+states, reporting the hit rate of the logged views before and after.
+
+Usage:
+    python warm_cache.py
+    python warm_cache.py --data exports/ --cache-dir /var/cache/ecommerce --max-mb 8192
+    python warm_cache.py --top-k 50 --access-log /var/log/ecommerce/access.log
+    python warm_cache.py --clear
+"""
+import argparse
+import sys
+import time
+
+from analytics.access_log import ACCESS_LOG_PATH, WARM_TOP_K, AccessLog, hit_rate
+from analytics.aggregates import AGGREGATES, PAGE_VIEWS, VIEWS, view_name
+from analytics.dataset import DATA_PATH, build_dataset, file_fingerprint, load_orders, source_keys
+from analytics.disk_cache import CACHE_DIR, CACHE_MAX_BYTES, DiskCache
+from analytics.store import is_cached, state_filters
+
+
+def warm(cache, source):
+    fingerprint = file_fingerprint(source)
+    sources = source_keys(source)
+
+    def build():
+        df, shards, validation = load_orders(source)
+        return build_dataset(df, fingerprint, shards, validation, sources)
+
+    def timed(name, compute):
+        started = time.perf_counter()
+        hits = cache.hits
+        value = cache.cached(name, fingerprint, compute)
+        state = 'cached' if cache.hits > hits else 'built'
+        print(f"  {name:<14} {state:<7} {time.perf_counter() - started:6.2f}s")
+        return value
+
+    dataset = timed('dataset', build)
+    for name, builder in AGGREGATES.items():
+        timed(name, lambda: builder(dataset))
+    return dataset
+
+
+def warm_views(cache, dataset, access_log, top_k):
+    counts = access_log.counts()
+    if not counts:
+        print(f"  no views logged in {access_log.path} yet")
+        return
+
+    def cached(state):
+        return is_cached(state, dataset, cache)
+
+    before = hit_rate(counts, cached)
+    for state, views in counts.most_common(top_k):
+        filters = state_filters(state, dataset)
+        started = time.perf_counter()
+        for name in PAGE_VIEWS.get(state.page, ()):
+            cache.cached(view_name(name, filters), dataset.fingerprint, lambda: VIEWS[name](dataset, **filters))
+        print(f"  {views:>7,} views  {time.perf_counter() - started:6.2f}s  {state.describe()}")
+    after = hit_rate(counts, cached)
+    print(f"  hit rate {before:.1%} -> {after:.1%} of {sum(counts.values()):,} logged views "
+          f"({min(top_k, len(counts))} of {len(counts)} states warmed)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-build the on-disk dataset and aggregate cache")
+    parser.add_argument('--data', default=DATA_PATH, help="orders file, shard directory or glob")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--max-mb', type=float, default=CACHE_MAX_BYTES / 1024 / 1024)
+    parser.add_argument('--access-log', default=ACCESS_LOG_PATH, help="access log written by the pages")
+    parser.add_argument('--top-k', type=int, default=WARM_TOP_K, help="most viewed filter states to precompute")
+    parser.add_argument('--clear', action='store_true', help="delete every cached entry and exit")
+    args = parser.parse_args(argv)
+
+    cache = DiskCache(args.cache_dir, int(args.max_mb * 1024 * 1024))
+    if args.clear:
+        cache.clear()
+        print(f"🧹 Cleared {args.cache_dir}")
+        return
+
+    if file_fingerprint(args.data) is None:
+        sys.exit(f"❌ No orders found at {args.data!r} (a CSV / Parquet file, shard directory or glob)")
+    print(f"🔥 Warming {args.cache_dir} from {args.data} (code version {cache.version})")
+    started = time.perf_counter()
+    dataset = warm(cache, args.data)
+    if dataset is not None:
+        print("🔥 Most viewed filter states")
+        warm_views(cache, dataset, AccessLog(args.access_log), args.top_k)
+    entries = cache.entries()
+    size_mb = sum(size for _, size, _ in entries) / 1024 / 1024
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s ({len(entries)} entries, {size_mb:,.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()